@@ -1,5 +1,4 @@
 from typing import Annotated
-from src.auth.utils.logging import logging
 from fastapi import APIRouter, status, Depends
 from src.auth.utils.request_format import AddEmail
 from src.auth.schema.response import ResponseDefault
@@ -15,9 +14,6 @@ from src.auth.routers.exceptions import (
 from src.auth.utils.database.general import (
     is_using_registered_email,
     update_user_email,
-    extract_data_otp,
-    save_otp_data,
-    local_time,
 )
 
 router = APIRouter(tags=["account-verification"], prefix="/add")
@@ -29,7 +25,6 @@ async def add_email_endpoint(
 ) -> ResponseDefault:
     response = ResponseDefault()
     registered_email = await is_using_registered_email(email=schema.email)
-    initial_data = await extract_data_otp(user_uuid=current_user.user_uuid)
 
     try:
         if registered_email:
@@ -52,15 +47,6 @@ async def add_email_endpoint(
             user_uuid=current_user.user_uuid, email=schema.email, verified_email=False
         )
 
-        if not initial_data:
-            logging.info("Initialized OTP save data.")
-            await save_otp_data(
-                user_uuid=current_user.user_uuid,
-                current_api_hit=1,
-                saved_by_system=True,
-                save_to_hit_at=local_time(),
-            )
-
         response.success = True
         response.message = "Success add new email."
 
@@ -44,7 +44,7 @@ async def change_full_name_endpoint(
             except FinanceTrackerApiError as FE:
                 raise FE
             except Exception as E:
-                logging.error(f"Error while change user full name: {E}.")
+                logging.error("Error while change user full name: %s.", E)
                 await session.rollback()
                 raise DatabaseError(detail=f"Database error: {E}.")
             finally:
@@ -11,12 +11,10 @@ from src.auth.routers.exceptions import (
     ServiceError,
     FinanceTrackerApiError,
 )
+from src.auth.utils.ephemeral.general import update_otp_data
 from src.auth.utils.database.general import (
-    local_time,
     is_using_registered_phone_number,
     update_user_phone_number,
-    save_otp_data,
-    extract_data_otp,
 )
 
 router = APIRouter(tags=["account-verification"], prefix="/change")
@@ -32,7 +30,6 @@ async def change_phone_number_endpoint(
     registered_phone_number = await is_using_registered_phone_number(
         phone_number=validated_phone_number
     )
-    initial_data = await extract_data_otp(user_uuid=current_user.user_uuid)
 
     try:
         if validated_phone_number == current_user.phone_number:
@@ -48,14 +45,8 @@ async def change_phone_number_endpoint(
             user_uuid=current_user.user_uuid, phone_number=validated_phone_number
         )
 
-        if not initial_data:
-            logging.info("Initialized OTP save data.")
-            await save_otp_data(
-                user_uuid=current_user.user_uuid,
-                current_api_hit=1,
-                saved_by_system=True,
-                save_to_hit_at=local_time(),
-            )
+        logging.info("Expired OTP sent to the previous phone number.")
+        await update_otp_data(user_uuid=current_user.user_uuid)
 
         response.success = True
         response.message = "Update phone number success."
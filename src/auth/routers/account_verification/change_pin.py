@@ -1,15 +1,15 @@
-import httpx
 from typing import Annotated
-from src.secret import LOCAL_WHATSAPP_API
 from src.auth.utils.logging import logging
+from src.auth.utils.whatsapp.general import send_whatsapp_message
+from src.auth.utils.notification.general import render_message
 from fastapi import APIRouter, status, Depends
 from src.auth.utils.validator import check_pin
 from src.auth.schema.response import ResponseDefault
-from src.database.models import users, blacklist_tokens
+from src.database.models import users
 from src.database.connection import database_connection
-from src.auth.utils.forgot_password.general import send_gmail
+from src.auth.utils.outbox.general import enqueue_email, notify_email_outbox
 from src.auth.utils.request_format import ChangePin, SendOTPPayload
-from src.auth.utils.database.general import local_time, extract_tokens
+from src.auth.utils.database.general import local_time, revoke_sessions_query
 from src.auth.utils.jwt.general import get_current_user, verify_pin, get_password_hash
 from src.auth.routers.exceptions import (
     EntityForceInputSameDataError,
@@ -53,7 +53,6 @@ async def change_pin_endpoint(
             )
 
         hashed_pin = await get_password_hash(password=schema.change_pin)
-        token_data = await extract_tokens(user_uuid=current_user.user_uuid)
 
         async with database_connection().connect() as session:
             try:
@@ -63,20 +62,29 @@ async def change_pin_endpoint(
                     .values(updated_at=local_time(), pin=hashed_pin)
                 )
 
-                blacklist_current_token = blacklist_tokens.insert().values(
-                    blacklisted_at=local_time(),
-                    user_uuid=current_user.user_uuid,
-                    access_token=token_data.access_token,
-                    refresh_token=token_data.refresh_token,
+                await session.execute(
+                    revoke_sessions_query(user_uuid=current_user.user_uuid)
                 )
-                await session.execute(blacklist_current_token)
                 await session.execute(query)
+                if current_user.verified_email:
+                    email = render_message(
+                        name="pin_changed",
+                        channel="email",
+                        full_name=current_user.full_name,
+                        phone_number=current_user.phone_number,
+                    )
+                    await enqueue_email(
+                        session=session,
+                        email_subject=email.subject,
+                        email_receiver=current_user.email,
+                        email_body=email.body,
+                    )
                 await session.commit()
-                logging.info("Success changed user pin and blacklisted current token.")
+                logging.info("Success changed user pin and revoked user sessions.")
             except FinanceTrackerApiError as FE:
                 raise FE
             except Exception as E:
-                logging.error(f"Error while change_pin_endpoint: {E}.")
+                logging.error("Error while change_pin_endpoint: %s.", E)
                 await session.rollback()
                 raise DatabaseError(
                     detail=f"Database error: {E}.",
@@ -86,24 +94,7 @@ async def change_pin_endpoint(
 
         if current_user.verified_email:
             logging.info("Account update information sent into email.")
-            email_body = (
-                f"Dear {current_user.full_name},<br><br>"
-                f"We are pleased to inform you that your new account has been successfully updated pin.<br><br>"
-                f"You can now log in using the following credentials:<br><br>"
-                f"Phone Number: <strong>{current_user.phone_number}</strong><br>"
-                f"PIN: <strong>{confirmed_pin}</strong><br><br>"
-                f"Please ensure that you keep your account information secure.<br><br>"
-                f"Thank you.<br><br>"
-                f"Best regards,<br>"
-                f"<strong>Support Team</strong>"
-            )
-
-            await send_gmail(
-                email_subject="Success Updated New Pin!",
-                email_receiver=current_user.email,
-                email_body=email_body,
-            )
-
+            notify_email_outbox()
             response.success = True
             response.message = "User successfully changed pin. Account information already sent into email."
 
@@ -111,27 +102,16 @@ async def change_pin_endpoint(
             logging.info("Account update information sent into phone number.")
             payload = SendOTPPayload(
                 phoneNumber=current_user.phone_number,
-                message=(
-                    f"Dear *{current_user.full_name}*,\n\n"
-                    f"We are pleased to inform you that your pin has been successfully changed. "
-                    f"You can now log in using the following credentials:\n\n"
-                    f"Phone Number: *{current_user.phone_number}*\n"
-                    f"PIN: *{confirmed_pin}*\n\n"
-                    f"Please ensure that you keep your account information secure.\n\n"
-                    f"Best Regards,\n"
-                    f"*Support Team*"
-                ),
+                message=render_message(
+                    name="pin_changed",
+                    channel="whatsapp",
+                    full_name=current_user.full_name,
+                    phone_number=current_user.phone_number,
+                    pin=confirmed_pin,
+                ).body,
             )
 
-            async with httpx.AsyncClient() as client:
-                whatsapp_response = await client.post(
-                    LOCAL_WHATSAPP_API, json=dict(payload)
-                )
-
-            if whatsapp_response.status_code != 200:
-                raise ServiceError(
-                    detail="Failed to send OTP via WhatsApp.", name="Whatsapp API"
-                )
+            await send_whatsapp_message(payload=payload)
 
             response.success = True
             response.message = "User successfully changed pin. Account information already sent into phone number."
@@ -11,13 +11,10 @@ from src.auth.routers.exceptions import (
     FinanceTrackerApiError,
     MandatoryInputError,
 )
+from src.auth.utils.ephemeral.general import update_otp_data
 from src.auth.utils.database.general import (
     is_using_registered_email,
     update_user_email,
-    extract_data_otp,
-    save_otp_data,
-    local_time,
-    update_otp_data,
 )
 
 router = APIRouter(tags=["account-verification"], prefix="/change")
@@ -29,7 +26,6 @@ async def change_email_verified_endpoint(
 ) -> ResponseDefault:
     response = ResponseDefault()
     registered_email = await is_using_registered_email(email=schema.email)
-    initial_data = await extract_data_otp(user_uuid=current_user.user_uuid)
 
     try:
         if not current_user.email:
@@ -51,18 +47,8 @@ async def change_email_verified_endpoint(
             user_uuid=current_user.user_uuid, email=schema.email, verified_email=False
         )
 
-        if initial_data.current_api_hit != 1:
-            logging.info("Re-initialized OTP save data.")
-            await update_otp_data(user_uuid=current_user.user_uuid)
-
-        if not initial_data:
-            logging.info("Initialized OTP save data.")
-            await save_otp_data(
-                user_uuid=current_user.user_uuid,
-                current_api_hit=1,
-                saved_by_system=True,
-                save_to_hit_at=local_time(),
-            )
+        logging.info("Expired OTP sent to the previous email.")
+        await update_otp_data(user_uuid=current_user.user_uuid)
 
         response.success = True
         response.message = "Success update user email."
@@ -1,5 +1,3 @@
-from pytz import timezone
-from datetime import datetime
 from typing import Annotated
 from src.auth.utils.logging import logging
 from fastapi import APIRouter, status, Depends
@@ -12,13 +10,9 @@ from src.auth.routers.exceptions import (
     FinanceTrackerApiError,
     EntityAlreadyVerifiedError,
     MandatoryInputError,
-    EntityDoesNotExistError,
-    InvalidOperationError,
-)
-from src.auth.utils.database.general import (
-    extract_data_otp,
-    update_verify_email_status,
 )
+from src.auth.utils.otp.general import verify_otp
+from src.auth.utils.database.general import update_verify_email_status
 
 router = APIRouter(tags=["account-verification"], prefix="/verify")
 
@@ -30,13 +24,6 @@ async def verify_email_endpoint(
     response = ResponseDefault()
 
     try:
-        initials_account = await extract_data_otp(user_uuid=current_user.user_uuid)
-        now_utc = datetime.now(timezone("UTC"))
-
-        if not initials_account:
-            logging.info("OTP data not found.")
-            raise EntityDoesNotExistError(detail="Data not found.")
-
         if not current_user.email:
             logging.info("User is not input email yet.")
             raise MandatoryInputError(detail="User should add email first.")
@@ -46,21 +33,17 @@ async def verify_email_endpoint(
             raise EntityAlreadyVerifiedError(detail="User email already verified.")
 
         await check_otp(otp=schema.otp)
+        await verify_otp(
+            user_uuid=current_user.user_uuid,
+            channel="email",
+            destination=current_user.email,
+            otp=schema.otp,
+        )
 
-        if now_utc > initials_account.blacklisted_at:
-            raise InvalidOperationError(detail="OTP already expired.")
-
-        if initials_account.otp_number != schema.otp:
-            raise InvalidOperationError(detail="Invalid OTP code.")
-
-        if (
-            now_utc < initials_account.blacklisted_at
-            and initials_account.otp_number == schema.otp
-        ):
-            await update_verify_email_status(user_uuid=current_user.user_uuid)
+        await update_verify_email_status(user_uuid=current_user.user_uuid)
 
-            response.success = True
-            response.message = "User email verified."
+        response.success = True
+        response.message = "User email verified."
 
     except FinanceTrackerApiError as FTE:
         raise FTE
@@ -1,5 +1,3 @@
-from pytz import timezone
-from datetime import datetime
 from fastapi import APIRouter, status
 from src.auth.utils.logging import logging
 from src.auth.utils.jwt.general import get_user
@@ -11,12 +9,9 @@ from src.auth.routers.exceptions import (
     FinanceTrackerApiError,
     EntityAlreadyVerifiedError,
     EntityDoesNotExistError,
-    InvalidOperationError,
-)
-from src.auth.utils.database.general import (
-    extract_data_otp,
-    update_phone_number_status,
 )
+from src.auth.utils.otp.general import verify_otp
+from src.auth.utils.database.general import update_phone_number_status
 
 router = APIRouter(tags=["account-verification"], prefix="/verify")
 
@@ -28,15 +23,11 @@ async def verify_phone_number_endpoint(
     await check_uuid(unique_id=unique_id)
 
     try:
-        initials_account = await extract_data_otp(user_uuid=unique_id)
-        now_utc = datetime.now(timezone("UTC"))
+        account = await get_user(unique_id=unique_id)
 
-        if not initials_account:
-            logging.info("OTP data not found.")
+        if not account:
             raise EntityDoesNotExistError(detail="Data not found.")
 
-        account = await get_user(unique_id=unique_id)
-
         if account.verified_phone_number:
             logging.info("User phone number already verified.")
             raise EntityAlreadyVerifiedError(
@@ -45,22 +36,18 @@ async def verify_phone_number_endpoint(
 
         logging.info("User phone number not verified.")
         await check_otp(otp=schema.otp)
-
-        if now_utc > initials_account.blacklisted_at:
-            raise InvalidOperationError(detail="OTP already expired.")
-
-        if initials_account.otp_number != schema.otp:
-            raise InvalidOperationError(detail="Invalid OTP code.")
-
-        if (
-            now_utc < initials_account.blacklisted_at
-            and initials_account.otp_number == schema.otp
-        ):
-            await update_phone_number_status(user_uuid=unique_id)
-
-            response.success = True
-            response.message = "User phone number verified."
-            response.data = UniqueID(unique_id=unique_id)
+        await verify_otp(
+            user_uuid=unique_id,
+            channel="phone_number",
+            destination=account.phone_number,
+            otp=schema.otp,
+        )
+
+        await update_phone_number_status(user_uuid=unique_id)
+
+        response.success = True
+        response.message = "User phone number verified."
+        response.data = UniqueID(unique_id=unique_id)
 
     except FinanceTrackerApiError as FTE:
         raise FTE
@@ -1,20 +1,13 @@
-from datetime import timedelta
 from typing import Annotated
 from fastapi import APIRouter, status, Depends
 from src.auth.schema.response import ResponseToken
 from fastapi.security import OAuth2PasswordRequestForm
-from src.auth.utils.database.general import save_tokens
-from src.secret import ACCESS_TOKEN_EXPIRED, REFRESH_TOKEN_EXPIRED
 from src.auth.routers.exceptions import (
     ServiceError,
     FinanceTrackerApiError,
     AuthenticationFailed,
 )
-from src.auth.utils.jwt.general import (
-    authenticate_user,
-    create_access_token,
-    create_refresh_token,
-)
+from src.auth.utils.jwt.general import authenticate_user, start_session
 
 router = APIRouter(tags=["authorizations"], prefix="/auth")
 
@@ -29,19 +22,8 @@ async def access_token(
         if user_in_db is None:
             raise AuthenticationFailed(detail="User could not be validated.")
 
-        access_token = await create_access_token(
-            data={"sub": user_in_db.user_uuid},
-            access_token_expires=timedelta(minutes=int(ACCESS_TOKEN_EXPIRED)),
-        )
-
-        refresh_token = await create_refresh_token(
-            data={"sub": user_in_db.user_uuid},
-            refresh_token_expires=timedelta(minutes=int(REFRESH_TOKEN_EXPIRED)),
-        )
-        await save_tokens(
-            user_uuid=user_in_db.user_uuid,
-            access_token=access_token,
-            refresh_token=refresh_token,
+        access_token, refresh_token = await start_session(
+            user_uuid=user_in_db.user_uuid
         )
 
         response.refresh_token = refresh_token
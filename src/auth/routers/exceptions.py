@@ -85,3 +85,9 @@ class InvalidTokenError(FinanceTrackerApiError):
     """invalid token"""
 
     pass
+
+
+class ServiceUnavailableError(FinanceTrackerApiError):
+    """external channel is failing, requests are rejected until it recovers."""
+
+    pass
@@ -1,4 +1,3 @@
-from datetime import timedelta
 from uuid_extensions import uuid7
 from fastapi import APIRouter, status
 from starlette.requests import Request
@@ -7,19 +6,10 @@ from src.auth.utils.validator import check_fullname
 from src.auth.utils.generator import generate_full_name
 from authlib.integrations.starlette_client import OAuthError
 from src.auth.utils.sso.general import google_oauth_configuration
-from src.secret import ACCESS_TOKEN_EXPIRED, REFRESH_TOKEN_EXPIRED
 from src.auth.schema.response import ResponseDefault, UniqueID, ResponseToken
 from src.auth.routers.exceptions import ServiceError, FinanceTrackerApiError
-from src.auth.utils.database.general import (
-    save_google_sso_account,
-    save_otp_data,
-    local_time,
-)
-from src.auth.utils.jwt.general import (
-    get_user,
-    create_access_token,
-    create_refresh_token,
-)
+from src.auth.utils.database.general import save_google_sso_account
+from src.auth.utils.jwt.general import get_user, start_session
 
 
 router = APIRouter(tags=["google-sso"], prefix="/google")
@@ -53,14 +43,6 @@ async def google_sso_auth_endpoint(request: Request) -> ResponseToken | Response
                     full_name=validated_fullname,
                 )
 
-                logging.info("Initialized OTP save data.")
-                await save_otp_data(
-                    user_uuid=register_account_uuid,
-                    current_api_hit=1,
-                    saved_by_system=True,
-                    save_to_hit_at=local_time(),
-                )
-
                 response = ResponseDefault(
                     success=True,
                     message="Sucess registered new user via google sso.",
@@ -89,13 +71,8 @@ async def google_sso_auth_endpoint(request: Request) -> ResponseToken | Response
             if registered_account.pin:
                 logging.info("User already created and verified.")
 
-                access_token = await create_access_token(
-                    data={"sub": registered_account.user_uuid},
-                    access_token_expires=timedelta(minutes=int(ACCESS_TOKEN_EXPIRED)),
-                )
-                refresh_token = await create_refresh_token(
-                    data={"sub": registered_account.user_uuid},
-                    refresh_token_expires=timedelta(minutes=int(REFRESH_TOKEN_EXPIRED)),
+                access_token, refresh_token = await start_session(
+                    user_uuid=registered_account.user_uuid
                 )
                 response = ResponseToken(
                     access_token=access_token, refresh_token=refresh_token
@@ -112,7 +89,7 @@ async def google_sso_auth_endpoint(request: Request) -> ResponseToken | Response
         raise FTE
 
     except OAuthError as OauthErr:
-        logging.error(f"Oauth error in google_sso_auth: {OauthErr}.")
+        logging.error("Oauth error in google_sso_auth: %s.", OauthErr)
         raise ServiceError(
             detail="SSO error, please perform relogin.",
         )
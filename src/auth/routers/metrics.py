@@ -0,0 +1,50 @@
+import hmac
+from typing import Annotated
+from src.secret import METRICS_TOKEN
+from src.auth.utils.logging import logging
+from fastapi import APIRouter, Depends, status
+from src.auth.schema.response import ResponseDefault
+from src.auth.utils.metrics.general import collect_metrics
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from src.auth.routers.exceptions import AuthenticationFailed, EntityDoesNotExistError
+
+router = APIRouter(tags=["root"])
+metrics_bearer = HTTPBearer(auto_error=False)
+
+
+async def verify_metrics_token(
+    credentials: Annotated[
+        HTTPAuthorizationCredentials | None, Depends(metrics_bearer)
+    ],
+) -> None:
+    if not METRICS_TOKEN:
+        raise EntityDoesNotExistError(detail="Metrics are disabled.")
+
+    if credentials is None or not hmac.compare_digest(
+        credentials.credentials.encode(), METRICS_TOKEN.encode()
+    ):
+        raise AuthenticationFailed(detail="Invalid metrics token.")
+
+
+async def metrics() -> ResponseDefault:
+    """
+    Counters of the in-process caches and pools of this worker. Send
+    **METRICS_TOKEN** as a bearer token; the endpoint is disabled while it
+    is not set.
+    """
+
+    logging.info("Endpoint metrics.")
+    return ResponseDefault(
+        success=True, message="Get metrics success.", data=collect_metrics()
+    )
+
+
+router.add_api_route(
+    methods=["GET"],
+    path="/metrics",
+    response_model=ResponseDefault,
+    endpoint=metrics,
+    dependencies=[Depends(verify_metrics_token)],
+    summary="In-process metrics of this worker.",
+    status_code=status.HTTP_200_OK,
+)
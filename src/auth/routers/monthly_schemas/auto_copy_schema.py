@@ -0,0 +1,94 @@
+from typing import Annotated
+from src.auth.utils.logging import logging
+from fastapi import APIRouter, status, Depends
+from sqlalchemy.dialects.postgresql import insert
+from src.database.models import schema_auto_copies
+from src.auth.schema.response import ResponseDefault
+from src.auth.utils.jwt.general import get_current_user
+from src.database.connection import database_connection
+from src.auth.utils.request_format import AutoCopySchema
+from src.auth.utils.database.general import local_time
+from src.auth.routers.exceptions import (
+    ServiceError,
+    DatabaseError,
+    FinanceTrackerApiError,
+)
+
+router = APIRouter(tags=["money-schemas"])
+
+
+async def auto_copy_schema(
+    schema: AutoCopySchema,
+    current_user: Annotated[dict, Depends(get_current_user)],
+) -> ResponseDefault:
+    """
+    Turn automatic monthly schema copy on or off:
+
+    - **enabled**: When true, every category of the previous month is copied into the new month at the start of each month.
+    - **budget_percentage**: Percentage applied to every copied budget. Defaults to 100.
+    """
+
+    response = ResponseDefault()
+
+    try:
+        logging.info("Endpoint auto copy schema.")
+        async with database_connection().connect() as session:
+            try:
+                if schema.enabled:
+                    query = (
+                        insert(schema_auto_copies)
+                        .values(
+                            created_at=local_time(),
+                            user_uuid=current_user.user_uuid,
+                            budget_percentage=schema.budget_percentage,
+                        )
+                        .on_conflict_do_update(
+                            index_elements=[schema_auto_copies.c.user_uuid],
+                            set_={
+                                "updated_at": local_time(),
+                                "budget_percentage": schema.budget_percentage,
+                            },
+                        )
+                    )
+                else:
+                    query = schema_auto_copies.delete().where(
+                        schema_auto_copies.c.user_uuid == current_user.user_uuid
+                    )
+                await session.execute(query)
+                await session.commit()
+                logging.info(
+                    "User %s set auto copy schema into %s.",
+                    current_user.full_name,
+                    schema.enabled,
+                )
+                response.message = (
+                    "Auto copy schema enabled."
+                    if schema.enabled
+                    else "Auto copy schema disabled."
+                )
+                response.success = True
+            except Exception as E:
+                logging.error("Error during setting auto copy schema: %s.", E)
+                await session.rollback()
+                raise DatabaseError(
+                    detail=f"Database error: {E}.",
+                )
+            finally:
+                await session.close()
+    except FinanceTrackerApiError as FTE:
+        raise FTE
+
+    except Exception as E:
+        raise ServiceError(detail=f"Service error: {E}.", name="Finance Tracker")
+
+    return response
+
+
+router.add_api_route(
+    methods=["PATCH"],
+    path="/auto-copy-schema",
+    response_model=ResponseDefault,
+    endpoint=auto_copy_schema,
+    status_code=status.HTTP_200_OK,
+    summary="Enable or disable monthly schema copy at month rollover.",
+)
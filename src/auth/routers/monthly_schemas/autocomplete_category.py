@@ -0,0 +1,50 @@
+from typing import Annotated
+from src.auth.utils.logging import logging
+from src.auth.schema.response import ResponseDefault
+from fastapi import APIRouter, status, Depends, Query
+from src.auth.utils.jwt.general import get_current_user
+from src.auth.utils.autocomplete.general import category_autocomplete
+from src.auth.routers.exceptions import ServiceError, FinanceTrackerApiError
+
+router = APIRouter(tags=["money-schemas"])
+
+
+async def autocomplete_category(
+    current_user: Annotated[dict, Depends(get_current_user)],
+    prefix: str = Query(default="", max_length=255),
+    limit: int = Query(default=10, ge=1, le=50),
+) -> ResponseDefault:
+    """
+    Suggest category names already used by the account:
+
+    - **prefix**: The beginning of the category name typed by the user. Matching is case-insensitive. Leave empty to list categories alphabetically.
+    - **limit**: Maximum number of suggestions returned.
+    """
+
+    response = ResponseDefault()
+
+    try:
+        logging.info("Endpoint autocomplete category.")
+        suggestions = await category_autocomplete.suggest(
+            user_uuid=current_user.user_uuid, prefix=prefix, limit=limit
+        )
+        response.message = "Get category suggestions success."
+        response.data = suggestions
+        response.success = True
+    except FinanceTrackerApiError as FTE:
+        raise FTE
+
+    except Exception as E:
+        raise ServiceError(detail=f"Service error: {E}.", name="Finance Tracker")
+
+    return response
+
+
+router.add_api_route(
+    methods=["GET"],
+    path="/autocomplete-category",
+    response_model=ResponseDefault,
+    endpoint=autocomplete_category,
+    status_code=status.HTTP_200_OK,
+    summary="Suggest saved category names by prefix.",
+)
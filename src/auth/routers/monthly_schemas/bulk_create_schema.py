@@ -0,0 +1,135 @@
+from typing import Annotated
+from src.auth.utils.logging import logging
+from fastapi import APIRouter, status, Depends
+from src.database.models import money_spend_schemas
+from src.auth.schema.response import ResponseDefault
+from src.auth.utils.jwt.general import get_current_user
+from src.database.connection import database_connection
+from src.auth.utils.request_format import BulkMoneySpendSchema
+from src.auth.utils.autocomplete.general import category_autocomplete
+from src.auth.utils.database.general import (
+    extract_month_schemas,
+    bump_month_versions,
+    month_schemas_query,
+)
+from src.auth.routers.exceptions import (
+    EntityAlreadyExistError,
+    ServiceError,
+    DatabaseError,
+    FinanceTrackerApiError,
+    InvalidOperationError,
+)
+
+router = APIRouter(tags=["money-schemas"])
+
+
+async def bulk_create_schema(
+    schema: BulkMoneySpendSchema,
+    current_user: Annotated[dict, Depends(get_current_user)],
+) -> ResponseDefault:
+    """
+    Create many categories of a month in one request:
+
+    - **month**: This refers to the specific calendar month (e.g., January, February) when the schema was created or applies to.
+    - **year**: This represents the calendar year (e.g., 2023, 2024) associated with the schema.
+    - **categories**: List of **category** and **budget** pairs to create. Categories already saved in the month are skipped and reported back.
+    """
+
+    response = ResponseDefault()
+    categories = {item.category: item.budget for item in schema.categories}
+
+    if len(categories) != len(schema.categories):
+        raise InvalidOperationError(detail="Category should be unique per request.")
+
+    try:
+        logging.info("Endpoint bulk create category.")
+        async with database_connection().connect() as session:
+            try:
+                saved_categories = await extract_month_schemas(
+                    session=session,
+                    user_uuid=current_user.user_uuid,
+                    month=schema.month,
+                    year=schema.year,
+                )
+                new_categories = {
+                    category: budget
+                    for category, budget in categories.items()
+                    if category not in saved_categories
+                }
+
+                if not new_categories:
+                    raise EntityAlreadyExistError(
+                        detail="All categories already saved.",
+                    )
+
+                query = (
+                    month_schemas_query(
+                        user_uuid=current_user.user_uuid,
+                        month=schema.month,
+                        year=schema.year,
+                        categories=new_categories,
+                    )
+                    .on_conflict_do_nothing(
+                        index_elements=["user_uuid", "year", "month", "category"]
+                    )
+                    .returning(money_spend_schemas.c.category)
+                )
+                result = await session.execute(query)
+                created_categories = result.scalars().all()
+                if created_categories:
+                    await bump_month_versions(
+                        session=session,
+                        user_uuid=current_user.user_uuid,
+                        periods=[(schema.month, schema.year)],
+                    )
+                await session.commit()
+
+                for category in created_categories:
+                    category_autocomplete.add_category(
+                        user_uuid=current_user.user_uuid, category=category
+                    )
+
+                logging.info(
+                    "Created %s categories in %s/%s.",
+                    len(created_categories),
+                    schema.month,
+                    schema.year,
+                )
+                response.message = "Created new categories."
+                response.data = {
+                    "created": created_categories,
+                    "skipped": [
+                        category
+                        for category in categories
+                        if category not in created_categories
+                    ],
+                }
+                response.success = True
+            except FinanceTrackerApiError as FTE:
+                await session.rollback()
+                raise FTE
+            except Exception as E:
+                logging.error("Error during bulk creating category: %s.", E)
+                await session.rollback()
+                raise DatabaseError(
+                    detail=f"Database error: {E}.",
+                )
+            finally:
+                await session.close()
+    except FinanceTrackerApiError as FTE:
+        raise FTE
+
+    except Exception as E:
+        raise ServiceError(detail=f"Service error: {E}.", name="Finance Tracker")
+
+    return response
+
+
+router.add_api_route(
+    methods=["POST"],
+    path="/bulk-create-schema",
+    response_model=ResponseDefault,
+    endpoint=bulk_create_schema,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create many budgeting categories of a month at once.",
+)
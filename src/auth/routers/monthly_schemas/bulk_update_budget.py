@@ -0,0 +1,145 @@
+from typing import Annotated
+from src.auth.utils.logging import logging
+from fastapi import APIRouter, status, Depends
+from src.auth.schema.response import ResponseDefault
+from src.auth.utils.jwt.general import get_current_user
+from src.database.connection import database_connection
+from src.auth.utils.request_format import BulkMoneySpendSchema
+from src.auth.utils.autocomplete.general import category_autocomplete
+from src.auth.utils.database.general import (
+    extract_month_schemas,
+    bump_month_versions,
+    month_schemas_query,
+    local_time,
+)
+from src.auth.routers.exceptions import (
+    ServiceError,
+    DatabaseError,
+    FinanceTrackerApiError,
+    InvalidOperationError,
+)
+
+router = APIRouter(tags=["money-schemas"])
+
+
+async def bulk_update_budget(
+    schema: BulkMoneySpendSchema,
+    current_user: Annotated[dict, Depends(get_current_user)],
+) -> ResponseDefault:
+    """
+    Apply a whole month budget plan in one request:
+
+    - **month**: This refers to the specific calendar month (e.g., January, February) when the schema was created or applies to.
+    - **year**: This represents the calendar year (e.g., 2023, 2024) associated with the schema.
+    - **categories**: List of **category** and **budget** pairs. Missing categories are created, saved categories get the new budget.
+
+    The response lists which categories were created, updated (with the previous budget) and left unchanged.
+    """
+
+    response = ResponseDefault()
+    categories = {item.category: item.budget for item in schema.categories}
+
+    if len(categories) != len(schema.categories):
+        raise InvalidOperationError(detail="Category should be unique per request.")
+
+    try:
+        logging.info("Endpoint bulk update budget.")
+        async with database_connection().connect() as session:
+            try:
+                saved_categories = await extract_month_schemas(
+                    session=session,
+                    user_uuid=current_user.user_uuid,
+                    month=schema.month,
+                    year=schema.year,
+                )
+                created = [
+                    category
+                    for category in categories
+                    if category not in saved_categories
+                ]
+                updated = [
+                    {
+                        "category": category,
+                        "budget_before": saved_categories[category],
+                        "budget_after": budget,
+                    }
+                    for category, budget in categories.items()
+                    if category in saved_categories
+                    and saved_categories[category] != budget
+                ]
+                unchanged = [
+                    category
+                    for category, budget in categories.items()
+                    if saved_categories.get(category) == budget
+                ]
+
+                if created or updated:
+                    query = month_schemas_query(
+                        user_uuid=current_user.user_uuid,
+                        month=schema.month,
+                        year=schema.year,
+                        categories={
+                            category: categories[category]
+                            for category in created
+                            + [item["category"] for item in updated]
+                        },
+                    )
+                    query = query.on_conflict_do_update(
+                        index_elements=["user_uuid", "year", "month", "category"],
+                        set_={
+                            "updated_at": local_time(),
+                            "budget": query.excluded.budget,
+                        },
+                    )
+                    await session.execute(query)
+                    await bump_month_versions(
+                        session=session,
+                        user_uuid=current_user.user_uuid,
+                        periods=[(schema.month, schema.year)],
+                    )
+                await session.commit()
+
+                for category in created:
+                    category_autocomplete.add_category(
+                        user_uuid=current_user.user_uuid, category=category
+                    )
+
+                logging.info(
+                    "Bulk budget in %s/%s: %s created, %s updated.",
+                    schema.month,
+                    schema.year,
+                    len(created),
+                    len(updated),
+                )
+                response.message = "Update budget success."
+                response.data = {
+                    "created": created,
+                    "updated": updated,
+                    "unchanged": unchanged,
+                }
+                response.success = True
+            except Exception as E:
+                logging.error("Error during bulk updating budget: %s.", E)
+                await session.rollback()
+                raise DatabaseError(
+                    detail=f"Database error: {E}.",
+                )
+            finally:
+                await session.close()
+    except FinanceTrackerApiError as FTE:
+        raise FTE
+
+    except Exception as E:
+        raise ServiceError(detail=f"Service error: {E}.", name="Finance Tracker")
+
+    return response
+
+
+router.add_api_route(
+    methods=["PUT"],
+    path="/bulk-update-budget",
+    response_model=ResponseDefault,
+    endpoint=bulk_update_budget,
+    status_code=status.HTTP_200_OK,
+    summary="Create or update budgets of many categories in a month at once.",
+)
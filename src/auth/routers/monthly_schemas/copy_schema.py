@@ -0,0 +1,125 @@
+from typing import Annotated
+from src.auth.utils.logging import logging
+from fastapi import APIRouter, status, Depends
+from src.auth.schema.response import ResponseDefault
+from src.auth.utils.jwt.general import get_current_user
+from src.database.connection import database_connection
+from src.auth.utils.request_format import CopyMonthlySchema
+from src.auth.utils.database.general import filter_month_year, bump_month_versions
+from src.auth.utils.schema_copy.general import copy_user_schema_query
+from src.auth.utils.autocomplete.general import category_autocomplete
+from src.auth.routers.exceptions import (
+    ServiceError,
+    DatabaseError,
+    FinanceTrackerApiError,
+    EntityDoesNotExistError,
+    InvalidOperationError,
+)
+
+router = APIRouter(tags=["money-schemas"])
+
+
+async def copy_schema(
+    schema: CopyMonthlySchema,
+    current_user: Annotated[dict, Depends(get_current_user)],
+) -> ResponseDefault:
+    """
+    Copy every category and budget of a month into another month:
+
+    - **source_month**: The month whose categories will be copied.
+    - **source_year**: The year of the source month.
+    - **target_month**: The month that will receive the categories.
+    - **target_year**: The year of the target month.
+    - **budget_percentage**: Percentage applied to every copied budget (e.g., 110 raises all budgets by 10%). Defaults to 100.
+    - **budget_overrides**: Optional map of category to an exact budget for the target month. Overrides take precedence over **budget_percentage**.
+
+    Categories that already exist in the target month are left untouched.
+    """
+
+    response = ResponseDefault()
+
+    if (schema.source_month, schema.source_year) == (
+        schema.target_month,
+        schema.target_year,
+    ):
+        raise InvalidOperationError(detail="Source and target month should differ.")
+
+    is_available = await filter_month_year(
+        user_uuid=current_user.user_uuid,
+        month=schema.source_month,
+        year=schema.source_year,
+    )
+
+    if is_available is False:
+        logging.info(
+            "User %s has not created a schema in %s/%s.",
+            current_user.full_name,
+            schema.source_month,
+            schema.source_year,
+        )
+        raise EntityDoesNotExistError(
+            detail=f"Schema on {schema.source_month}/{schema.source_year} is not created yet.",
+        )
+
+    try:
+        logging.info("Endpoint copy schema.")
+        async with database_connection().connect() as session:
+            try:
+                query = copy_user_schema_query(
+                    user_uuid=current_user.user_uuid,
+                    source_month=schema.source_month,
+                    source_year=schema.source_year,
+                    target_month=schema.target_month,
+                    target_year=schema.target_year,
+                    budget_percentage=schema.budget_percentage,
+                    budget_overrides=schema.budget_overrides,
+                )
+                result = await session.execute(query)
+                copied_categories = [row.category for row in result.fetchall()]
+                if copied_categories:
+                    await bump_month_versions(
+                        session=session,
+                        user_uuid=current_user.user_uuid,
+                        periods=[(schema.target_month, schema.target_year)],
+                    )
+                await session.commit()
+
+                for category in copied_categories:
+                    category_autocomplete.add_category(
+                        user_uuid=current_user.user_uuid, category=category
+                    )
+
+                logging.info(
+                    "Copied %s categories into %s/%s.",
+                    len(copied_categories),
+                    schema.target_month,
+                    schema.target_year,
+                )
+                response.message = "Copy schema success."
+                response.data = {"copied_categories": copied_categories}
+                response.success = True
+            except Exception as E:
+                logging.error("Error during copying schema: %s.", E)
+                await session.rollback()
+                raise DatabaseError(
+                    detail=f"Database error: {E}.",
+                )
+            finally:
+                await session.close()
+    except FinanceTrackerApiError as FTE:
+        raise FTE
+
+    except Exception as E:
+        raise ServiceError(detail=f"Service error: {E}.", name="Finance Tracker")
+
+    return response
+
+
+router.add_api_route(
+    methods=["POST"],
+    path="/copy-schema",
+    response_model=ResponseDefault,
+    endpoint=copy_schema,
+    status_code=status.HTTP_201_CREATED,
+    summary="Copy a budgeting schema from one month into another month.",
+)
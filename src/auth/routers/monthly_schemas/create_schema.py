@@ -6,7 +6,13 @@ from src.auth.schema.response import ResponseDefault
 from src.auth.utils.jwt.general import get_current_user
 from src.database.connection import database_connection
 from src.auth.utils.request_format import MoneySpendSchema
-from src.auth.utils.database.general import filter_month_year_category, local_time
+from src.auth.utils.autocomplete.general import category_autocomplete
+from src.auth.utils.database.general import (
+    filter_month_year_category,
+    is_duplicate_category,
+    bump_month_versions,
+    local_time,
+)
 from src.auth.routers.exceptions import (
     EntityAlreadyExistError,
     ServiceError,
@@ -40,7 +46,11 @@ async def create_schema(
 
     if is_available:
         logging.info(
-            f"User: {current_user.full_name} already have category {schema.category} in {schema.month}/{schema.year}."
+            "User: %s already have category %s in %s/%s.",
+            current_user.full_name,
+            schema.category,
+            schema.month,
+            schema.year,
         )
         raise EntityAlreadyExistError(
             detail=f"Category {schema.category} already saved.",
@@ -60,15 +70,27 @@ async def create_schema(
                     budget=schema.budget,
                 )
                 await session.execute(query)
+                await bump_month_versions(
+                    session=session,
+                    user_uuid=current_user.user_uuid,
+                    periods=[(schema.month, schema.year)],
+                )
                 await session.commit()
-                logging.info(f"Created new category: {schema.category}.")
+                category_autocomplete.add_category(
+                    user_uuid=current_user.user_uuid, category=schema.category
+                )
+                logging.info("Created new category: %s.", schema.category)
                 response.message = "Created new category."
                 response.success = True
             except Exception as E:
+                await session.rollback()
+                if is_duplicate_category(error=E):
+                    raise EntityAlreadyExistError(
+                        detail=f"Category {schema.category} already saved.",
+                    )
                 logging.error(
-                    f"Error during creating category inside transaction: {E}."
+                    "Error during creating category inside transaction: %s.", E
                 )
-                await session.rollback()
                 raise DatabaseError(
                     detail=f"Database error: {E}.",
                 )
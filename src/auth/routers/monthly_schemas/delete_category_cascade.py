@@ -0,0 +1,267 @@
+from typing import Annotated
+from sqlalchemy import DateTime
+from uuid_extensions import uuid7
+from sqlalchemy.sql import Select, and_, select, literal, null
+from sqlalchemy.sql.elements import ColumnElement
+from src.auth.utils.logging import logging
+from fastapi import APIRouter, status, Depends
+from sqlalchemy.dialects.postgresql import insert, Insert
+from src.secret import CATEGORY_CASCADE_BATCH_SIZE
+from src.auth.schema.response import ResponseDefault
+from src.auth.utils.jwt.general import get_current_user
+from src.database.connection import database_connection
+from src.auth.utils.request_format import DeleteCategoryCascade
+from src.database.models import money_spends, money_spend_schemas
+from src.auth.utils.autocomplete.general import category_autocomplete
+from src.auth.utils.database.general import (
+    bump_month_versions,
+    between_period,
+    local_time,
+)
+from src.auth.routers.exceptions import (
+    ServiceError,
+    DatabaseError,
+    FinanceTrackerApiError,
+    EntityDoesNotExistError,
+    InvalidOperationError,
+)
+
+router = APIRouter(tags=["money-schemas"])
+
+
+def spend_batch_query(
+    user_uuid: uuid7, category: str, spend_period: ColumnElement, batch_size: int
+) -> Select:
+    return (
+        select(money_spends.c.id)
+        .where(
+            and_(
+                money_spends.c.user_uuid == user_uuid,
+                money_spends.c.category == category,
+                spend_period,
+            )
+        )
+        .limit(batch_size)
+    )
+
+
+def reassign_schemas_query(schema_filter: ColumnElement, reassign_to: str) -> Insert:
+    """
+    Create `reassign_to` with zero budget in every month matched by
+    `schema_filter` that does not hold it yet, returning those months.
+    """
+    return (
+        insert(money_spend_schemas)
+        .from_select(
+            [
+                "created_at",
+                "updated_at",
+                "user_uuid",
+                "month",
+                "year",
+                "category",
+                "budget",
+            ],
+            select(
+                literal(local_time(), DateTime(timezone=True)),
+                null(),
+                money_spend_schemas.c.user_uuid,
+                money_spend_schemas.c.month,
+                money_spend_schemas.c.year,
+                literal(reassign_to),
+                literal(0),
+            ).where(schema_filter),
+        )
+        .on_conflict_do_nothing(
+            index_elements=["user_uuid", "year", "month", "category"]
+        )
+        .returning(money_spend_schemas.c.month, money_spend_schemas.c.year)
+    )
+
+
+async def delete_category_cascade(
+    schema: DeleteCategoryCascade,
+    current_user: Annotated[dict, Depends(get_current_user)],
+) -> ResponseDefault:
+    """
+    Delete a category together with its spending:
+
+    - **month**: The first month to delete.
+    - **year**: The year of the first month.
+    - **end_month**: Optional last month to delete (inclusive). Leave empty together with **end_year** to delete a single month.
+    - **end_year**: Optional year of the last month.
+    - **category**: The category to delete.
+    - **reassign_to**: Optional, non-blank category that receives the spending instead of deleting them. It is created with zero budget in months where it does not exist yet.
+
+    Spending are processed in bounded batches, each one committed on its own.
+    """
+
+    response = ResponseDefault()
+    batch_size = int(CATEGORY_CASCADE_BATCH_SIZE)
+
+    if (schema.end_month is None) != (schema.end_year is None):
+        raise InvalidOperationError(
+            detail="End month and end year should be filled together."
+        )
+
+    end_month = schema.end_month or schema.month
+    end_year = schema.end_year or schema.year
+
+    if (end_year, end_month) < (schema.year, schema.month):
+        raise InvalidOperationError(detail="End period should be after start period.")
+
+    if schema.reassign_to == schema.category:
+        raise InvalidOperationError(
+            detail="Cannot reassign spending into same category."
+        )
+
+    schema_filter = and_(
+        money_spend_schemas.c.user_uuid == current_user.user_uuid,
+        money_spend_schemas.c.category == schema.category,
+        between_period(
+            year_column=money_spend_schemas.c.year,
+            month_column=money_spend_schemas.c.month,
+            month=schema.month,
+            year=schema.year,
+            end_month=end_month,
+            end_year=end_year,
+        ),
+    )
+    spend_batch = spend_batch_query(
+        user_uuid=current_user.user_uuid,
+        category=schema.category,
+        spend_period=between_period(
+            year_column=money_spends.c.spend_year,
+            month_column=money_spends.c.spend_month,
+            month=schema.month,
+            year=schema.year,
+            end_month=end_month,
+            end_year=end_year,
+        ),
+        batch_size=batch_size,
+    ).scalar_subquery()
+
+    try:
+        logging.info("Endpoint delete category cascade.")
+        async with database_connection().connect() as session:
+            try:
+                is_available = await session.execute(
+                    select(money_spend_schemas.c.id).where(schema_filter).limit(1)
+                )
+
+                if not is_available.fetchone():
+                    raise EntityDoesNotExistError(
+                        detail=f"Category {schema.category} not found. Please create category first.",
+                    )
+
+                created_categories = 0
+                if schema.reassign_to is not None:
+                    created = await session.execute(
+                        reassign_schemas_query(
+                            schema_filter=schema_filter,
+                            reassign_to=schema.reassign_to,
+                        )
+                    )
+                    created = created.fetchall()
+                    created_categories = len(created)
+                    await bump_month_versions(
+                        session=session,
+                        user_uuid=current_user.user_uuid,
+                        periods={tuple(row) for row in created},
+                    )
+                    await session.commit()
+
+                    batch_query = (
+                        money_spends.update()
+                        .where(money_spends.c.id.in_(spend_batch))
+                        .values(updated_at=local_time(), category=schema.reassign_to)
+                    )
+                else:
+                    batch_query = money_spends.delete().where(
+                        money_spends.c.id.in_(spend_batch)
+                    )
+                batch_query = batch_query.returning(
+                    money_spends.c.spend_month, money_spends.c.spend_year
+                )
+
+                processed_spends = 0
+                while True:
+                    result = await session.execute(batch_query)
+                    processed = result.fetchall()
+                    await bump_month_versions(
+                        session=session,
+                        user_uuid=current_user.user_uuid,
+                        periods={tuple(row) for row in processed},
+                    )
+                    await session.commit()
+                    processed_spends += len(processed)
+                    if len(processed) < batch_size:
+                        break
+
+                deleted_schemas = await session.execute(
+                    money_spend_schemas.delete()
+                    .where(schema_filter)
+                    .returning(money_spend_schemas.c.month, money_spend_schemas.c.year)
+                )
+                deleted_schemas = deleted_schemas.fetchall()
+                await bump_month_versions(
+                    session=session,
+                    user_uuid=current_user.user_uuid,
+                    periods={tuple(row) for row in deleted_schemas},
+                )
+                await session.commit()
+
+                for _ in range(len(deleted_schemas)):
+                    category_autocomplete.remove_category(
+                        user_uuid=current_user.user_uuid, category=schema.category
+                    )
+                for _ in range(created_categories):
+                    category_autocomplete.add_category(
+                        user_uuid=current_user.user_uuid, category=schema.reassign_to
+                    )
+
+                logging.info(
+                    "Deleted category %s on %s schema and processed %s spending.",
+                    schema.category,
+                    len(deleted_schemas),
+                    processed_spends,
+                )
+                response.message = "Delete category success."
+                spends_key = (
+                    "spends_reassigned"
+                    if schema.reassign_to is not None
+                    else "spends_deleted"
+                )
+                response.data = {
+                    "schemas_deleted": len(deleted_schemas),
+                    spends_key: processed_spends,
+                }
+                response.success = True
+            except FinanceTrackerApiError as FTE:
+                await session.rollback()
+                raise FTE
+            except Exception as E:
+                logging.error("Error during deleting category cascade: %s.", E)
+                await session.rollback()
+                raise DatabaseError(
+                    detail=f"Database error: {E}.",
+                )
+            finally:
+                await session.close()
+    except FinanceTrackerApiError as FTE:
+        raise FTE
+
+    except Exception as E:
+        raise ServiceError(detail=f"Service error: {E}.", name="Finance Tracker")
+
+    return response
+
+
+router.add_api_route(
+    methods=["DELETE"],
+    path="/delete-category-cascade",
+    response_model=ResponseDefault,
+    endpoint=delete_category_cascade,
+    status_code=status.HTTP_200_OK,
+    summary="Delete a category with its spending in a month or a period.",
+)
@@ -7,7 +7,11 @@ from src.auth.schema.response import ResponseDefault
 from src.database.connection import database_connection
 from src.auth.utils.jwt.general import get_current_user
 from src.auth.utils.request_format import DeleteCategorySchema
-from src.auth.utils.database.general import filter_month_year_category
+from src.auth.utils.autocomplete.general import category_autocomplete
+from src.auth.utils.database.general import (
+    filter_month_year_category,
+    bump_month_versions,
+)
 from src.auth.routers.exceptions import (
     ServiceError,
     DatabaseError,
@@ -41,7 +45,11 @@ async def update_category_schema(
 
     if is_available is False:
         logging.info(
-            f"User {current_user.full_name} does not have the category {schema.category} in {schema.month}/{schema.year}."
+            "User %s does not have the category %s in %s/%s.",
+            current_user.full_name,
+            schema.category,
+            schema.month,
+            schema.year,
         )
         raise EntityDoesNotExistError(
             detail=f"Category {schema.category} not found. Please create category first.",
@@ -60,12 +68,20 @@ async def update_category_schema(
                     )
                 )
                 await session.execute(query)
+                await bump_month_versions(
+                    session=session,
+                    user_uuid=current_user.user_uuid,
+                    periods=[(schema.month, schema.year)],
+                )
                 await session.commit()
-                logging.info(f"Deleted category {schema.category}.")
+                category_autocomplete.remove_category(
+                    user_uuid=current_user.user_uuid, category=schema.category
+                )
+                logging.info("Deleted category %s.", schema.category)
                 response.message = "Delete category success."
                 response.success = True
             except Exception as E:
-                logging.error(f"Error during deleting category: {E}.")
+                logging.error("Error during deleting category: %s.", E)
                 await session.rollback()
                 raise DatabaseError(
                     detail=f"Database error: {E}.",
@@ -0,0 +1,220 @@
+from typing import Annotated
+from uuid_extensions import uuid7
+from sqlalchemy.sql import Select, and_, exists, select
+from sqlalchemy.sql.elements import ColumnElement
+from src.auth.utils.logging import logging
+from fastapi import APIRouter, status, Depends
+from src.auth.schema.response import ResponseDefault
+from src.auth.utils.request_format import RenameCategory
+from src.auth.utils.jwt.general import get_current_user
+from src.database.connection import database_connection
+from src.database.models import money_spends, money_spend_schemas
+from src.auth.utils.autocomplete.general import category_autocomplete
+from src.auth.utils.database.general import (
+    bump_month_versions,
+    is_duplicate_category,
+    between_period,
+    local_time,
+)
+from src.auth.routers.exceptions import (
+    EntityAlreadyExistError,
+    ServiceError,
+    DatabaseError,
+    FinanceTrackerApiError,
+    EntityDoesNotExistError,
+    InvalidOperationError,
+)
+
+router = APIRouter(tags=["money-schemas"])
+
+
+def rename_conflict_query(
+    user_uuid: uuid7,
+    category: str,
+    changed_category_into: str,
+    schema_period: ColumnElement,
+) -> Select:
+    """
+    First month in the period already holding both names. Only those months
+    would end up with a duplicate; elsewhere the new name may already exist.
+    """
+    source = money_spend_schemas.alias("source")
+    return (
+        select(money_spend_schemas.c.id)
+        .where(
+            and_(
+                money_spend_schemas.c.user_uuid == user_uuid,
+                money_spend_schemas.c.category == changed_category_into,
+                schema_period,
+                exists().where(
+                    and_(
+                        source.c.user_uuid == user_uuid,
+                        source.c.year == money_spend_schemas.c.year,
+                        source.c.month == money_spend_schemas.c.month,
+                        source.c.category == category,
+                    )
+                ),
+            )
+        )
+        .limit(1)
+    )
+
+
+async def rename_category(
+    schema: RenameCategory,
+    current_user: Annotated[dict, Depends(get_current_user)],
+) -> ResponseDefault:
+    """
+    Rename a category on the schema and every spending that uses it:
+
+    - **month**: The first month to rename.
+    - **year**: The year of the first month.
+    - **end_month**: Optional last month to rename (inclusive). Leave empty together with **end_year** to rename a single month.
+    - **end_year**: Optional year of the last month.
+    - **category**: The current category name.
+    - **changed_category_into**: The new category name.
+    """
+
+    response = ResponseDefault()
+
+    if (schema.end_month is None) != (schema.end_year is None):
+        raise InvalidOperationError(
+            detail="End month and end year should be filled together."
+        )
+
+    end_month = schema.end_month or schema.month
+    end_year = schema.end_year or schema.year
+
+    if (end_year, end_month) < (schema.year, schema.month):
+        raise InvalidOperationError(detail="End period should be after start period.")
+
+    if schema.category == schema.changed_category_into:
+        raise InvalidOperationError(detail="Cannot rename category into same name.")
+
+    schema_period = between_period(
+        year_column=money_spend_schemas.c.year,
+        month_column=money_spend_schemas.c.month,
+        month=schema.month,
+        year=schema.year,
+        end_month=end_month,
+        end_year=end_year,
+    )
+    spend_period = between_period(
+        year_column=money_spends.c.spend_year,
+        month_column=money_spends.c.spend_month,
+        month=schema.month,
+        year=schema.year,
+        end_month=end_month,
+        end_year=end_year,
+    )
+
+    try:
+        logging.info("Endpoint rename category.")
+        async with database_connection().connect() as session:
+            try:
+                conflicted = await session.execute(
+                    rename_conflict_query(
+                        user_uuid=current_user.user_uuid,
+                        category=schema.category,
+                        changed_category_into=schema.changed_category_into,
+                        schema_period=schema_period,
+                    )
+                )
+
+                if conflicted.fetchone():
+                    raise EntityAlreadyExistError(
+                        detail=f"Category {schema.changed_category_into} already saved. Please change with another category."
+                    )
+
+                renamed_schemas = await session.execute(
+                    money_spend_schemas.update()
+                    .where(
+                        and_(
+                            money_spend_schemas.c.user_uuid == current_user.user_uuid,
+                            money_spend_schemas.c.category == schema.category,
+                            schema_period,
+                        )
+                    )
+                    .values(
+                        updated_at=local_time(), category=schema.changed_category_into
+                    )
+                    .returning(money_spend_schemas.c.month, money_spend_schemas.c.year)
+                )
+                renamed_spends = await session.execute(
+                    money_spends.update()
+                    .where(
+                        and_(
+                            money_spends.c.user_uuid == current_user.user_uuid,
+                            money_spends.c.category == schema.category,
+                            spend_period,
+                        )
+                    )
+                    .values(
+                        updated_at=local_time(), category=schema.changed_category_into
+                    )
+                    .returning(money_spends.c.spend_month, money_spends.c.spend_year)
+                )
+                renamed_schemas = renamed_schemas.fetchall()
+                renamed_spends = renamed_spends.fetchall()
+
+                if not renamed_schemas and not renamed_spends:
+                    raise EntityDoesNotExistError(
+                        detail=f"Category {schema.category} not found. Please create category first."
+                    )
+
+                await bump_month_versions(
+                    session=session,
+                    user_uuid=current_user.user_uuid,
+                    periods={tuple(row) for row in renamed_schemas + renamed_spends},
+                )
+                await session.commit()
+                category_autocomplete.rename_category(
+                    user_uuid=current_user.user_uuid,
+                    category=schema.category,
+                    changed_category_into=schema.changed_category_into,
+                    total=len(renamed_schemas),
+                )
+
+                logging.info(
+                    "Renamed category %s into %s on %s schema and %s spending.",
+                    schema.category,
+                    schema.changed_category_into,
+                    len(renamed_schemas),
+                    len(renamed_spends),
+                )
+                response.message = "Rename category success."
+                response.data = {
+                    "schemas_updated": len(renamed_schemas),
+                    "spends_updated": len(renamed_spends),
+                }
+                response.success = True
+            except FinanceTrackerApiError as FTE:
+                await session.rollback()
+                raise FTE
+            except Exception as E:
+                await session.rollback()
+                if is_duplicate_category(error=E):
+                    raise EntityAlreadyExistError(
+                        detail=f"Category {schema.changed_category_into} already saved. Please change with another category."
+                    )
+                logging.error("Error during renaming category: %s.", E)
+                raise DatabaseError(detail=f"Database error: {E}.")
+            finally:
+                await session.close()
+    except FinanceTrackerApiError as FTE:
+        raise FTE
+
+    except Exception as E:
+        raise ServiceError(detail=f"Service error: {E}.", name="Finance Tracker")
+
+    return response
+
+
+router.add_api_route(
+    methods=["PATCH"],
+    path="/rename-category",
+    response_model=ResponseDefault,
+    endpoint=rename_category,
+    status_code=status.HTTP_200_OK,
+    summary="Rename a category on schemas and spending of a month or a period.",
+)
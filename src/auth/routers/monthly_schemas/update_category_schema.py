@@ -6,9 +6,12 @@ from src.auth.schema.response import ResponseDefault
 from src.auth.utils.jwt.general import get_current_user
 from src.database.connection import database_connection
 from src.auth.utils.request_format import UpdateCategorySchema, local_time
+from src.auth.utils.autocomplete.general import category_autocomplete
 from src.auth.utils.database.general import (
     filter_month_year_category,
     filter_spesific_category,
+    is_duplicate_category,
+    bump_month_versions,
 )
 from src.auth.routers.exceptions import (
     EntityAlreadyExistError,
@@ -48,7 +51,10 @@ async def update_category_schema(
 
     if is_available is False:
         logging.info(
-            f"User {current_users.full_name} is not created schema in {schema.month}/{schema.year}."
+            "User %s is not created schema in %s/%s.",
+            current_users.full_name,
+            schema.month,
+            schema.year,
         )
         raise EntityDoesNotExistError(
             detail=f"Category {schema.category} not found. Please create category first."
@@ -56,7 +62,7 @@ async def update_category_schema(
 
     if category_already_saved is True:
         logging.warning(
-            f"Cannot changed category into: {schema.changed_category_into}."
+            "Cannot changed category into: %s.", schema.changed_category_into
         )
         raise EntityAlreadyExistError(
             detail=f"Category {schema.changed_category_into} already saved. Please change with another category."
@@ -79,15 +85,31 @@ async def update_category_schema(
                     )
                 )
                 await session.execute(query)
+                await bump_month_versions(
+                    session=session,
+                    user_uuid=current_users.user_uuid,
+                    periods=[(schema.month, schema.year)],
+                )
                 await session.commit()
+                category_autocomplete.rename_category(
+                    user_uuid=current_users.user_uuid,
+                    category=schema.category,
+                    changed_category_into=schema.changed_category_into,
+                )
                 logging.info(
-                    f"Updated category {schema.category} into {schema.changed_category_into}."
+                    "Updated category %s into %s.",
+                    schema.category,
+                    schema.changed_category_into,
                 )
                 response.message = "Update category success."
                 response.success = True
             except Exception as E:
-                logging.error(f"Error during updating category: {E}.")
                 await session.rollback()
+                if is_duplicate_category(error=E):
+                    raise EntityAlreadyExistError(
+                        detail=f"Category {schema.changed_category_into} already saved. Please change with another category."
+                    )
+                logging.error("Error during updating category: %s.", E)
                 raise DatabaseError(detail=f"Database error: {E}.")
             finally:
                 await session.close()
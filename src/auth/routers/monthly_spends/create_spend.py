@@ -1,12 +1,18 @@
 from typing import Annotated
 from src.auth.utils.logging import logging
 from fastapi import APIRouter, status, Depends
+from sqlalchemy.dialects.postgresql import insert
 from src.auth.schema.response import ResponseDefault
 from src.auth.utils.request_format import CreateSpend
 from src.auth.utils.jwt.general import get_current_user
+from src.auth.utils.autocomplete.general import category_autocomplete
 from src.database.connection import database_connection
 from src.database.models import money_spends, money_spend_schemas
-from src.auth.utils.database.general import filter_month_year_category, local_time
+from src.auth.utils.database.general import (
+    filter_month_year_category,
+    bump_month_versions,
+    local_time,
+)
 from src.auth.routers.exceptions import (
     ServiceError,
     DatabaseError,
@@ -46,7 +52,9 @@ async def create_spend(
                 if is_available is False:
                     try:
                         logging.info(
-                            f"Inserting data into table {money_spends.name} and {money_spend_schemas.name}"
+                            "Inserting data into table %s and %s",
+                            money_spends.name,
+                            money_spend_schemas.name,
                         )
 
                         create_spend = money_spends.insert().values(
@@ -60,31 +68,56 @@ async def create_spend(
                             description=schema.description,
                             amount=schema.amount,
                         )
-                        create_category = money_spend_schemas.insert().values(
-                            created_at=local_time(),
-                            updated_at=None,
-                            user_uuid=current_user.user_uuid,
-                            month=schema.spend_month,
-                            year=schema.spend_year,
-                            category=schema.category,
-                            budget=0,
+                        # A concurrent request may have created the category
+                        # since the check above; the spending is kept either way.
+                        create_category = (
+                            insert(money_spend_schemas)
+                            .values(
+                                created_at=local_time(),
+                                updated_at=None,
+                                user_uuid=current_user.user_uuid,
+                                month=schema.spend_month,
+                                year=schema.spend_year,
+                                category=schema.category,
+                                budget=0,
+                            )
+                            .on_conflict_do_nothing(
+                                index_elements=[
+                                    "user_uuid",
+                                    "year",
+                                    "month",
+                                    "category",
+                                ]
+                            )
+                            .returning(money_spend_schemas.c.id)
                         )
                         await session.execute(create_spend)
-                        await session.execute(create_category)
+                        created_category = await session.execute(create_category)
+                        created_category = created_category.fetchone()
+                        await bump_month_versions(
+                            session=session,
+                            user_uuid=current_user.user_uuid,
+                            periods=[(schema.spend_month, schema.spend_year)],
+                        )
                         await session.commit()
+                        if created_category:
+                            category_autocomplete.add_category(
+                                user_uuid=current_user.user_uuid,
+                                category=schema.category,
+                            )
                         logging.info("Created new spend money and schema.")
                         response.message = "Created new spend money and schema data."
                         response.success = True
                     except Exception as E:
                         logging.error(
-                            f"Error during creating new spend money and schema: {E}."
+                            "Error during creating new spend money and schema: %s.", E
                         )
                         await session.rollback()
                         raise DatabaseError(detail=f"Database error: {E}.")
                 else:
                     try:
                         logging.info(
-                            f"Only inserting data into table {money_spends.name}"
+                            "Only inserting data into table %s", money_spends.name
                         )
                         create_spend = money_spends.insert().values(
                             created_at=local_time(),
@@ -98,17 +131,23 @@ async def create_spend(
                             amount=schema.amount,
                         )
                         await session.execute(create_spend)
+                        await bump_month_versions(
+                            session=session,
+                            user_uuid=current_user.user_uuid,
+                            periods=[(schema.spend_month, schema.spend_year)],
+                        )
                         await session.commit()
                         logging.info("Created new spend money.")
                         response.message = "Created new spend money."
                         response.success = True
                     except Exception as E:
-                        logging.error(f"Error during creating new spend money: {E}.")
+                        logging.error("Error during creating new spend money: %s.", E)
                         await session.rollback()
                         raise DatabaseError(detail=f"Database error: {E}.")
             except Exception as E:
                 logging.error(
-                    f"Error during creating spend money or with adding money schema: {E}."
+                    "Error during creating spend money or with adding money schema: %s.",
+                    E,
                 )
                 await session.rollback()
                 raise DatabaseError(
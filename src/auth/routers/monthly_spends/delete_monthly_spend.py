@@ -6,7 +6,7 @@ from src.auth.schema.response import ResponseDefault
 from src.auth.utils.jwt.general import get_current_user
 from src.auth.utils.request_format import CreateSpend
 from src.database.connection import database_connection
-from src.auth.utils.database.general import filter_daily_spending
+from src.auth.utils.database.general import filter_daily_spending, bump_month_versions
 from src.auth.routers.exceptions import (
     ServiceError,
     DatabaseError,
@@ -64,12 +64,17 @@ async def create_spend(
                     money_spends.c.user_uuid == users.user_uuid,
                 )
                 await session.execute(create_spend)
+                await bump_month_versions(
+                    session=session,
+                    user_uuid=users.user_uuid,
+                    periods=[(is_available.spend_month, is_available.spend_year)],
+                )
                 await session.commit()
                 logging.info("Deleted a daily spend record.")
                 response.message = "Delete daily spend data success."
                 response.success = True
             except Exception as E:
-                logging.error(f"Error during delete daily spend money data: {E}.")
+                logging.error("Error during delete daily spend money data: %s.", E)
                 await session.rollback()
                 raise DatabaseError(
                     detail=f"Database error: {E}.",
@@ -1,12 +1,26 @@
-from sqlalchemy.sql import and_
+from sqlalchemy.sql import and_, select
 from typing import Annotated, Optional
 from src.auth.utils.logging import logging
 from src.database.models import money_spends
 from src.auth.schema.response import ResponseDefault
-from fastapi import APIRouter, status, Depends, Query
+from fastapi import APIRouter, status, Depends, Query, Request
 from src.auth.utils.jwt.general import get_current_user
 from src.database.connection import database_connection
-from src.auth.utils.database.general import filter_month_year, local_time
+from src.auth.utils.database.general import (
+    extract_month_version,
+    filter_month_year,
+    local_time,
+)
+from src.auth.utils.cache.general import month_response_cache
+from src.auth.utils.serializer.general import render_response
+from src.auth.schema.rows import MoneySpendRow, row_columns
+from src.auth.utils.http_cache.general import (
+    json_body_response,
+    month_cache_headers,
+    not_modified,
+    etag_matches,
+    month_etag,
+)
 from src.auth.routers.exceptions import (
     ServiceError,
     DatabaseError,
@@ -18,6 +32,7 @@ router = APIRouter(tags=["money-spends"])
 
 
 async def list_spending(
+    request: Request,
     users: Annotated[dict, Depends(get_current_user)],
     month: Optional[int] = Query(default=None, ge=1, le=12),
     year: Optional[int] = Query(default=None, ge=1000, le=9999),
@@ -27,13 +42,38 @@ async def list_spending(
 
     - **month**: This refers to the specific calendar month (e.g., January, February) when the schema was created or applies to.
     - **year**: This represents the calendar year (e.g., 2023, 2024) associated with the schema.
+
+    The response carries an **ETag** that changes on every write to the month. Send it back in **If-None-Match** to get **304 Not Modified** while nothing changed. Unchanged months are served from an in-process cache of the serialized body.
     """
 
     current_time = local_time()
     month = month if month is not None else current_time.month
     year = year if year is not None else current_time.year
 
-    response = ResponseDefault()
+    version = await extract_month_version(
+        user_uuid=users.user_uuid, month=month, year=year
+    )
+    cache_headers = {}
+    if version is not None:
+        cache_headers = month_cache_headers(
+            etag=month_etag(
+                user_uuid=users.user_uuid, month=month, year=year, version=version
+            ),
+            month=month,
+            year=year,
+        )
+        if etag_matches(request=request, etag=cache_headers["ETag"]):
+            return not_modified(headers=cache_headers)
+
+        body = month_response_cache.get(
+            user_uuid=users.user_uuid,
+            year=year,
+            month=month,
+            endpoint="list-spending",
+            version=version,
+        )
+        if body is not None:
+            return json_body_response(body=body, headers=cache_headers)
 
     is_available = await filter_month_year(
         user_uuid=users.user_uuid, month=month, year=year
@@ -48,7 +88,7 @@ async def list_spending(
         logging.info("Endpoint get spend per month.")
         async with database_connection().connect() as session:
             try:
-                query = money_spends.select().where(
+                query = select(*row_columns(MoneySpendRow, money_spends)).where(
                     and_(
                         money_spends.c.spend_month == month,
                         money_spends.c.spend_year == year,
@@ -56,15 +96,12 @@ async def list_spending(
                     )
                 )
                 result = await session.execute(query)
-                data = result.fetchall()
+                data = [MoneySpendRow(*row) for row in result]
                 logging.info(
-                    f"Get spend per month {money_spends.name} on {month}/{year}."
+                    "Get spend per month %s on %s/%s.", money_spends.name, month, year
                 )
-                response.message = "Get spend per month information success."
-                response.data = [dict(row._mapping) for row in data]
-                response.success = True
             except Exception as E:
-                logging.error(f"Error during getting money spend per month: {E}.")
+                logging.error("Error during getting money spend per month: %s.", E)
                 await session.rollback()
                 raise DatabaseError(
                     detail=f"Database error: {E}",
@@ -77,7 +114,19 @@ async def list_spending(
     except Exception as E:
         raise ServiceError(detail=f"Service error: {E}.", name="Finance Tracker")
 
-    return response
+    body = render_response(
+        success=True, message="Get spend per month information success.", data=data
+    )
+    if version is not None:
+        month_response_cache.set(
+            user_uuid=users.user_uuid,
+            year=year,
+            month=month,
+            endpoint="list-spending",
+            version=version,
+            body=body,
+        )
+    return json_body_response(body=body, headers=cache_headers)
 
 
 router.add_api_route(
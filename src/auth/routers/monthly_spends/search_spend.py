@@ -0,0 +1,158 @@
+import base64
+from datetime import date
+from typing import Annotated, Optional
+from sqlalchemy.sql import and_, or_, literal, tuple_
+from src.auth.utils.logging import logging
+from src.database.models import money_spends
+from src.auth.schema.response import ResponseDefault
+from fastapi import APIRouter, status, Depends, Query
+from src.auth.utils.jwt.general import get_current_user
+from src.database.connection import database_connection
+from src.auth.routers.exceptions import (
+    ServiceError,
+    DatabaseError,
+    FinanceTrackerApiError,
+    InvalidOperationError,
+)
+
+router = APIRouter(tags=["money-spends"])
+
+
+def encode_cursor(year: int, month: int, day: int, id: int) -> str:
+    raw = f"{year}:{month}:{day}:{id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[int, int, int, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        year, month, day, id = base64.urlsafe_b64decode(padded).decode().split(":")
+        return int(year), int(month), int(day), int(id)
+    except Exception:
+        raise InvalidOperationError(detail="Invalid search cursor.")
+
+
+def escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+async def search_spending(
+    users: Annotated[dict, Depends(get_current_user)],
+    keyword: str = Query(min_length=1, max_length=255),
+    start_date: Optional[date] = Query(default=None),
+    end_date: Optional[date] = Query(default=None),
+    cursor: Optional[str] = Query(default=None),
+    limit: int = Query(default=20, ge=1, le=100),
+) -> ResponseDefault:
+    """
+    Search spending records by description or category:
+
+    - **keyword**: Text to look for. Matches anywhere inside the description or category (prefix and substring), and also tolerates typos through trigram word similarity.
+    - **start_date**: Optional first spend date (inclusive) to search from.
+    - **end_date**: Optional last spend date (inclusive) to search until.
+    - **cursor**: Value of **next_cursor** from the previous page. Leave empty for the first page.
+    - **limit**: Maximum number of records returned in one page.
+    """
+
+    response = ResponseDefault()
+
+    if start_date and end_date and start_date > end_date:
+        raise InvalidOperationError(detail="Start date should be before end date.")
+
+    spend_date = tuple_(
+        money_spends.c.spend_year,
+        money_spends.c.spend_month,
+        money_spends.c.spend_day,
+    )
+    spend_position = tuple_(
+        money_spends.c.spend_year,
+        money_spends.c.spend_month,
+        money_spends.c.spend_day,
+        money_spends.c.id,
+    )
+    pattern = f"%{escape_like(keyword)}%"
+
+    filters = [
+        money_spends.c.user_uuid == users.user_uuid,
+        or_(
+            money_spends.c.description.ilike(pattern, escape="\\"),
+            money_spends.c.category.ilike(pattern, escape="\\"),
+            literal(keyword).op("<%")(money_spends.c.description),
+            literal(keyword).op("<%")(money_spends.c.category),
+        ),
+    ]
+
+    if start_date:
+        filters.append(
+            spend_date >= tuple_(start_date.year, start_date.month, start_date.day)
+        )
+
+    if end_date:
+        filters.append(
+            spend_date <= tuple_(end_date.year, end_date.month, end_date.day)
+        )
+
+    if cursor:
+        filters.append(spend_position < tuple_(*decode_cursor(cursor=cursor)))
+
+    try:
+        logging.info("Endpoint search spending.")
+        async with database_connection().connect() as session:
+            try:
+                query = (
+                    money_spends.select()
+                    .where(and_(*filters))
+                    .order_by(
+                        money_spends.c.spend_year.desc(),
+                        money_spends.c.spend_month.desc(),
+                        money_spends.c.spend_day.desc(),
+                        money_spends.c.id.desc(),
+                    )
+                    .limit(limit + 1)
+                )
+                result = await session.execute(query)
+                data = result.fetchall()
+
+                next_cursor = None
+                if len(data) > limit:
+                    data = data[:limit]
+                    last_row = data[-1]
+                    next_cursor = encode_cursor(
+                        year=last_row.spend_year,
+                        month=last_row.spend_month,
+                        day=last_row.spend_day,
+                        id=last_row.id,
+                    )
+
+                logging.info("Found %s spending for keyword %s.", len(data), keyword)
+                response.message = "Search spending success."
+                response.data = {
+                    "spends": [dict(row._mapping) for row in data],
+                    "next_cursor": next_cursor,
+                }
+                response.success = True
+            except Exception as E:
+                logging.error("Error during search spending: %s.", E)
+                await session.rollback()
+                raise DatabaseError(
+                    detail=f"Database error: {E}",
+                )
+            finally:
+                await session.close()
+    except FinanceTrackerApiError as FTE:
+        raise FTE
+
+    except Exception as E:
+        raise ServiceError(detail=f"Service error: {E}.", name="Finance Tracker")
+
+    return response
+
+
+router.add_api_route(
+    methods=["GET"],
+    path="/search-spending",
+    response_model=ResponseDefault,
+    endpoint=search_spending,
+    status_code=status.HTTP_200_OK,
+    summary="Search spending by description or category across months.",
+)
@@ -16,6 +16,7 @@ from src.auth.routers.exceptions import (
 from src.auth.utils.database.general import (
     filter_daily_spending,
     filter_spesific_category,
+    bump_month_versions,
 )
 
 router = APIRouter(tags=["money-spends"])
@@ -93,14 +94,24 @@ async def update_monthly_spend(
                     )
                 )
                 await session.execute(updated_daily_spend)
+                await bump_month_versions(
+                    session=session,
+                    user_uuid=current_user.user_uuid,
+                    periods=[
+                        (schema.spend_month, schema.spend_year),
+                        (schema.changed_spend_month, schema.changed_spend_year),
+                    ],
+                )
                 await session.commit()
                 logging.info(
-                    f"Updated category {schema.category} into {schema.changed_category_into}."
+                    "Updated category %s into %s.",
+                    schema.category,
+                    schema.changed_category_into,
                 )
                 response.message = "Update daily spending data success."
                 response.success = True
             except Exception as E:
-                logging.error(f"Error while daily spending data: {E}.")
+                logging.error("Error while daily spending data: %s.", E)
                 await session.rollback()
                 raise DatabaseError(
                     detail=f"Database error: {E}.",
@@ -1,16 +1,15 @@
-from pytz import timezone
 from typing import Annotated
-from sqlalchemy.sql import select
-from datetime import timedelta, datetime
-from src.database.models import send_otps
 from src.auth.utils.logging import logging
 from fastapi import APIRouter, status, Depends
-from src.auth.utils.generator import random_number
 from src.auth.schema.response import ResponseDefault
-from src.auth.utils.database.general import local_time
+from src.auth.utils.otp.general import issue_otp
+from src.auth.utils.database.general import audit_otp_query
 from src.database.connection import database_connection
 from src.auth.utils.jwt.general import get_current_user
-from src.auth.utils.forgot_password.general import send_gmail
+from src.auth.utils.outbox.general import enqueue_email, notify_email_outbox
+from src.auth.utils.circuit_breaker.general import smtp_breaker
+from src.auth.utils.notification.general import render_message
+from src.auth.utils.rate_limit.general import otp_rate_limiter, retry_message
 from src.auth.routers.exceptions import (
     ServiceError,
     FinanceTrackerApiError,
@@ -26,105 +25,67 @@ async def send_otp_email_endpoint(
     current_user: Annotated[dict, Depends(get_current_user)],
 ) -> ResponseDefault:
     response = ResponseDefault()
-    now_utc = datetime.now(timezone("UTC"))
-    generated_otp = str(await random_number(6))
+    # Fail before spending a rate limit token when the mail channel is down.
+    smtp_breaker.ensure_available()
 
     try:
+        if not current_user.email:
+            logging.info("User is not filled email yet.")
+            raise MandatoryInputError(detail="User should add email first.")
+
+        if current_user.verified_email:
+            logging.info("User email  already verified.")
+            raise EntityAlreadyVerifiedError(detail="User email already verified.")
+
+        decision = await otp_rate_limiter.hit(key=str(current_user.user_uuid))
+        if not decision.allowed:
+            logging.info("User OTP request throttled by %s.", decision.reason)
+            raise InvalidOperationError(detail=retry_message(decision=decision))
+
+        logging.info("Matched condition. Sending OTP using email services.")
+        generated_otp = await issue_otp(
+            user_uuid=current_user.user_uuid,
+            channel="email",
+            destination=current_user.email,
+        )
+        if not generated_otp:
+            raise ServiceError(detail="Failed to save OTP.", name="Finance Tracker")
+
         async with database_connection().connect() as session:
             try:
-                query = (
-                    select(send_otps)
-                    .where(send_otps.c.user_uuid == current_user.user_uuid)
-                    .order_by(send_otps.c.created_at.desc())
-                    .with_for_update()
-                )
+                await session.execute(audit_otp_query(user_uuid=current_user.user_uuid))
 
-                result = await session.execute(query)
-                latest_record = result.fetchone()
-                jakarta_timezone = timezone("Asia/Jakarta")
-                times_later_jakarta = latest_record.hit_tomorrow_at.astimezone(
-                    jakarta_timezone
+                email = render_message(
+                    name="otp",
+                    channel="email",
+                    full_name=current_user.full_name,
+                    otp=generated_otp,
+                )
+                await enqueue_email(
+                    session=session,
+                    email_subject=email.subject,
+                    email_receiver=current_user.email,
+                    email_body=email.body,
                 )
-                formatted_time = times_later_jakarta.strftime("%Y-%m-%d %H:%M:%S")
-
-                if not current_user.email:
-                    logging.info("User is not filled email yet.")
-                    raise MandatoryInputError(detail="User should add email first.")
-
-                if latest_record.current_api_hit % 4 == 0:
-                    logging.info("User should only hit API again tomorrow.")
-                    raise InvalidOperationError(
-                        detail=f"Maximum API hit reached. You can try again after {formatted_time}."
-                    )
-
-                if now_utc < latest_record.save_to_hit_at:
-                    logging.info("User should wait API cooldown.")
-                    raise InvalidOperationError(detail="Should wait in 1 minutes.")
-
-                if current_user.verified_email:
-                    logging.info("User email  already verified.")
-                    raise EntityAlreadyVerifiedError(
-                        detail="User email already verified."
-                    )
-
-                if (
-                    now_utc > latest_record.save_to_hit_at
-                    and latest_record.current_api_hit % 4 != 0
-                    or now_utc > latest_record.hit_tomorrow_at
-                    and latest_record.current_api_hit % 4 == 0
-                ):
-                    logging.info("Matched condition. Sending OTP using email services.")
-                    current_api_hit = (
-                        latest_record.current_api_hit + 1
-                        if latest_record.current_api_hit
-                        else 1
-                    )
-                    valid_per_day = (
-                        send_otps.update()
-                        .where(send_otps.c.user_uuid == current_user.user_uuid)
-                        .values(
-                            updated_at=local_time(),
-                            otp_number=generated_otp,
-                            current_api_hit=current_api_hit,
-                            saved_by_system=False,
-                            save_to_hit_at=local_time() + timedelta(minutes=1),
-                            blacklisted_at=local_time() + timedelta(minutes=3),
-                            hit_tomorrow_at=local_time() + timedelta(days=1),
-                        )
-                    )
-
-                    email_body = (
-                        f"Dear <b>{current_user.full_name}</b>,<br><br>"
-                        f"We received a request to verify email address. Please enter the following code to verify your account:<br><br>"
-                        f"Your verification code is <b>{generated_otp}</b>. Please enter this code to complete your verification<br><br>"
-                        f"Please note, that this code will expire in <b>3 minutes</b>.<br>"
-                        f"Thank you,<br><br>"
-                        f"Best regards,<br>"
-                        f"<b>Support Team</b>"
-                    )
-
-                    await send_gmail(
-                        email_subject="OTP Email Verification.",
-                        email_receiver=current_user.email,
-                        email_body=email_body,
-                    )
-
-                    await session.execute(valid_per_day)
-                    response.success = True
-                    response.message = "OTP data sent to email."
+                await session.commit()
+                response.success = True
+                response.message = "OTP data sent to email."
 
             except FinanceTrackerApiError as FTE:
+                await session.rollback()
                 raise FTE
 
             except Exception as E:
-                logging.error(f"Error during send otp email: {E}")
+                logging.error("Error during send otp email: %s", E)
+                await session.rollback()
                 raise ServiceError(
                     detail=f"Service error during send otp email: {E}.",
                     name="Google SMTP",
                 )
             finally:
-                await session.commit()
                 await session.close()
+
+        notify_email_outbox()
     except FinanceTrackerApiError as FTE:
         raise FTE
 
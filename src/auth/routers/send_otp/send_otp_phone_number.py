@@ -1,15 +1,12 @@
-from pytz import timezone
-from sqlalchemy.sql import select
 from fastapi import APIRouter, status
-from datetime import timedelta, datetime
 from src.auth.utils.logging import logging
-from src.database.models import send_otps
 from src.auth.utils.jwt.general import get_user
 from src.auth.utils.validator import check_uuid
-from src.auth.utils.generator import random_number
-from src.auth.utils.database.general import local_time
+from src.auth.utils.otp.general import issue_otp
+from src.auth.utils.database.general import audit_otp_query
 from src.database.connection import database_connection
 from src.auth.schema.response import ResponseDefault, UniqueID
+from src.auth.utils.rate_limit.general import otp_rate_limiter, retry_message
 from src.auth.routers.exceptions import (
     ServiceError,
     FinanceTrackerApiError,
@@ -26,117 +23,67 @@ async def send_otp_phone_number_endpoint(unique_id: str) -> ResponseDefault:
     response = ResponseDefault()
     await check_uuid(unique_id=unique_id)
 
-    now_utc = datetime.now(timezone("UTC"))
     account = await get_user(unique_id=unique_id)
-    generated_otp = str(await random_number(6))
 
     try:
+        if not account:
+            logging.info("User not found.")
+            raise EntityDoesNotExistError(detail="Data not found.")
+
+        if not account.phone_number:
+            logging.info("User should filled phone number yet.")
+            raise MandatoryInputError(detail="User should fill phone number first.")
+
+        if account.verified_phone_number:
+            logging.info("User phone number already verified.")
+            raise EntityAlreadyVerifiedError(
+                detail="User phone number already verified."
+            )
+
+        decision = await otp_rate_limiter.hit(key=unique_id)
+        if not decision.allowed:
+            logging.info("User OTP request throttled by %s.", decision.reason)
+            raise InvalidOperationError(detail=retry_message(decision=decision))
+
+        logging.info("Matched condition. Sending OTP using whatsapp API.")
+        generated_otp = await issue_otp(
+            user_uuid=unique_id,
+            channel="phone_number",
+            destination=account.phone_number,
+        )
+        if not generated_otp:
+            raise ServiceError(detail="Failed to save OTP.", name="Finance Tracker")
+
         async with database_connection().connect() as session:
             try:
-                query = (
-                    select(send_otps)
-                    .where(send_otps.c.user_uuid == unique_id)
-                    .order_by(send_otps.c.created_at.desc())
-                    .with_for_update()
-                )
-
-                result = await session.execute(query)
+                await session.execute(audit_otp_query(user_uuid=unique_id))
 
-                latest_record = result.fetchone()
+                # payload = SendOTPPayload(
+                #     phoneNumber=account.phone_number,
+                #     message=render_message(
+                #         name="otp", channel="whatsapp", otp=generated_otp
+                #     ).body,
+                # )
 
-                if not latest_record:
-                    logging.info("OTP data initialization not found.")
-                    raise EntityDoesNotExistError(detail="Data not found.")
+                # await send_whatsapp_message(payload=payload)
 
-                jakarta_timezone = timezone("Asia/Jakarta")
-                times_later_jakarta = latest_record.hit_tomorrow_at.astimezone(
-                    jakarta_timezone
-                )
-                formatted_time = times_later_jakarta.strftime("%Y-%m-%d %H:%M:%S")
-
-                if not account.phone_number:
-                    logging.info("User should filled phone number yet.")
-                    raise MandatoryInputError(
-                        detail="User should fill phone number first."
-                    )
-
-                if latest_record.current_api_hit % 4 == 0:
-                    logging.info("User should only hit API again tomorrow.")
-                    raise InvalidOperationError(
-                        detail=f"Maximum API hit reached. You can try again after {formatted_time}."
-                    )
-
-                if now_utc < latest_record.save_to_hit_at:
-                    logging.info("User should wait API cooldown.")
-                    raise InvalidOperationError(
-                        detail="Should wait in 1 minutes.",
-                    )
-
-                if not account:
-                    logging.info("Data otp found.")
-                    raise EntityDoesNotExistError(detail="Data not found.")
-
-                if account.verified_phone_number:
-                    logging.info("User phone number already verified.")
-                    raise EntityAlreadyVerifiedError(
-                        detail="User phone number already verified."
-                    )
-
-                if (
-                    now_utc > latest_record.save_to_hit_at
-                    and latest_record.current_api_hit % 4 != 0
-                    or now_utc > latest_record.hit_tomorrow_at
-                    and latest_record.current_api_hit % 4 == 0
-                ):
-                    logging.info("Matched condition. Sending OTP using whatsapp API.")
-                    current_api_hit = (
-                        latest_record.current_api_hit + 1
-                        if latest_record.current_api_hit
-                        else 1
-                    )
-                    valid_per_day = (
-                        send_otps.update()
-                        .where(send_otps.c.user_uuid == unique_id)
-                        .values(
-                            updated_at=local_time(),
-                            otp_number=generated_otp,
-                            current_api_hit=current_api_hit,
-                            saved_by_system=False,
-                            save_to_hit_at=local_time() + timedelta(minutes=1),
-                            blacklisted_at=local_time() + timedelta(minutes=3),
-                            hit_tomorrow_at=local_time() + timedelta(days=1),
-                        )
-                    )
-
-                    # payload = SendOTPPayload(
-                    #     phoneNumber=account.phone_number,
-                    #     message=f"""Your verification code is *{generated_otp}*. Please enter this code to complete your verification. Kindly note that this code will expire in 3 minutes.""",
-                    # )
-
-                    # async with httpx.AsyncClient() as client:
-                    #     whatsapp_response = await client.post(
-                    #         LOCAL_WHATSAPP_API, json=dict(payload)
-                    #     )
-
-                    # if whatsapp_response.status_code != 200:
-                    #     raise ServiceError(detail="Failed to send OTP via WhatsApp.", name="Whatsapp API")
-
-                    await session.execute(valid_per_day)
-                    response.success = True
-                    response.message = "OTP data sent to phone number."
-                    response.data = UniqueID(unique_id=unique_id)
+                await session.commit()
+                response.success = True
+                response.message = "OTP data sent to phone number."
+                response.data = UniqueID(unique_id=unique_id)
 
             except FinanceTrackerApiError as FTE:
+                await session.rollback()
                 raise FTE
 
             except Exception as E:
-                logging.error(f"Error during send otp email: {E}")
+                logging.error("Error during send otp email: %s", E)
+                await session.rollback()
                 raise ServiceError(
                     detail=f"Service error during send otp to phone number: {E}.",
                     name="Whatsapp API",
                 )
             finally:
-                await session.commit()
                 await session.close()
     except FinanceTrackerApiError as FTE:
         raise FTE
@@ -1,78 +1,69 @@
-import httpx
-from pytz import timezone
-from datetime import datetime
 from fastapi import APIRouter, status
-from src.secret import LOCAL_WHATSAPP_API
+from src.auth.utils.whatsapp.general import send_whatsapp_message
+from src.auth.utils.notification.general import render_message
 from src.auth.schema.response import ResponseDefault
 from src.auth.utils.validator import check_uuid, check_pin
 from src.auth.utils.request_format import ForgotPin, SendOTPPayload
-from src.auth.utils.jwt.general import get_user, get_password_hash
-from src.auth.utils.database.general import extract_reset_pin_data, reset_user_pin
+from src.auth.utils.jwt.general import (
+    get_user,
+    get_password_hash,
+    decode_reset_pin_token,
+    verify_reset_pin_nonce,
+)
+from src.auth.utils.database.general import reset_user_pin
 from src.auth.routers.exceptions import (
     ServiceError,
     FinanceTrackerApiError,
     EntityDoesNotMatchedError,
     EntityDoesNotExistError,
-    InvalidOperationError,
+    InvalidTokenError,
 )
 
 router = APIRouter(tags=["users-forgot-pin"], prefix="/users")
 
 
-async def reset_password(schema: ForgotPin, unique_id: str) -> ResponseDefault:
+async def reset_password(schema: ForgotPin, token: str) -> ResponseDefault:
     response = ResponseDefault()
-    await check_uuid(unique_id=unique_id)
     try:
-        account = await get_user(unique_id=unique_id)
+        claims = await decode_reset_pin_token(token=token)
+        unique_id = claims["sub"]
+        await check_uuid(unique_id=unique_id)
 
-        latest_data = await extract_reset_pin_data(user_uuid=unique_id)
-        if not latest_data:
+        account = await get_user(unique_id=unique_id)
+        if not account:
             raise EntityDoesNotExistError(detail="User not found.")
 
-        now_utc = datetime.now(timezone("UTC"))
-
-        if now_utc > latest_data.blacklisted_at:
-            raise InvalidOperationError(detail="Reset pin token expired.")
-
-        if now_utc < latest_data.blacklisted_at:
-            validated_pin = await check_pin(pin=schema.pin)
+        await verify_reset_pin_nonce(claims=claims, hashed_pin=account.pin)
 
-            if schema.pin != schema.confirm_new_pin:
-                raise EntityDoesNotMatchedError(
-                    detail="Passwords is not match.",
-                )
+        validated_pin = await check_pin(pin=schema.pin)
 
-            if schema.pin == schema.confirm_new_pin:
-                payload = SendOTPPayload(
-                    phoneNumber=account.phone_number,
-                    message=(
-                        f"Dear *{account.full_name}*,\n\n"
-                        f"We would like to inform you that your PIN has been successfully changed.\n\n"
-                        f"Please use the following details to log in to your account:\n\n"
-                        f"Phone Number: *{account.phone_number}*\n"
-                        f"New PIN: *{validated_pin}*\n\n"
-                        f"For your security, please ensure you keep this information confidential.\n\n"
-                        f"Should you have any questions or require further assistance, feel free to contact our support team.\n\n"
-                        f"Best regards,\n"
-                        f"*Support Team*"
-                    ),
-                )
+        if schema.pin != schema.confirm_new_pin:
+            raise EntityDoesNotMatchedError(
+                detail="Passwords is not match.",
+            )
 
-                hashed_pin = await get_password_hash(password=schema.pin)
-                await reset_user_pin(user_uuid=unique_id, changed_pin=hashed_pin)
+        payload = SendOTPPayload(
+            phoneNumber=account.phone_number,
+            message=render_message(
+                name="pin_reset",
+                channel="whatsapp",
+                full_name=account.full_name,
+                phone_number=account.phone_number,
+                pin=validated_pin,
+            ).body,
+        )
 
-                async with httpx.AsyncClient() as client:
-                    whatsapp_response = await client.post(
-                        LOCAL_WHATSAPP_API, json=dict(payload)
-                    )
+        hashed_pin = await get_password_hash(password=schema.pin)
+        is_reset = await reset_user_pin(
+            user_uuid=unique_id, changed_pin=hashed_pin, current_pin=account.pin
+        )
+        if not is_reset:
+            raise InvalidTokenError(detail="Reset pin link already used.")
 
-                if whatsapp_response.status_code != 200:
-                    raise ServiceError(
-                        detail="Failed to send OTP via WhatsApp.", name="Whatsapp API"
-                    )
+        await send_whatsapp_message(payload=payload)
 
-                response.success = True
-                response.message = "Pin successfully reset."
+        response.success = True
+        response.message = "Pin successfully reset."
 
     except FinanceTrackerApiError as FTE:
         raise FTE
@@ -84,7 +75,7 @@ async def reset_password(schema: ForgotPin, unique_id: str) -> ResponseDefault:
 
 router.add_api_route(
     methods=["PATCH"],
-    path="/reset-pin/{unique_id}",
+    path="/reset-pin/{token}",
     response_model=ResponseDefault,
     endpoint=reset_password,
     status_code=status.HTTP_200_OK,
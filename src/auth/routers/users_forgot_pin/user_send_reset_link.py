@@ -1,13 +1,13 @@
-import httpx
-from pytz import timezone
 from fastapi import APIRouter, status
-from datetime import datetime, timedelta
-from src.secret import LOCAL_WHATSAPP_API
 from src.auth.utils.logging import logging
+from src.auth.utils.whatsapp.general import send_whatsapp_message
+from src.auth.utils.notification.general import render_message
+from src.auth.utils.circuit_breaker.general import smtp_breaker, whatsapp_breaker
 from src.auth.utils.validator import check_uuid
-from src.auth.utils.jwt.general import get_user
+from src.auth.utils.jwt.general import get_user, create_reset_pin_token
+from src.auth.utils.rate_limit.general import reset_link_rate_limiter, retry_message
 from src.auth.schema.response import ResponseDefault, UniqueID
-from src.auth.utils.forgot_password.general import send_gmail
+from src.auth.utils.outbox.general import queue_email, notify_email_outbox
 from src.auth.utils.request_format import SendVerificationLink, SendOTPPayload
 from src.auth.routers.exceptions import (
     ServiceError,
@@ -16,10 +16,6 @@ from src.auth.routers.exceptions import (
     EntityDoesNotExistError,
     InvalidOperationError,
 )
-from src.auth.utils.database.general import (
-    save_reset_pin_data,
-    extract_reset_pin_data,
-)
 
 router = APIRouter(tags=["users-forgot-pin"], prefix="/users")
 
@@ -36,8 +32,6 @@ async def send_reset_link_endpoint(
         if not account:
             raise EntityDoesNotExistError(detail="Account not found.")
 
-        reset_link = f"http://localhost:8000/api/v1/users/reset-pin/{unique_id}"
-
         if schema.method == schema.method.EMAIL:
             if not account.verified_email and account.email:
                 logging.info("User email is not verified.")
@@ -49,77 +43,12 @@ async def send_reset_link_endpoint(
                 logging.info("User is not input email yet.")
                 raise MandatoryInputError(detail="User should add email first.")
 
+            smtp_breaker.ensure_available()
+
             if not account.pin:
                 logging.info("User is not created pin.")
                 raise MandatoryInputError(detail="User should create pin first.")
 
-            if account.verified_email:
-                logging.info("User account email validated.")
-
-                email_body = (
-                    f"Dear {account.email},<br><br>"
-                    f"We received a request to reset your password. Please click the link below to create a new password:<br><br>"
-                    f'<a href="{reset_link}">Reset Password</a><br><br>'
-                    f"Please note, this password reset link is only valid for <b>5 minutes</b>. If you did not request a password reset, please ignore this email.<br>"
-                    f"Thank you,<br><br>"
-                    f"Best regards,<br>"
-                    f"<b>Support Team</b>"
-                )
-
-                latest_reset_pin_data = await extract_reset_pin_data(
-                    user_uuid=unique_id
-                )
-
-                if not latest_reset_pin_data:
-                    logging.info("Initialized send reset password link via email.")
-
-                    await save_reset_pin_data(user_uuid=unique_id, email=account.email)
-
-                    await send_gmail(
-                        email_subject="Reset Password",
-                        email_receiver=account.email,
-                        email_body=email_body,
-                    )
-
-                    response.success = True
-                    response.message = "Password reset link sent to email."
-                    response.data = UniqueID(unique_id=unique_id)
-
-                now_utc = datetime.now(timezone("UTC"))
-                jakarta_timezone = timezone("Asia/Jakarta")
-                blacklist_time = now_utc + timedelta(minutes=1)
-                if (
-                    latest_reset_pin_data is None
-                    or latest_reset_pin_data.save_to_hit_at is None
-                ):
-                    valid_blacklist_time = blacklist_time
-                else:
-                    valid_blacklist_time = latest_reset_pin_data.save_to_hit_at
-                times_later_jakarta = valid_blacklist_time.astimezone(jakarta_timezone)
-                formatted_time = times_later_jakarta.strftime("%Y-%m-%d %H:%M:%S")
-
-                if latest_reset_pin_data is not None and now_utc < valid_blacklist_time:
-                    logging.info("User should wait API cooldown.")
-                    raise InvalidOperationError(
-                        detail=f"Should wait until {formatted_time}."
-                    )
-
-                if now_utc >= valid_blacklist_time:
-                    logging.info("Saved new reset pin request data.")
-
-                    await send_gmail(
-                        email_subject="Reset Password",
-                        email_receiver=account.email,
-                        email_body=email_body,
-                    )
-
-                    response.success = True
-                    response.message = "Password reset link sent to email."
-                    response.data = UniqueID(unique_id=unique_id)
-
-                return response
-            return response
-
         if schema.method == schema.method.PHONE_NUMBER:
             if not account.pin:
                 logging.info("User is not created pin.")
@@ -137,94 +66,64 @@ async def send_reset_link_endpoint(
                 logging.info("User phone number empty.")
                 raise InvalidOperationError(detail="User is not added phone number.")
 
-            if account.verified_phone_number is True:
-                logging.info("User phone number validated.")
-
-                payload = SendOTPPayload(
-                    phoneNumber=account.phone_number,
-                    message=(
-                        f"Dear *{account.full_name}*,\n\n"
-                        f"We received a request to reset your password. Please click the link below to create a new password:\n\n"
-                        f"{reset_link}\n\n"
-                        f"Please note, this password reset link is only valid for *5 minutes*. If you did not request a password reset, please ignore this message.\n\n"
-                        f"Thank you,\n\n"
-                        f"Best regards,\n"
-                        "*Support Team*"
-                    ),
-                )
+            whatsapp_breaker.ensure_available()
+
+        decision = await reset_link_rate_limiter.hit(key=unique_id)
+        if not decision.allowed:
+            logging.info("User should wait API cooldown.")
+            raise InvalidOperationError(detail=retry_message(decision=decision))
+
+        token = await create_reset_pin_token(
+            user_uuid=unique_id, hashed_pin=account.pin
+        )
+        reset_link = f"http://localhost:8000/api/v1/users/reset-pin/{token}"
 
-                latest_reset_pin_data = await extract_reset_pin_data(
-                    user_uuid=unique_id
+        if schema.method == schema.method.EMAIL:
+            logging.info("Send reset password link via email.")
+            email = render_message(
+                name="reset_link",
+                channel="email",
+                email=account.email,
+                reset_link=reset_link,
+            )
+            is_queued = await queue_email(
+                email_subject=email.subject,
+                email_receiver=account.email,
+                email_body=email.body,
+            )
+
+            if not is_queued:
+                raise ServiceError(
+                    detail="Failed to queue reset link email.",
+                    name="Finance Tracker",
                 )
 
-                if not latest_reset_pin_data:
-                    logging.info(
-                        "Initialized send reset password link via phone nnumber."
-                    )
-
-                    await save_reset_pin_data(user_uuid=unique_id, email=account.email)
-
-                    async with httpx.AsyncClient() as client:
-                        whatsapp_response = await client.post(
-                            LOCAL_WHATSAPP_API, json=dict(payload)
-                        )
-
-                    if whatsapp_response.status_code != 200:
-                        raise ServiceError(
-                            detail="Failed to send OTP via WhatsApp.",
-                            name="Whatsapp API",
-                        )
-
-                    response.success = True
-                    response.message = "Password reset link sent to phone number."
-                    response.data = UniqueID(unique_id=unique_id)
-
-                now_utc = datetime.now(timezone("UTC"))
-                jakarta_timezone = timezone("Asia/Jakarta")
-                blacklist_time = now_utc + timedelta(minutes=1)
-                if (
-                    latest_reset_pin_data is None
-                    or latest_reset_pin_data.save_to_hit_at is None
-                ):
-                    valid_blacklist_time = blacklist_time
-                else:
-                    valid_blacklist_time = latest_reset_pin_data.save_to_hit_at
-                times_later_jakarta = valid_blacklist_time.astimezone(jakarta_timezone)
-                formatted_time = times_later_jakarta.strftime("%Y-%m-%d %H:%M:%S")
-
-                if latest_reset_pin_data is not None and now_utc < valid_blacklist_time:
-                    logging.info("User should wait API cooldown.")
-                    raise InvalidOperationError(
-                        detail=f"Should wait until {formatted_time}."
-                    )
-
-                if now_utc >= valid_blacklist_time:
-                    logging.info("Saved new reset pin request data.")
-
-                    await save_reset_pin_data(user_uuid=unique_id, email=account.email)
-
-                    async with httpx.AsyncClient() as client:
-                        whatsapp_response = await client.post(
-                            LOCAL_WHATSAPP_API, json=dict(payload)
-                        )
-
-                    if whatsapp_response.status_code != 200:
-                        raise ServiceError(
-                            detail="Failed to send OTP via WhatsApp.",
-                            name="Whatsapp API",
-                        )
-
-                    response.success = True
-                    response.message = "Password reset link sent to phone number."
-                    response.data = UniqueID(unique_id=unique_id)
-
-                return response
-            return response
+            notify_email_outbox()
+            response.message = "Password reset link sent to email."
+
+        if schema.method == schema.method.PHONE_NUMBER:
+            logging.info("Send reset password link via phone number.")
+            payload = SendOTPPayload(
+                phoneNumber=account.phone_number,
+                message=render_message(
+                    name="reset_link",
+                    channel="whatsapp",
+                    full_name=account.full_name,
+                    reset_link=reset_link,
+                ).body,
+            )
+
+            await send_whatsapp_message(payload=payload)
+            response.message = "Password reset link sent to phone number."
+
+        response.success = True
+        response.data = UniqueID(unique_id=unique_id)
     except FinanceTrackerApiError as FTE:
         raise FTE
 
     except Exception as E:
         raise ServiceError(detail=f"Service error: {E}.", name="Finance Tracker")
+    return response
 
 
 router.add_api_route(
@@ -1,16 +1,10 @@
 from typing import Annotated
 from src.auth.utils.logging import logging
 from fastapi import APIRouter, status, Depends
-from src.database.models import blacklist_tokens
 from src.auth.schema.response import ResponseDefault
-from src.auth.utils.jwt.general import get_current_user
 from src.database.connection import database_connection
-from src.auth.utils.database.general import (
-    local_time,
-    is_refresh_token_blacklisted,
-    is_access_token_blacklisted,
-    extract_tokens,
-)
+from src.auth.utils.database.general import logout_session_query
+from src.auth.utils.jwt.general import get_session_id
 from src.auth.routers.exceptions import (
     ServiceError,
     DatabaseError,
@@ -22,37 +16,30 @@ router = APIRouter(tags=["users-general"], prefix="/users")
 
 
 async def user_logout(
-    current_user: Annotated[dict, Depends(get_current_user)],
+    session_id: Annotated[str, Depends(get_session_id)],
 ) -> ResponseDefault:
     response = ResponseDefault()
     try:
-        token_data = await extract_tokens(user_uuid=current_user.user_uuid)
-
-        validate_refresh_token = await is_refresh_token_blacklisted(
-            refresh_token=token_data.refresh_token
-        )
-        validate_access_token = await is_access_token_blacklisted(
-            access_token=token_data.access_token
-        )
-
-        if validate_refresh_token is True or validate_access_token is True:
-            raise InvalidTokenError(detail="Token already blacklisted.")
-
         async with database_connection().connect() as session:
             try:
-                query = blacklist_tokens.insert().values(
-                    blacklisted_at=local_time(),
-                    user_uuid=current_user.user_uuid,
-                    access_token=token_data.access_token,
-                    refresh_token=token_data.refresh_token,
+                # The signed token is the authentication; this one statement
+                # both checks the session is live and revokes it.
+                result = await session.execute(
+                    logout_session_query(session_id=session_id)
                 )
-                await session.execute(query)
+                logged_out = result.fetchone()
+                if logged_out is None:
+                    raise InvalidTokenError(detail="Token already blacklisted.")
+
                 await session.commit()
-                logging.info(f"User {current_user.full_name} logged out successfully.")
+                logging.info("User %s logged out successfully.", logged_out.user_uuid)
                 response.message = "Logout successful."
                 response.success = True
+            except FinanceTrackerApiError as FTE:
+                await session.rollback()
+                raise FTE
             except Exception as E:
-                logging.error(f"Error during logout: {E}.")
+                logging.error("Error during logout: %s.", E)
                 await session.rollback()
                 raise DatabaseError(
                     detail=f"Database error: {E}.",
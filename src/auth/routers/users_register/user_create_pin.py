@@ -1,20 +1,19 @@
-from datetime import timedelta
 from fastapi import APIRouter, status
 from src.auth.utils.logging import logging
 from src.auth.utils.request_format import UserPin
 from src.auth.schema.response import ResponseToken
 from src.auth.utils.validator import check_uuid, check_pin
 from src.auth.utils.database.general import update_user_pin
-from src.auth.utils.forgot_password.general import send_gmail
-from src.secret import ACCESS_TOKEN_EXPIRED, REFRESH_TOKEN_EXPIRED
+from src.auth.utils.outbox.general import outbox_email_query, notify_email_outbox
+from src.auth.utils.notification.general import render_message
 from src.auth.utils.jwt.general import (
     get_user,
     get_password_hash,
-    create_access_token,
-    create_refresh_token,
+    start_session,
 )
 from src.auth.routers.exceptions import (
     ServiceError,
+    DatabaseError,
     FinanceTrackerApiError,
     MandatoryInputError,
     EntityDoesNotExistError,
@@ -41,59 +40,48 @@ async def create_user_pin(pin: UserPin, unique_id: str) -> ResponseToken:
 
         validated_pin = await check_pin(pin=pin.pin)
         hashed_pin = await get_password_hash(password=validated_pin)
-        await update_user_pin(user_uuid=unique_id, pin=hashed_pin)
 
+        outbox_query = None
         if account.verified_email:
             logging.info("Send account information to email.")
-            email_body = (
-                f"Dear {account.full_name},<br><br>"
-                f"We are pleased to inform you that your new account has been successfully created.<br><br>"
-                f"You can now log in using the following credentials:<br><br>"
-                f"Phone Number: <strong>{account.phone_number}</strong><br>"
-                f"PIN: <strong>{validated_pin}</strong><br><br>"
-                f"Thank you.<br><br>"
-                f"Best regards,<br>"
-                f"Support Team"
+            email = render_message(
+                name="welcome",
+                channel="email",
+                full_name=account.full_name,
+                phone_number=account.phone_number,
             )
 
-            await send_gmail(
-                email_subject="Success Registered New Finance Tracker Account!",
+            outbox_query = outbox_email_query(
+                email_subject=email.subject,
                 email_receiver=account.email,
-                email_body=email_body,
+                email_body=email.body,
             )
 
+        is_updated = await update_user_pin(
+            user_uuid=unique_id, pin=hashed_pin, outbox_query=outbox_query
+        )
+        if not is_updated:
+            raise DatabaseError(detail="Failed to save user pin.")
+
+        if outbox_query is not None:
+            notify_email_outbox()
+
         # elif account.verified_phone_number:
         # logging.info("Send account information to phone number.")
         # payload = SendOTPPayload(
         #     phoneNumber=account.phone_number,
-        #     message=(
-        #         f"Dear *{account.full_name}*,\n\n"
-        #         "We are pleased to inform you that your phone number has been successfully verified. "
-        #         "You can now log in using the following credentials:\n\n"
-        #         f"Phone Number: *{account.phone_number}*\n"
-        #         f"PIN: *{validated_pin}*\n\n"
-        #         "Please ensure that you keep your account information secure.\n\n"
-        #         "Best Regards,\n"
-        #         "*Support Team*"
-        #     ),
+        #     message=render_message(
+        #         name="welcome",
+        #         channel="whatsapp",
+        #         full_name=account.full_name,
+        #         phone_number=account.phone_number,
+        #         pin=validated_pin,
+        #     ).body,
         # )
 
-        # async with httpx.AsyncClient() as client:
-        #     whatsapp_response = await client.post(
-        #         LOCAL_WHATSAPP_API, json=dict(payload)
-        #     )
+        # await send_whatsapp_message(payload=payload)
 
-        # if whatsapp_response.status_code != 200:
-        #     raise ServiceError(detail="Failed to send OTP via WhatsApp.", name="Whatsapp API")
-
-        access_token = await create_access_token(
-            data={"sub": unique_id},
-            access_token_expires=timedelta(minutes=int(ACCESS_TOKEN_EXPIRED)),
-        )
-        refresh_token = await create_refresh_token(
-            data={"sub": unique_id},
-            refresh_token_expires=timedelta(minutes=int(REFRESH_TOKEN_EXPIRED)),
-        )
+        access_token, refresh_token = await start_session(user_uuid=unique_id)
         response.access_token = access_token
         response.refresh_token = refresh_token
     except FinanceTrackerApiError as FTE:
@@ -16,8 +16,6 @@ from src.auth.routers.exceptions import (
 from src.auth.utils.database.general import (
     is_using_registered_phone_number,
     is_using_registered_email,
-    extract_data_otp,
-    save_otp_data,
 )
 
 router = APIRouter(tags=["users-register"], prefix="/users")
@@ -49,8 +47,6 @@ async def register_user(schema: CreateUser) -> ResponseDefault:
         if registered_email:
             raise EntityAlreadyExistError(detail="Email already registered.")
 
-        initial_data = await extract_data_otp(user_uuid=user_uuid)
-
         logging.info("Creating new user.")
 
         fullname = await check_fullname(value=schema.full_name)
@@ -69,21 +65,12 @@ async def register_user(schema: CreateUser) -> ResponseDefault:
                 response.message = "Register account success."
                 response.success = True
             except Exception as E:
-                logging.error(f"Error during creating account: {E}.")
+                logging.error("Error during creating account: %s.", E)
                 await session.rollback()
                 raise DatabaseError(detail=f"Database error: {E}.")
             finally:
                 await session.close()
 
-        if not initial_data:
-            logging.info("Initialized OTP save data.")
-            await save_otp_data(
-                user_uuid=user_uuid,
-                current_api_hit=1,
-                saved_by_system=True,
-                save_to_hit_at=local_time(),
-            )
-
         response.success = True
         response.message = "Account successfully created."
         response.data = UniqueID(unique_id=user_uuid)
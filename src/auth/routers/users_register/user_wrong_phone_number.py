@@ -13,10 +13,8 @@ from src.auth.routers.exceptions import (
     EntityDoesNotExistError,
     EntityAlreadyFilledError,
 )
-from src.auth.utils.database.general import (
-    update_user_phone_number,
-    update_otp_data,
-)
+from src.auth.utils.ephemeral.general import update_otp_data
+from src.auth.utils.database.general import update_user_phone_number
 
 router = APIRouter(tags=["users-register"], prefix="/users")
 
@@ -0,0 +1,35 @@
+from uuid import UUID
+from datetime import datetime
+from sqlalchemy import Table, Column
+from dataclasses import dataclass, fields
+
+
+@dataclass(slots=True)
+class MoneySpendRow:
+    id: int
+    created_at: datetime
+    updated_at: datetime | None
+    user_uuid: UUID
+    spend_day: int
+    spend_month: int
+    spend_year: int
+    category: str
+    description: str
+    amount: int
+
+
+@dataclass(slots=True)
+class MoneySpendSchemaRow:
+    id: int
+    created_at: datetime
+    updated_at: datetime | None
+    user_uuid: UUID
+    month: int
+    year: int
+    category: str
+    budget: int
+
+
+def row_columns(row_model: type, table: Table) -> list[Column]:
+    """table columns in the field order of row_model, so rows map positionally."""
+    return [table.c[field.name] for field in fields(row_model)]
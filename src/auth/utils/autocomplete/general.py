@@ -0,0 +1,138 @@
+import bisect
+import asyncio
+from collections import OrderedDict
+from uuid_extensions import uuid7
+from src.auth.utils.logging import logging
+from src.secret import CATEGORY_INDEX_MAX_USERS
+from src.auth.utils.database.general import extract_category_counts
+
+
+class CategoryIndex:
+    """sorted category names of one user, searchable by case-insensitive prefix."""
+
+    def __init__(self, category_counts: dict[str, int]) -> None:
+        self.counts = dict(category_counts)
+        self.keys = sorted((category.casefold(), category) for category in self.counts)
+
+    def add(self, category: str) -> None:
+        if category in self.counts:
+            self.counts[category] += 1
+            return
+
+        self.counts[category] = 1
+        bisect.insort(self.keys, (category.casefold(), category))
+
+    def remove(self, category: str) -> None:
+        total = self.counts.get(category)
+        if not total:
+            return
+
+        if total > 1:
+            self.counts[category] = total - 1
+            return
+
+        del self.counts[category]
+        key = (category.casefold(), category)
+        position = bisect.bisect_left(self.keys, key)
+        if position < len(self.keys) and self.keys[position] == key:
+            del self.keys[position]
+
+    def suggest(self, prefix: str, limit: int = 10) -> list[str]:
+        folded_prefix = prefix.casefold()
+        position = bisect.bisect_left(self.keys, (folded_prefix,))
+        suggestions = []
+
+        for folded_category, category in self.keys[position : position + limit]:
+            if not folded_category.startswith(folded_prefix):
+                break
+            suggestions.append(category)
+
+        return suggestions
+
+
+class CategoryAutocomplete:
+    """per-user category indexes built lazily and bounded by an LRU across users."""
+
+    def __init__(self, max_users: int = int(CATEGORY_INDEX_MAX_USERS)) -> None:
+        self.max_users = max_users
+        self.indexes: OrderedDict[str, CategoryIndex] = OrderedDict()
+        self.building: dict[str, asyncio.Task] = {}
+        self.stale: set[str] = set()
+
+    async def build_index(self, user_uuid: str) -> CategoryIndex | None:
+        data = await extract_category_counts(user_uuid=user_uuid)
+        if data is None:
+            return None
+        return CategoryIndex({row.category: row.total for row in data})
+
+    async def get_index(self, user_uuid: uuid7) -> CategoryIndex | None:
+        key = str(user_uuid)
+        index = self.indexes.get(key)
+        if index is not None:
+            self.indexes.move_to_end(key)
+            return index
+
+        task = self.building.get(key)
+        if task is None:
+            logging.info("Building category autocomplete index.")
+            task = asyncio.create_task(self.build_index(user_uuid=key))
+            self.building[key] = task
+            self.stale.discard(key)
+
+        try:
+            index = await asyncio.shield(task)
+        finally:
+            if self.building.get(key) is task and task.done():
+                del self.building[key]
+
+        if index is None:
+            return None
+
+        if key in self.stale:
+            # A schema write landed while the index was being built. Serve the
+            # result once but build again on the next access.
+            return index
+
+        self.indexes[key] = index
+        self.indexes.move_to_end(key)
+        while len(self.indexes) > self.max_users:
+            self.indexes.popitem(last=False)
+        return index
+
+    async def suggest(self, user_uuid: uuid7, prefix: str, limit: int = 10) -> list:
+        index = await self.get_index(user_uuid=user_uuid)
+        if index is None:
+            return []
+        return index.suggest(prefix=prefix, limit=limit)
+
+    def add_category(self, user_uuid: uuid7, category: str) -> None:
+        key = str(user_uuid)
+        if key in self.building:
+            self.stale.add(key)
+
+        index = self.indexes.get(key)
+        if index is not None:
+            index.add(category=category)
+
+    def remove_category(self, user_uuid: uuid7, category: str) -> None:
+        key = str(user_uuid)
+        if key in self.building:
+            self.stale.add(key)
+
+        index = self.indexes.get(key)
+        if index is not None:
+            index.remove(category=category)
+
+    def rename_category(
+        self,
+        user_uuid: uuid7,
+        category: str,
+        changed_category_into: str,
+        total: int = 1,
+    ) -> None:
+        for _ in range(total):
+            self.remove_category(user_uuid=user_uuid, category=category)
+            self.add_category(user_uuid=user_uuid, category=changed_category_into)
+
+
+category_autocomplete = CategoryAutocomplete()
@@ -0,0 +1,40 @@
+import asyncio
+from typing import Coroutine
+from src.auth.utils.logging import logging
+
+background_tasks: dict[str, asyncio.Task] = {}
+
+
+def log_task_result(task: asyncio.Task) -> None:
+    background_tasks.pop(task.get_name(), None)
+
+    if task.cancelled():
+        logging.info("Background task %s cancelled.", task.get_name())
+        return
+
+    if task.exception():
+        logging.error(
+            "Background task %s stopped with error: %s.",
+            task.get_name(),
+            task.exception(),
+        )
+
+
+def start_background_task(name: str, coroutine: Coroutine) -> asyncio.Task:
+    if name in background_tasks:
+        coroutine.close()
+        return background_tasks[name]
+
+    task = asyncio.create_task(coroutine, name=name)
+    task.add_done_callback(log_task_result)
+    background_tasks[name] = task
+    logging.info("Background task %s started.", name)
+    return task
+
+
+async def stop_background_tasks() -> None:
+    tasks = list(background_tasks.values())
+    for task in tasks:
+        task.cancel()
+
+    await asyncio.gather(*tasks, return_exceptions=True)
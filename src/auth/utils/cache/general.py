@@ -0,0 +1,80 @@
+from collections import OrderedDict
+from uuid_extensions import uuid7
+from src.secret import RESPONSE_CACHE_MAX_BYTES
+from src.auth.utils.metrics.general import register_metrics
+
+MONTH_ENDPOINTS = ("list-category", "list-spending")
+
+
+class MonthResponseCache:
+    """
+    LRU of serialized month listings bounded by total body size. Every entry
+    keeps the month version it was built from, so a write committed by
+    another worker is detected on the next lookup.
+    """
+
+    def __init__(self, max_bytes: int = int(RESPONSE_CACHE_MAX_BYTES)) -> None:
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.entries: OrderedDict[tuple, tuple[int, bytes]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(
+        self, user_uuid: uuid7, year: int, month: int, endpoint: str, version: int
+    ) -> bytes | None:
+        key = (str(user_uuid), year, month, endpoint)
+        entry = self.entries.get(key)
+        if entry is None or entry[0] != version:
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(
+        self,
+        user_uuid: uuid7,
+        year: int,
+        month: int,
+        endpoint: str,
+        version: int,
+        body: bytes,
+    ) -> None:
+        if len(body) > self.max_bytes // 8:
+            return
+
+        key = (str(user_uuid), year, month, endpoint)
+        self.discard(key=key)
+        self.entries[key] = (version, body)
+        self.size += len(body)
+
+        while self.size > self.max_bytes:
+            _, (_, evicted) = self.entries.popitem(last=False)
+            self.size -= len(evicted)
+            self.evictions += 1
+
+    def discard(self, key: tuple) -> None:
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry[1])
+
+    def invalidate(self, user_uuid: uuid7, year: int, month: int) -> None:
+        for endpoint in MONTH_ENDPOINTS:
+            self.discard(key=(str(user_uuid), year, month, endpoint))
+
+    def metrics(self) -> dict:
+        return {
+            "entries": len(self.entries),
+            "bytes": self.size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+month_response_cache = MonthResponseCache()
+register_metrics(name="month_response_cache", collector=month_response_cache.metrics)
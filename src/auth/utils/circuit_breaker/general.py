@@ -0,0 +1,144 @@
+import time
+import asyncio
+import aiosmtplib
+from typing import Awaitable, Callable, TypeVar
+from src.auth.utils.logging import logging
+from src.auth.utils.metrics.general import register_metrics
+from src.auth.routers.exceptions import ServiceError, ServiceUnavailableError
+from src.secret import (
+    SMTP_BREAKER_FAILURES,
+    SMTP_BREAKER_RECOVERY,
+    SMTP_SEND_TIMEOUT,
+    WHATSAPP_BREAKER_FAILURES,
+    WHATSAPP_BREAKER_RECOVERY,
+    WHATSAPP_TIMEOUT,
+)
+
+T = TypeVar("T")
+
+
+class CircuitBreaker:
+    """
+    Stop calling a failing channel. After `failure_threshold` consecutive
+    failures the circuit opens and calls fail at once. Once
+    `recovery_timeout` seconds passed a single probe is let through
+    (half-open): success closes the circuit, failure opens it again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30,
+        timeout: float = 10,
+        excluded_exceptions: tuple[type[Exception], ...] = (),
+    ) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.timeout = timeout
+        self.excluded_exceptions = excluded_exceptions
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+        self.total_failures = 0
+        self.total_rejected = 0
+        self.times_opened = 0
+
+    def retry_after(self) -> float:
+        return max(self.opened_at + self.recovery_timeout - time.monotonic(), 0)
+
+    def is_open(self) -> bool:
+        """true while calls would be rejected, without reserving a probe."""
+        if self.state == "open":
+            return self.retry_after() > 0
+        return self.state == "half_open" and self.probing
+
+    def ensure_available(self) -> None:
+        if self.is_open():
+            self.total_rejected += 1
+            raise ServiceUnavailableError(
+                detail=f"Service is temporarily unavailable, try again in {int(self.retry_after()) + 1} seconds.",
+                name=self.name,
+            )
+
+    def before_call(self) -> None:
+        self.ensure_available()
+        if self.state == "open":
+            logging.info("Circuit %s half-open, probing.", self.name)
+            self.state = "half_open"
+
+        if self.state == "half_open":
+            self.probing = True
+
+    def record_success(self) -> None:
+        if self.state != "closed":
+            logging.info("Circuit %s closed.", self.name)
+        self.state = "closed"
+        self.failures = 0
+        self.probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self.total_failures += 1
+        self.probing = False
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            if self.state != "open":
+                logging.warning("Circuit %s opened.", self.name)
+                self.times_opened += 1
+            self.state = "open"
+            self.opened_at = time.monotonic()
+
+    async def call(self, function: Callable[..., Awaitable[T]], *args, **kwargs) -> T:
+        self.before_call()
+        try:
+            result = await asyncio.wait_for(function(*args, **kwargs), self.timeout)
+        except asyncio.TimeoutError:
+            self.record_failure()
+            raise ServiceError(
+                detail=f"No response within {self.timeout} seconds.", name=self.name
+            )
+        except self.excluded_exceptions:
+            self.record_success()
+            raise
+        except BaseException as E:
+            if isinstance(E, asyncio.CancelledError):
+                self.probing = False
+            else:
+                self.record_failure()
+            raise
+
+        self.record_success()
+        return result
+
+    def metrics(self) -> dict:
+        return {
+            "state": "open" if self.is_open() else self.state,
+            "consecutive_failures": self.failures,
+            "failures": self.total_failures,
+            "rejected": self.total_rejected,
+            "opened": self.times_opened,
+            "retry_after": round(self.retry_after(), 2) if self.state == "open" else 0,
+        }
+
+
+smtp_breaker = CircuitBreaker(
+    name="Google SMTP",
+    failure_threshold=int(SMTP_BREAKER_FAILURES),
+    recovery_timeout=float(SMTP_BREAKER_RECOVERY),
+    timeout=float(SMTP_SEND_TIMEOUT),
+    excluded_exceptions=(aiosmtplib.SMTPRecipientsRefused,),
+)
+whatsapp_breaker = CircuitBreaker(
+    name="Whatsapp API",
+    failure_threshold=int(WHATSAPP_BREAKER_FAILURES),
+    recovery_timeout=float(WHATSAPP_BREAKER_RECOVERY),
+    timeout=float(WHATSAPP_TIMEOUT),
+)
+register_metrics(
+    name="circuit_breakers",
+    collector=lambda: {
+        breaker.name: breaker.metrics() for breaker in (smtp_breaker, whatsapp_breaker)
+    },
+)
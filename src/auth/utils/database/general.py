@@ -1,20 +1,25 @@
 from pytz import timezone
 from pydantic import EmailStr
-from sqlalchemy import select
+from sqlalchemy import select, func, case
 from uuid_extensions import uuid7
 from sqlalchemy.engine.row import Row
-from sqlalchemy.sql.schema import Table
-from sqlalchemy.sql import and_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.sql.schema import Table, Column
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql import and_, update, tuple_
 from datetime import datetime, timedelta
 from src.auth.utils.logging import logging
+from src.auth.utils.cache.general import month_response_cache
+from typing import Iterable
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects.postgresql import insert, Insert
+from sqlalchemy.sql.dml import Insert as BaseInsert, Update
 from src.database.models import (
     money_spend_schemas,
     money_spends,
+    month_versions,
     users,
-    blacklist_tokens,
-    user_tokens,
-    reset_pins,
+    user_sessions,
     send_otps,
 )
 from src.database.connection import database_connection
@@ -25,29 +30,152 @@ def local_time(zone: str = "UTC") -> datetime:
     return time
 
 
+def is_duplicate_category(error: Exception) -> bool:
+    """True when `error` is a write hitting the schema period category index."""
+    return isinstance(error, IntegrityError) and (
+        "uq_money_spend_schemas_user_period_category" in str(error.orig)
+    )
+
+
+def between_period(
+    year_column: Column,
+    month_column: Column,
+    month: int,
+    year: int,
+    end_month: int,
+    end_year: int,
+) -> ColumnElement:
+    period = tuple_(year_column, month_column)
+    return and_(period >= tuple_(year, month), period <= tuple_(end_year, end_month))
+
+
+def bump_versions_query(keys: Iterable[tuple[uuid7, int, int]]) -> Insert:
+    query = insert(month_versions).values(
+        [
+            {
+                "updated_at": local_time(),
+                "user_uuid": user_uuid,
+                "month": month,
+                "year": year,
+                "version": 1,
+            }
+            for user_uuid, month, year in sorted(set(keys), key=str)
+        ]
+    )
+    return query.on_conflict_do_update(
+        index_elements=["user_uuid", "year", "month"],
+        set_={"updated_at": local_time(), "version": month_versions.c.version + 1},
+    )
+
+
+def month_schemas_query(
+    user_uuid: uuid7, month: int, year: int, categories: dict[str, int]
+) -> Insert:
+    """multi-row insert of category budgets into one month; callers add ON CONFLICT."""
+    return insert(money_spend_schemas).values(
+        [
+            {
+                "created_at": local_time(),
+                "updated_at": None,
+                "user_uuid": user_uuid,
+                "month": month,
+                "year": year,
+                "category": category,
+                "budget": budget,
+            }
+            for category, budget in categories.items()
+        ]
+    )
+
+
+async def bump_month_versions(
+    session: AsyncSession, user_uuid: uuid7, periods: Iterable[tuple[int, int]]
+) -> None:  # used
+    keys = [(user_uuid, month, year) for month, year in periods]
+    if keys:
+        await session.execute(bump_versions_query(keys=keys))
+
+    for month, year in periods:
+        month_response_cache.invalidate(user_uuid=user_uuid, year=year, month=month)
+
+
+async def extract_month_version(
+    user_uuid: uuid7, month: int, year: int
+) -> int | None:  # used
+    try:
+        async with database_connection().connect() as session:
+            try:
+                query = select(month_versions.c.version).where(
+                    and_(
+                        month_versions.c.user_uuid == user_uuid,
+                        month_versions.c.year == year,
+                        month_versions.c.month == month,
+                    )
+                )
+                result = await session.execute(query)
+                version = result.scalar()
+                return version or 0
+            except Exception as E:
+                logging.error("Error during extract_month_version: %s.", E)
+                await session.rollback()
+            finally:
+                await session.close()
+    except Exception as E:
+        logging.error("Error after extract_month_version: %s.", E)
+    return None
+
+
 async def filter_spesific_category(user_uuid: uuid7, category: str) -> bool:  # used
     try:
         async with database_connection().connect() as session:
             try:
                 logging.info("Connected PostgreSQL to perform filter spesific category")
-                query = select(money_spend_schemas).where(
-                    money_spend_schemas.c.category == category,
-                    money_spend_schemas.c.user_uuid == user_uuid,
+                query = (
+                    select(money_spend_schemas.c.id)
+                    .where(
+                        money_spend_schemas.c.category == category,
+                        money_spend_schemas.c.user_uuid == user_uuid,
+                    )
+                    .limit(1)
                 )
                 result = await session.execute(query)
                 checked = result.fetchone()
                 if checked:
                     return True
             except Exception as E:
-                logging.error(f"Error during filter_spesific_category: {E}.")
+                logging.error("Error during filter_spesific_category: %s.", E)
                 await session.rollback()
             finally:
                 await session.close()
     except Exception as E:
-        logging.error(f"Error after filter_spesific_category: {E}.")
+        logging.error("Error after filter_spesific_category: %s.", E)
     return False
 
 
+async def extract_category_counts(user_uuid: uuid7) -> list[Row] | None:  # used
+    try:
+        async with database_connection().connect() as session:
+            try:
+                query = (
+                    select(
+                        money_spend_schemas.c.category,
+                        func.count().label("total"),
+                    )
+                    .where(money_spend_schemas.c.user_uuid == user_uuid)
+                    .group_by(money_spend_schemas.c.category)
+                )
+                result = await session.execute(query)
+                return result.fetchall()
+            except Exception as E:
+                logging.error("Error during extract_category_counts: %s.", E)
+                await session.rollback()
+            finally:
+                await session.close()
+    except Exception as E:
+        logging.error("Error after extract_category_counts: %s.", E)
+    return None
+
+
 async def filter_month_year_category(
     user_uuid: uuid7,
     category: str,
@@ -71,15 +199,33 @@ async def filter_month_year_category(
                 if checked:
                     return True
             except Exception as E:
-                logging.error(f"Error during filter_month_year_category: {E}.")
+                logging.error("Error during filter_month_year_category: %s.", E)
                 await session.rollback()
             finally:
                 await session.close()
     except Exception as E:
-        logging.error(f"Error after filter_month_year_category: {E}.")
+        logging.error("Error after filter_month_year_category: %s.", E)
     return False
 
 
+async def extract_month_schemas(
+    session: AsyncSession, user_uuid: uuid7, month: int, year: int
+) -> dict[str, int]:  # used
+    query = (
+        select(money_spend_schemas.c.category, money_spend_schemas.c.budget)
+        .where(
+            and_(
+                money_spend_schemas.c.user_uuid == user_uuid,
+                money_spend_schemas.c.month == month,
+                money_spend_schemas.c.year == year,
+            )
+        )
+        .with_for_update()
+    )
+    result = await session.execute(query)
+    return {row.category: row.budget for row in result.fetchall()}
+
+
 async def filter_daily_spending(
     user_uuid: uuid7,
     amount: int,
@@ -113,13 +259,20 @@ async def filter_daily_spending(
                     return latest_record
             except Exception as E:
                 logging.error(
-                    f"Error during filtering spesific daily spend {spend_day}/{spend_month}/{spend_year} {category}/{description}/{amount}: {E}."
+                    "Error during filtering spesific daily spend %s/%s/%s %s/%s/%s: %s.",
+                    spend_day,
+                    spend_month,
+                    spend_year,
+                    category,
+                    description,
+                    amount,
+                    E,
                 )
                 await session.rollback()
             finally:
                 await session.close()
     except Exception as E:
-        logging.error(f"Error after filtering spesific daily spending: {E}.")
+        logging.error("Error after filtering spesific daily spending: %s.", E)
     return None
 
 
@@ -143,13 +296,13 @@ async def filter_month_year(
                     return True
             except Exception as E:
                 logging.error(
-                    f"Error during filter_month_year category availability: {E}."
+                    "Error during filter_month_year category availability: %s.", E
                 )
                 await session.rollback()
             finally:
                 await session.close()
     except Exception as E:
-        logging.error(f"Error after filter_month_year availability: {E}.")
+        logging.error("Error after filter_month_year availability: %s.", E)
     return False
 
 
@@ -163,7 +316,7 @@ async def is_using_registered_field(
         if record:
             return True
     except Exception as e:
-        logging.error(f"Error while checking {field}: {e}")
+        logging.error("Error while checking %s: %s", field, e)
     return False
 
 
@@ -180,12 +333,12 @@ async def is_using_registered_email(email: EmailStr) -> bool:  # used
                 if result:
                     return True
             except Exception as E:
-                logging.error(f"Error while is_using_registered_email: {E}")
+                logging.error("Error while is_using_registered_email: %s", E)
                 await session.rollback()
             finally:
                 await session.close()
     except Exception as E:
-        logging.error(f"Error after is_using_registered_email: {E}")
+        logging.error("Error after is_using_registered_email: %s", E)
 
     return False
 
@@ -203,162 +356,142 @@ async def is_using_registered_phone_number(phone_number: str) -> bool:  # used
                 if result:
                     return True
             except Exception as E:
-                logging.error(f"Error while is_using_registered_phone_number: {E}")
+                logging.error("Error while is_using_registered_phone_number: %s", E)
                 await session.rollback()
             finally:
                 await session.close()
     except Exception as E:
-        logging.error(f"Error after is_using_registered_phone_number: {E}")
+        logging.error("Error after is_using_registered_phone_number: %s", E)
 
     return False
 
 
-async def is_access_token_blacklisted(access_token: str) -> bool:  # used
+async def save_user_session(
+    session_id: uuid7, user_uuid: uuid7, refresh_jti: str, expires_at: datetime
+) -> bool:  # used
     try:
         async with database_connection().connect() as session:
             try:
-                query = select(blacklist_tokens).where(
-                    blacklist_tokens.c.access_token == access_token,
+                now = local_time()
+                query = user_sessions.insert().values(
+                    session_id=session_id,
+                    created_at=now,
+                    updated_at=now,
+                    user_uuid=user_uuid,
+                    refresh_jti=refresh_jti,
+                    expires_at=expires_at,
                 )
-                result = await session.execute(query)
-                checked = result.fetchone()
-                if checked:
-                    return True
+                await session.execute(query)
+                await session.commit()
+                logging.info("User %s successfully started a session.", user_uuid)
+                return True
             except Exception as E:
-                logging.error(f"Error while is_token_blacklisted: {E}")
+                logging.error("Error while save_user_session: %s", E)
                 await session.rollback()
             finally:
                 await session.close()
     except Exception as E:
-        logging.error(f"Error after is_token_blacklisted: {E}")
-
+        logging.error("Error after save_user_session: %s", E)
     return False
 
 
-async def is_refresh_token_blacklisted(refresh_token: str) -> bool:  # used
+async def is_session_active(session_id: uuid7) -> bool:  # used
     try:
         async with database_connection().connect() as session:
             try:
-                query = select(blacklist_tokens).where(
-                    blacklist_tokens.c.refresh_token == refresh_token
+                query = select(user_sessions.c.session_id).where(
+                    user_sessions.c.session_id == session_id,
+                    user_sessions.c.revoked_at.is_(None),
+                    user_sessions.c.expires_at > func.now(),
                 )
-
                 result = await session.execute(query)
-                checked = result.fetchone()
-                if checked:
+                if result.fetchone():
                     return True
             except Exception as E:
-                logging.error(f"Error while is_token_blacklisted: {E}")
+                logging.error("Error while is_session_active: %s", E)
                 await session.rollback()
             finally:
                 await session.close()
     except Exception as E:
-        logging.error(f"Error after is_token_blacklisted: {E}")
-
+        logging.error("Error after is_session_active: %s", E)
     return False
 
 
-async def save_tokens(
-    user_uuid: uuid7, access_token: str, refresh_token: str
-) -> None:  # used
-    try:
-        async with database_connection().connect() as session:
-            try:
-                query = user_tokens.insert().values(
-                    created_at=local_time(),
-                    user_uuid=user_uuid,
-                    access_token=access_token,
-                    refresh_token=refresh_token,
-                )
-                await session.execute(query)
-                await session.commit()
-                logging.info(
-                    f"User {user_uuid} successfully saved tokens into database."
-                )
-            except Exception as E:
-                logging.error(f"Error while save_tokens: {E}")
-                await session.rollback()
-            finally:
-                await session.close()
-    except Exception as E:
-        logging.error(f"Error after save_tokens: {E}")
-    return None
-
-
-async def save_reset_pin_data(user_uuid: uuid7, email: EmailStr = None) -> None:  # used
-    try:
-        async with database_connection().connect() as session:
-            try:
-                query = reset_pins.insert().values(
-                    user_uuid=user_uuid,
-                    created_at=local_time(),
-                    email=email,
-                    save_to_hit_at=local_time() + timedelta(minutes=1),
-                    blacklisted_at=local_time() + timedelta(minutes=5),
-                )
-                await session.execute(query)
-                await session.commit()
-
-                logging.info(
-                    "User successfully insert reset password id into database."
-                )
-
-            except Exception as E:
-                logging.error(f"Error while save_reset_password_id: {E}")
-                await session.rollback()
-            finally:
-                await session.close()
-    except Exception as E:
-        logging.error(f"Error after save_reset_password_id: {E}")
-    return None
-
-
-async def extract_reset_pin_data(user_uuid: uuid7) -> Row | None:  # used
+async def rotate_user_session(
+    session_id: uuid7, refresh_jti: str, new_refresh_jti: str, expires_at: datetime
+) -> Row | None:  # used
+    """
+    Swap the session refresh token in one statement by primary key. A
+    refresh token that is not the current one was already rotated away, so
+    presenting it again revokes the session; the returned row then carries
+    revoked_at. None means the session is unknown, expired or revoked.
+    """
     try:
         async with database_connection().connect() as session:
             try:
+                is_current = user_sessions.c.refresh_jti == refresh_jti
                 query = (
-                    select(reset_pins)
-                    .where(reset_pins.c.user_uuid == user_uuid)
-                    .order_by(reset_pins.c.created_at.desc())
+                    update(user_sessions)
+                    .where(
+                        user_sessions.c.session_id == session_id,
+                        user_sessions.c.revoked_at.is_(None),
+                        user_sessions.c.expires_at > func.now(),
+                    )
+                    .values(
+                        updated_at=local_time(),
+                        refresh_jti=case(
+                            (is_current, new_refresh_jti),
+                            else_=user_sessions.c.refresh_jti,
+                        ),
+                        expires_at=case(
+                            (is_current, expires_at),
+                            else_=user_sessions.c.expires_at,
+                        ),
+                        revoked_at=case((is_current, None), else_=func.now()),
+                    )
+                    .returning(user_sessions.c.user_uuid, user_sessions.c.revoked_at)
                 )
                 result = await session.execute(query)
-                latest_data = result.fetchone()
-
-                if latest_data:
-                    return latest_data
-                logging.error(f"User {user_uuid} not found.")
+                rotated = result.fetchone()
+                await session.commit()
+                return rotated
             except Exception as E:
-                logging.error(f"Error during extract_reset_pin_data: {E}")
+                logging.error("Error while rotate_user_session: %s", E)
                 await session.rollback()
             finally:
                 await session.close()
     except Exception as E:
-        logging.error(f"Error after extract_reset_pin_data: {E}")
+        logging.error("Error after rotate_user_session: %s", E)
     return None
 
 
-async def extract_tokens(user_uuid: uuid7) -> Row | None:  # used
-    try:
-        async with database_connection().connect() as session:
-            try:
-                query = (
-                    select(user_tokens)
-                    .where(user_tokens.c.user_uuid == user_uuid)
-                    .order_by(user_tokens.c.created_at.desc())
-                )
-                result = await session.execute(query)
-                latest_record = result.fetchone()
-                if latest_record is not None:
-                    return latest_record
-            except Exception as E:
-                logging.error(f"Error during extract_tokens: {E}")
-                await session.rollback()
-            finally:
-                await session.close()
-    except Exception as E:
-        logging.error(f"Error after extract_tokens: {E}")
-    return None
+def revoke_sessions_query(user_uuid: uuid7) -> Update:
+    """Revoke every live session of the user, e.g. after the pin changed."""
+    return (
+        update(user_sessions)
+        .where(
+            user_sessions.c.user_uuid == user_uuid,
+            user_sessions.c.revoked_at.is_(None),
+        )
+        .values(updated_at=local_time(), revoked_at=func.now())
+    )
+
+
+def logout_session_query(session_id: uuid7) -> Update:
+    """
+    Revoke a live session and return its user. No row back means the
+    session was already logged out, revoked or expired.
+    """
+    return (
+        update(user_sessions)
+        .where(
+            user_sessions.c.session_id == session_id,
+            user_sessions.c.revoked_at.is_(None),
+            user_sessions.c.expires_at > func.now(),
+        )
+        .values(updated_at=local_time(), revoked_at=func.now())
+        .returning(user_sessions.c.user_uuid)
+    )
 
 
 async def save_google_sso_account(
@@ -387,133 +520,61 @@ async def save_google_sso_account(
                 await session.commit()
                 logging.info("User google sso successfully saved data into database.")
             except Exception as E:
-                logging.error(f"Error while save_google_sso_account: {E}")
+                logging.error("Error while save_google_sso_account: %s", E)
                 await session.rollback()
             finally:
                 await session.close()
     except Exception as E:
-        logging.error(f"Error after save_google_sso_account: {E}")
+        logging.error("Error after save_google_sso_account: %s", E)
     return None
 
 
-async def reset_user_pin(user_uuid: uuid7, changed_pin: str) -> None:  # used
+async def reset_user_pin(
+    user_uuid: uuid7, changed_pin: str, current_pin: str | None = None
+) -> bool:  # used
+    """
+    With `current_pin` the pin only changes while it still has that hash,
+    so two requests racing with the same reset link cannot both apply. A
+    reset also revokes every session of the user, as a pin change does.
+    """
     try:
         async with database_connection().connect() as session:
             try:
+                conditions = [users.c.user_uuid == user_uuid]
+                if current_pin is not None:
+                    conditions.append(users.c.pin == current_pin)
                 query = (
                     update(users)
-                    .where(users.c.user_uuid == user_uuid)
+                    .where(and_(*conditions))
                     .values(updated_at=local_time(), pin=changed_pin)
                 )
-                await session.execute(query)
+                result = await session.execute(query)
+                if result.rowcount > 0:
+                    await session.execute(revoke_sessions_query(user_uuid=user_uuid))
                 await session.commit()
                 logging.info("User successfully saved reset pin id into database.")
+                return result.rowcount > 0
             except Exception as E:
-                logging.error(f"Error while reset_user_pin: {E}")
+                logging.error("Error while reset_user_pin: %s", E)
                 await session.rollback()
             finally:
                 await session.close()
     except Exception as E:
-        logging.error(f"Error after reset_user_pin: {E}")
-    return None
-
-
-async def save_otp_data(
-    user_uuid: uuid7,
-    current_api_hit: int = None,
-    otp_number: str = None,
-    saved_by_system: bool = False,
-    save_to_hit_at: datetime = local_time() + timedelta(minutes=1),
-) -> None:  # used
-    try:
-        async with database_connection().connect() as session:
-            try:
-                query = send_otps.insert().values(
-                    created_at=local_time(),
-                    updated_at=None,
-                    user_uuid=user_uuid,
-                    otp_number=otp_number,
-                    current_api_hit=current_api_hit,
-                    saved_by_system=saved_by_system,
-                    save_to_hit_at=save_to_hit_at,
-                    blacklisted_at=local_time() + timedelta(minutes=3),
-                    hit_tomorrow_at=local_time() + timedelta(days=1),
-                )
-
-                await session.execute(query)
-                await session.commit()
-
-            except Exception as E:
-                logging.error(f"Error while save_otp_phone_number_verification: {E}")
-                await session.rollback()
-            finally:
-                await session.close()
-
-    except Exception as E:
-        logging.error(f"Error after save_otp_phone_number_verification: {E}")
-    return None
-
-
-async def update_otp_data(
-    user_uuid: uuid7,
-    save_to_hit_at: datetime = local_time(),
-    blacklisted_at: datetime = local_time(),
-    hit_tomorrow_at: datetime = local_time(),
-) -> None:  # used
-    try:
-        async with database_connection().connect() as session:
-            try:
-                query = (
-                    send_otps.update()
-                    .where(send_otps.c.user_uuid == user_uuid)
-                    .values(
-                        current_api_hit=1,
-                        save_to_hit_at=save_to_hit_at,
-                        blacklisted_at=blacklisted_at,
-                        hit_tomorrow_at=hit_tomorrow_at,
-                    )
-                )
-
-                await session.execute(query)
-                await session.commit()
-
-            except Exception as E:
-                logging.error(f"Error while save_otp_phone_number_verification: {E}")
-                await session.rollback()
-            finally:
-                await session.close()
-
-    except Exception as E:
-        logging.error(f"Error after save_otp_phone_number_verification: {E}")
-    return None
+        logging.error("Error after reset_user_pin: %s", E)
+    return False
 
 
-async def extract_data_otp(user_uuid: uuid7) -> Row | None:  # used
-    try:
-        async with database_connection().connect() as session:
-            async with session.begin():
-                try:
-                    query = (
-                        select(send_otps)
-                        .where(send_otps.c.user_uuid == user_uuid)
-                        .order_by(send_otps.c.created_at.desc())
-                        .with_for_update()
-                    )
-                    result = await session.execute(query)
-                    latest_record = result.fetchone()
-                    if latest_record:
-                        logging.info("Data otp found.")
-                        return latest_record
-
-                    logging.info("Data otp not found.")
-                except Exception as e:
-                    logging.error(f"Error during extract_phone_number_otp: {e}")
-                    await session.rollback()
-                finally:
-                    await session.close()
-    except Exception as e:
-        logging.error(f"Error after extract_phone_number_otp: {e}")
-    return None
+def audit_otp_query(user_uuid: uuid7) -> BaseInsert:
+    """
+    Log a sent OTP. The code itself lives in the ephemeral store, rows
+    here only count sends.
+    """
+    return send_otps.insert().values(
+        created_at=local_time(),
+        user_uuid=user_uuid,
+        saved_by_system=False,
+        hit_tomorrow_at=local_time() + timedelta(days=1),
+    )
 
 
 async def update_phone_number_status(user_uuid: uuid7) -> None:  # used
@@ -531,12 +592,12 @@ async def update_phone_number_status(user_uuid: uuid7) -> None:  # used
                 await session.commit()
                 logging.info("User successfully updated phone number status.")
             except Exception as E:
-                logging.error(f"Error update_phone_number_status: {E}")
+                logging.error("Error update_phone_number_status: %s", E)
                 await session.rollback()
             finally:
                 await session.close()
     except Exception as E:
-        logging.error(f"Error after update_phone_number_status: {E}")
+        logging.error("Error after update_phone_number_status: %s", E)
     return None
 
 
@@ -555,12 +616,12 @@ async def update_verify_email_status(user_uuid: uuid7) -> None:  # used
                 await session.commit()
                 logging.info("User successfully updated email status.")
             except Exception as E:
-                logging.error(f"Error update_verify_email_status: {E}")
+                logging.error("Error update_verify_email_status: %s", E)
                 await session.rollback()
             finally:
                 await session.close()
     except Exception as E:
-        logging.error(f"Error after update_verify_email_status: {E}")
+        logging.error("Error after update_verify_email_status: %s", E)
     return None
 
 
@@ -579,16 +640,18 @@ async def update_user_phone_number(user_uuid: uuid7, phone_number: str) -> None:
                 await session.commit()
                 logging.info("User successfully updated phone number.")
             except Exception as E:
-                logging.error(f"Error update_user_phone_number: {E}")
+                logging.error("Error update_user_phone_number: %s", E)
                 await session.rollback()
             finally:
                 await session.close()
     except Exception as E:
-        logging.error(f"Error after update_user_phone_number: {E}")
+        logging.error("Error after update_user_phone_number: %s", E)
     return None
 
 
-async def update_user_pin(user_uuid: uuid7, pin: str) -> None:  # used
+async def update_user_pin(
+    user_uuid: uuid7, pin: str, outbox_query: BaseInsert | None = None
+) -> bool:  # used
     try:
         async with database_connection().connect() as session:
             try:
@@ -600,16 +663,19 @@ async def update_user_pin(user_uuid: uuid7, pin: str) -> None:  # used
                     .values(pin=pin, updated_at=local_time())
                 )
                 await session.execute(query)
+                if outbox_query is not None:
+                    await session.execute(outbox_query)
                 await session.commit()
                 logging.info("User successfully updated pin.")
+                return True
             except Exception as E:
-                logging.error(f"Error update_user_pin: {E}")
+                logging.error("Error update_user_pin: %s", E)
                 await session.rollback()
             finally:
                 await session.close()
     except Exception as E:
-        logging.error(f"Error after update_user_pin: {E}")
-    return None
+        logging.error("Error after update_user_pin: %s", E)
+    return False
 
 
 async def update_user_email(
@@ -633,10 +699,10 @@ async def update_user_email(
                 await session.commit()
                 logging.info("User successfully added email.")
             except Exception as E:
-                logging.error(f"Error update_user_email: {E}")
+                logging.error("Error update_user_email: %s", E)
                 await session.rollback()
             finally:
                 await session.close()
     except Exception as E:
-        logging.error(f"Error after update_user_email: {E}")
+        logging.error("Error after update_user_email: %s", E)
     return None
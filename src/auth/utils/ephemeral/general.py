@@ -0,0 +1,198 @@
+import abc
+import time
+import orjson
+from uuid_extensions import uuid7
+from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta, timezone
+from src.auth.utils.database.general import local_time
+from src.auth.utils.logging import logging
+from src.auth.utils.metrics.general import register_metrics
+from src.secret import (
+    EPHEMERAL_STORE_BACKEND,
+    EPHEMERAL_STORE_MAX_KEYS,
+    REDIS_URL,
+    OTP_TTL,
+)
+
+
+class EphemeralStore(abc.ABC):
+    """Short-lived JSON values that expire on their own after `ttl` seconds."""
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    @abc.abstractmethod
+    async def read(self, key: str) -> dict | None: ...
+
+    @abc.abstractmethod
+    async def write(self, key: str, value: dict, ttl: float) -> None: ...
+
+    @abc.abstractmethod
+    async def delete(self, key: str) -> None: ...
+
+    async def get(self, key: str) -> dict | None:
+        value = await self.read(key=key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: str, value: dict, ttl: float) -> None:
+        if ttl <= 0:
+            await self.delete(key=key)
+            return
+        await self.write(key=key, value=value, ttl=ttl)
+        self.writes += 1
+
+    async def close(self) -> None:
+        pass
+
+    def metrics(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "writes": self.writes}
+
+
+class MemoryStore(EphemeralStore):
+    """Per-process values, expired lazily on read and pruned when full."""
+
+    def __init__(self, max_keys: int = 100000) -> None:
+        super().__init__()
+        self.max_keys = max_keys
+        self.values: dict[str, tuple[float, bytes]] = {}
+
+    def prune(self, now: float) -> None:
+        self.values = {
+            key: entry for key, entry in self.values.items() if entry[0] > now
+        }
+
+    async def read(self, key: str) -> dict | None:
+        entry = self.values.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self.values[key]
+            return None
+        return orjson.loads(entry[1])
+
+    async def write(self, key: str, value: dict, ttl: float) -> None:
+        now = time.monotonic()
+        if key not in self.values and len(self.values) >= self.max_keys:
+            self.prune(now=now)
+        self.values[key] = (now + ttl, orjson.dumps(value))
+
+    async def delete(self, key: str) -> None:
+        self.values.pop(key, None)
+
+    def metrics(self) -> dict:
+        return {**super().metrics(), "keys": len(self.values)}
+
+
+class RedisStore(EphemeralStore):
+    """
+    Values kept by any server speaking the redis protocol. Only GET, SET PX
+    and DEL are used, so a local stand-in can serve it as well.
+    """
+
+    def __init__(self, url: str) -> None:
+        super().__init__()
+        import redis.asyncio as redis
+
+        self.client = redis.from_url(url)
+
+    async def read(self, key: str) -> dict | None:
+        value = await self.client.get(key)
+        return orjson.loads(value) if value is not None else None
+
+    async def write(self, key: str, value: dict, ttl: float) -> None:
+        await self.client.set(key, orjson.dumps(value), px=max(int(ttl * 1000), 1))
+
+    async def delete(self, key: str) -> None:
+        await self.client.delete(key)
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+
+def create_ephemeral_store() -> EphemeralStore:
+    if EPHEMERAL_STORE_BACKEND.lower() == "redis":
+        logging.info("Ephemeral store uses redis.")
+        return RedisStore(url=REDIS_URL)
+    return MemoryStore(max_keys=int(EPHEMERAL_STORE_MAX_KEYS))
+
+
+ephemeral_store = create_ephemeral_store()
+register_metrics(name="ephemeral_store", collector=ephemeral_store.metrics)
+
+
+async def close_ephemeral_store() -> None:
+    await ephemeral_store.close()
+
+
+def to_timestamp(value: datetime | None) -> float | None:
+    return value.timestamp() if value is not None else None
+
+
+def from_timestamp(value: float | None) -> datetime | None:
+    return datetime.fromtimestamp(value, timezone.utc) if value is not None else None
+
+
+@dataclass(slots=True)
+class OTPState:
+    user_uuid: str
+    otp_number: str
+    blacklisted_at: datetime
+
+
+def dump_otp_state(state: OTPState) -> dict:
+    value = asdict(state)
+    value["blacklisted_at"] = to_timestamp(state.blacklisted_at)
+    return value
+
+
+def load_otp_state(value: dict) -> OTPState:
+    return OTPState(
+        user_uuid=value["user_uuid"],
+        otp_number=value["otp_number"],
+        blacklisted_at=from_timestamp(value["blacklisted_at"]),
+    )
+
+
+async def save_otp_data(user_uuid: uuid7, otp_number: str) -> bool:  # used
+    """The state expires together with the OTP code, after OTP_TTL seconds."""
+    try:
+        state = OTPState(
+            user_uuid=str(user_uuid),
+            otp_number=otp_number,
+            blacklisted_at=local_time() + timedelta(seconds=int(OTP_TTL)),
+        )
+        await ephemeral_store.set(
+            key=f"otp:{user_uuid}", value=dump_otp_state(state), ttl=int(OTP_TTL)
+        )
+        return True
+    except Exception as E:
+        logging.error("Error after save_otp_data: %s", E)
+    return False
+
+
+async def update_otp_data(user_uuid: uuid7) -> None:  # used
+    """Expire the pending OTP, e.g. after the destination changed."""
+    try:
+        await ephemeral_store.delete(key=f"otp:{user_uuid}")
+    except Exception as E:
+        logging.error("Error after update_otp_data: %s", E)
+    return None
+
+
+async def extract_data_otp(user_uuid: uuid7) -> OTPState | None:  # used
+    try:
+        value = await ephemeral_store.get(key=f"otp:{user_uuid}")
+        if value:
+            logging.info("Data otp found.")
+            return load_otp_state(value=value)
+
+        logging.info("Data otp not found.")
+    except Exception as E:
+        logging.error("Error after extract_data_otp: %s", E)
+    return None
@@ -1,16 +1,11 @@
-import ssl
-import smtplib
 from pydantic import EmailStr
 from email.mime.text import MIMEText
 from email.message import EmailMessage
+from src.secret import GOOGLE_DEFAULT_EMAIL
 from src.auth.utils.logging import logging
-from src.secret import (
-    GOOGLE_DEFAULT_EMAIL,
-    GOOGLE_APP_PASSWORD,
-    GOOGLE_SMTP_SERVER,
-    GOOGLE_SMTP_PORT,
-)
-from smtplib import (
+from src.auth.utils.smtp.general import smtp_pool
+from src.auth.utils.circuit_breaker.general import smtp_breaker
+from aiosmtplib import (
     SMTPException,
     SMTPAuthenticationError,
     SMTPRecipientsRefused,
@@ -40,61 +35,51 @@ async def send_gmail(
         email.set_content(email_body)
         email.set_content(MIMEText(email_body, "html"))
 
-        context = ssl.create_default_context()
         try:
-            with smtplib.SMTP_SSL(
-                host=GOOGLE_SMTP_SERVER, port=int(GOOGLE_SMTP_PORT), context=context
-            ) as smtp:
-                try:
-                    logging.info(f"Email successfully sent into: {email_receiver}")
-                    smtp.login(user=GOOGLE_DEFAULT_EMAIL, password=GOOGLE_APP_PASSWORD)
-                    smtp.sendmail(
-                        from_addr=GOOGLE_DEFAULT_EMAIL,
-                        to_addrs=email_receiver,
-                        msg=email.as_string(),
-                    )
-                except Exception as E:
-                    logging.error(f"Error during sending smtp email: {E}")
-                    raise ServiceError(detail=f"SMTP Error: {E}.", name="Google SMTP")
-                finally:
-                    smtp.close()
+            await smtp_breaker.call(smtp_pool.send_message, message=email)
+            logging.info("Email successfully sent into: %s", email_receiver)
         except SMTPAuthenticationError as e:
-            logging.error(f"SMTPAuthenticationError: {e}")
+            logging.error("SMTPAuthenticationError: %s", e)
             raise AuthenticationFailed(
                 detail="SMTP Authentication failed. Please check your credentials."
             )
         except SMTPRecipientsRefused as e:
-            logging.error(f"SMTPRecipientsRefused: {e}")
+            logging.error("SMTPRecipientsRefused: %s", e)
             raise EntityDoesNotMatchedError(
                 detail="SMTP Recipients refused. The email address might be invalid."
             )
         except SMTPSenderRefused as e:
-            logging.error(f"SMTPSenderRefused: {e}")
+            logging.error("SMTPSenderRefused: %s", e)
             raise EntityDoesNotMatchedError(
                 detail="SMTP Sender refused. The sender's email address might be invalid."
             )
         except SMTPDataError as e:
-            logging.error(f"SMTPDataError: {e}")
+            logging.error("SMTPDataError: %s", e)
             raise ServiceError(
                 detail="SMTP Data error occurred while sending the email.",
                 name="Google SMTP",
             )
         except SMTPConnectError as e:
-            logging.error(f"SMTPConnectError: {e}")
+            logging.error("SMTPConnectError: %s", e)
             raise ServiceError(
                 detail="Failed to connect to the SMTP server.", name="Google SMTP"
             )
         except SMTPException as e:
-            logging.error(f"SMTPException: {e}")
+            logging.error("SMTPException: %s", e)
             raise ServiceError(
                 detail=f"SMTP error occurred: {str(e)}", name="Google SMTP"
             )
+        except OSError as e:
+            logging.error("SMTP connection error: %s", e)
+            raise ServiceError(
+                detail="Failed to connect to the SMTP server.", name="Google SMTP"
+            )
     except FinanceTrackerApiError as FTE:
         raise FTE
     except Exception as E:
-        logging.error(f"Unexpected error during Gmail SMTP authentication: {E}")
+        logging.error("Unexpected error during Gmail SMTP authentication: %s", E)
         raise ServiceError(
             detail="An unexpected error occurred. Please try again later",
             name="Google SMTP",
         )
-    return smtp
+    return email
@@ -0,0 +1,49 @@
+import hashlib
+from uuid_extensions import uuid7
+from fastapi import Request, Response, status
+from src.secret import CLOSED_MONTH_MAX_AGE
+from src.auth.utils.database.general import local_time
+
+
+def month_etag(user_uuid: uuid7, month: int, year: int, version: int) -> str:
+    digest = hashlib.blake2b(
+        f"{user_uuid}:{year}:{month}:{version}".encode(), digest_size=12
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    # If-None-Match uses weak comparison, so W/"x" matches "x".
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def month_cache_control(month: int, year: int) -> str:
+    current_time = local_time()
+    if (year, month) < (current_time.year, current_time.month):
+        return f"private, max-age={int(CLOSED_MONTH_MAX_AGE)}"
+    return "private, no-cache"
+
+
+def month_cache_headers(etag: str, month: int, year: int) -> dict[str, str]:
+    return {
+        "ETag": etag,
+        "Cache-Control": month_cache_control(month=month, year=year),
+    }
+
+
+def json_body_response(body: bytes, headers: dict[str, str]) -> Response:
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def not_modified(headers: dict[str, str]) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
@@ -0,0 +1,100 @@
+import httpx
+import importlib.util
+from src.auth.utils.logging import logging
+from src.secret import (
+    HTTP_CLIENT_MAX_CONNECTIONS,
+    HTTP_CLIENT_MAX_KEEPALIVE,
+    HTTP_CLIENT_KEEPALIVE_EXPIRY,
+    HTTP_CLIENT_TIMEOUT,
+    HTTP_CLIENT_HTTP2,
+)
+
+UPSTREAMS = ("whatsapp", "google")
+
+
+class SharedTransport(httpx.AsyncBaseTransport):
+    """
+    Forward requests into the registry owned transport of an upstream.
+    Clients created by libraries per call (e.g. authlib) close their
+    transport on exit, so the close is ignored here and the pool stays warm.
+    The transport is looked up per request, so a long lived holder keeps
+    working after the registry reopens its clients.
+    """
+
+    def __init__(self, registry: "HttpClientRegistry", name: str) -> None:
+        self.registry = registry
+        self.name = name
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.registry.get(name=self.name)
+        transport = self.registry.transports[self.name]
+        return await transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class HttpClientRegistry:
+    """one keep-alive pooled client per upstream, shared by every router."""
+
+    def __init__(self) -> None:
+        self.transports: dict[str, httpx.AsyncHTTPTransport] = {}
+        self.clients: dict[str, httpx.AsyncClient] = {}
+
+    def use_http2(self) -> bool:
+        if HTTP_CLIENT_HTTP2.lower() not in ("1", "true", "yes"):
+            return False
+        if importlib.util.find_spec("h2") is None:
+            logging.warning("HTTP/2 requested but h2 is not installed, using HTTP/1.1.")
+            return False
+        return True
+
+    def open(self, name: str) -> httpx.AsyncClient:
+        transport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(
+                max_connections=int(HTTP_CLIENT_MAX_CONNECTIONS),
+                max_keepalive_connections=int(HTTP_CLIENT_MAX_KEEPALIVE),
+                keepalive_expiry=float(HTTP_CLIENT_KEEPALIVE_EXPIRY),
+            ),
+            http2=self.use_http2(),
+        )
+        client = httpx.AsyncClient(
+            transport=transport, timeout=float(HTTP_CLIENT_TIMEOUT)
+        )
+        self.transports[name] = transport
+        self.clients[name] = client
+        logging.info("HTTP client %s opened.", name)
+        return client
+
+    def get(self, name: str) -> httpx.AsyncClient:
+        client = self.clients.get(name)
+        if client is None or client.is_closed:
+            client = self.open(name=name)
+        return client
+
+    def shared_transport(self, name: str) -> SharedTransport:
+        return SharedTransport(registry=self, name=name)
+
+    async def close(self) -> None:
+        clients = list(self.clients.items())
+        self.clients.clear()
+        self.transports.clear()
+        for name, client in clients:
+            await client.aclose()
+            logging.info("HTTP client %s closed.", name)
+
+
+http_clients = HttpClientRegistry()
+
+
+def open_http_clients() -> None:
+    for name in UPSTREAMS:
+        http_clients.get(name=name)
+
+
+async def close_http_clients() -> None:
+    await http_clients.close()
+
+
+def get_http_client(name: str) -> httpx.AsyncClient:
+    return http_clients.get(name=name)
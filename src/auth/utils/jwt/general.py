@@ -1,3 +1,5 @@
+import hmac
+import hashlib
 from typing import Annotated
 from pydantic import EmailStr
 from datetime import timedelta
@@ -8,13 +10,16 @@ from src.database.models import users
 from sqlalchemy.engine.row import Row
 from passlib.context import CryptContext
 from src.auth.utils.logging import logging
+from src.auth.routers.exceptions import InvalidTokenError, ServiceError
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from src.database.connection import database_connection
 from src.auth.utils.validator import check_pin, check_uuid
 from src.auth.utils.database.general import (
     local_time,
-    is_access_token_blacklisted,
+    save_user_session,
+    is_session_active,
+    rotate_user_session,
 )
 from src.auth.utils.request_format import (
     TokenData,
@@ -26,7 +31,11 @@ from src.auth.utils.request_format import (
 from src.secret import (
     ACCESS_TOKEN_SECRET_KEY,
     ACCESS_TOKEN_ALGORITHM,
+    ACCESS_TOKEN_EXPIRED,
     REFRESH_TOKEN_SECRET_KEY,
+    REFRESH_TOKEN_EXPIRED,
+    RESET_PIN_SECRET_KEY,
+    RESET_PIN_TTL,
 )
 
 password_content = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -79,12 +88,12 @@ async def get_user(
 
                 logging.warning("User not found.")
             except Exception as E:
-                logging.error(f"Error during get_user: {E}.")
+                logging.error("Error during get_user: %s.", E)
                 await session.rollback()
             finally:
                 await session.close()
     except Exception as E:
-        logging.error(f"Error after get_user: {E}.")
+        logging.error("Error after get_user: %s.", E)
     return None
 
 
@@ -99,11 +108,11 @@ async def authenticate_user(user_uuid: uuid7, pin: str) -> Row | None:
             return None
         if not await verify_pin(pin=pin, hashed_pin=users.pin):
             logging.error(
-                f"Authentication failed, invalid pin for users {users.full_name}."
+                "Authentication failed, invalid pin for users %s.", users.full_name
             )
             return None
     except Exception as E:
-        logging.error(f"Error after authenticate_user: {E}.")
+        logging.error("Error after authenticate_user: %s.", E)
         return None
     return users
 
@@ -124,10 +133,136 @@ async def create_refresh_token(data: dict, refresh_token_expires: timedelta) ->
     return encoded_refresh_token
 
 
+async def create_session_tokens(
+    user_uuid: uuid7, session_id: uuid7, refresh_jti: str
+) -> tuple[str, str]:
+    access_token = await create_access_token(
+        data={"sub": str(user_uuid), "sid": str(session_id)},
+        access_token_expires=timedelta(minutes=int(ACCESS_TOKEN_EXPIRED)),
+    )
+    refresh_token = await create_refresh_token(
+        data={"sub": str(user_uuid), "sid": str(session_id), "jti": refresh_jti},
+        refresh_token_expires=timedelta(minutes=int(REFRESH_TOKEN_EXPIRED)),
+    )
+    return access_token, refresh_token
+
+
+async def start_session(user_uuid: uuid7) -> tuple[str, str]:
+    """One user_sessions row per login; refreshes rotate it in place."""
+    session_id = uuid7()
+    refresh_jti = str(uuid7())
+    is_saved = await save_user_session(
+        session_id=session_id,
+        user_uuid=user_uuid,
+        refresh_jti=refresh_jti,
+        expires_at=local_time() + timedelta(minutes=int(REFRESH_TOKEN_EXPIRED)),
+    )
+    if not is_saved:
+        raise ServiceError(detail="Failed to start session.", name="Finance Tracker")
+
+    return await create_session_tokens(
+        user_uuid=user_uuid, session_id=session_id, refresh_jti=refresh_jti
+    )
+
+
+async def rotate_session(refresh_token: str) -> tuple[str, str]:
+    try:
+        claims = jwt.decode(
+            token=refresh_token,
+            key=REFRESH_TOKEN_SECRET_KEY,
+            algorithms=[ACCESS_TOKEN_ALGORITHM],
+        )
+    except JWTError:
+        raise InvalidTokenError(detail="Invalid JWT Token.")
+
+    session_id, refresh_jti = claims.get("sid"), claims.get("jti")
+    if not claims.get("sub") or not session_id or not refresh_jti:
+        raise InvalidTokenError(detail="Invalid refresh token.")
+
+    new_refresh_jti = str(uuid7())
+    rotated = await rotate_user_session(
+        session_id=session_id,
+        refresh_jti=refresh_jti,
+        new_refresh_jti=new_refresh_jti,
+        expires_at=local_time() + timedelta(minutes=int(REFRESH_TOKEN_EXPIRED)),
+    )
+    if rotated is None:
+        raise InvalidTokenError(detail="Session expired. Please perform re login.")
+
+    if rotated.revoked_at is not None:
+        logging.warning("Refresh token reused, revoked session %s.", session_id)
+        raise InvalidTokenError(detail="Session expired. Please perform re login.")
+
+    return await create_session_tokens(
+        user_uuid=rotated.user_uuid, session_id=session_id, refresh_jti=new_refresh_jti
+    )
+
+
+def reset_pin_key() -> str:
+    # Never the access token key itself, or a reset token would pass as one.
+    if RESET_PIN_SECRET_KEY:
+        return RESET_PIN_SECRET_KEY
+    return hmac.new(
+        ACCESS_TOKEN_SECRET_KEY.encode(), b"reset-pin", hashlib.sha256
+    ).hexdigest()
+
+
+def reset_pin_nonce(hashed_pin: str) -> str:
+    """Changes with the pin, so a link stops working once it has been used."""
+    return hmac.new(
+        reset_pin_key().encode(), hashed_pin.encode(), hashlib.sha256
+    ).hexdigest()[:16]
+
+
+async def create_reset_pin_token(user_uuid: uuid7, hashed_pin: str) -> str:
+    claims = {
+        "sub": str(user_uuid),
+        "use": "reset-pin",
+        "nonce": reset_pin_nonce(hashed_pin=hashed_pin),
+        "exp": local_time() + timedelta(seconds=int(RESET_PIN_TTL)),
+    }
+    return jwt.encode(claims=claims, key=reset_pin_key(), algorithm="HS256")
+
+
+async def decode_reset_pin_token(token: str) -> dict:
+    try:
+        claims = jwt.decode(token=token, key=reset_pin_key(), algorithms=["HS256"])
+    except JWTError as E:
+        logging.info("Invalid reset pin token: %s", E)
+        raise InvalidTokenError(detail="Reset pin link is invalid or expired.")
+
+    if claims.get("use") != "reset-pin" or not claims.get("sub"):
+        raise InvalidTokenError(detail="Reset pin link is invalid or expired.")
+    return claims
+
+
+async def verify_reset_pin_nonce(claims: dict, hashed_pin: str | None) -> None:
+    if not hashed_pin or not hmac.compare_digest(
+        claims.get("nonce", ""), reset_pin_nonce(hashed_pin=hashed_pin)
+    ):
+        raise InvalidTokenError(detail="Reset pin link already used.")
+
+
 async def get_access_token(access_token: str = Depends(oauth2_scheme)) -> str:
     return access_token
 
 
+async def get_session_id(token: Annotated[str, Depends(oauth2_scheme)]) -> str:
+    try:
+        payload = jwt.decode(
+            token=token,
+            key=ACCESS_TOKEN_SECRET_KEY,
+            algorithms=[ACCESS_TOKEN_ALGORITHM],
+        )
+    except JWTError:
+        raise InvalidTokenError(detail="Invalid JWT Token.")
+
+    session_id = payload.get("sid")
+    if not session_id:
+        raise InvalidTokenError(detail="Invalid JWT Token.")
+    return session_id
+
+
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
 ) -> DetailUserFullName | DetailUserPhoneNumber | DetailUserEmail | None:
@@ -144,11 +279,6 @@ async def get_current_user(
     )
 
     try:
-        validate_access_token = await is_access_token_blacklisted(access_token=token)
-
-        if validate_access_token is True:
-            raise blacklisted_access_token
-
         payload = jwt.decode(
             token=token,
             key=ACCESS_TOKEN_SECRET_KEY,
@@ -156,6 +286,10 @@ async def get_current_user(
         )
 
         user_uuid = payload.get("sub")
+        session_id = payload.get("sid")
+
+        if not session_id or not await is_session_active(session_id=session_id):
+            raise blacklisted_access_token
 
         token_data = TokenData(user_uuid=user_uuid)
         users = await get_user(unique_id=token_data.user_uuid)
@@ -163,7 +297,7 @@ async def get_current_user(
         if user_uuid is None or users is None:
             raise credentials_exception
     except JWTError as e:
-        logging.error(f"JWTError: {e}")
+        logging.error("JWTError: %s", e)
         raise credentials_exception
     return users
 
@@ -196,6 +330,6 @@ async def verify_email_status(token: Annotated[str, Depends(oauth2_scheme)]) ->
         if email_status:
             raise already_verified
     except JWTError as e:
-        logging.error(f"JWTError: {e}")
+        logging.error("JWTError: %s", e)
         raise credentials_exception
     return email_status
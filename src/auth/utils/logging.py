@@ -1,11 +1,206 @@
+import queue
+import atexit
+import random
 import logging
+import orjson
+from uuid import uuid4
+from contextvars import ContextVar
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    TimedRotatingFileHandler,
+)
+from src.auth.utils.metrics.general import register_metrics
+from src.secret import (
+    LOG_FILE,
+    LOG_QUEUE_SIZE,
+    LOG_ROTATION,
+    LOG_MAX_BYTES,
+    LOG_ROTATE_WHEN,
+    LOG_BACKUP_COUNT,
+    LOG_FORMAT,
+    LOG_SAMPLE_RATES,
+)
 
-BASE_FORMAT = "%(asctime)s %(levelname)s %(message)s"
+BASE_FORMAT = "%(asctime)s %(levelname)s [%(request_id)s] %(message)s"
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
-logging.basicConfig(
-    level=logging.INFO,
-    format=BASE_FORMAT,
-    datefmt=DATE_FORMAT,
-    handlers=[logging.StreamHandler(), logging.FileHandler("log_result.txt", mode="a")],
-)
+request_id: ContextVar[str | None] = ContextVar("request_id", default=None)
+
+
+class RequestIdMiddleware:
+    """
+    Tag every log record of a request with its X-Request-ID, taken from the
+    request or generated, and echo it back in the response headers.
+    """
+
+    header = b"x-request-id"
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        value = headers.get(self.header, b"").decode("latin-1")[:64] or uuid4().hex
+        token = request_id.set(value)
+
+        async def send_with_request_id(message) -> None:
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", [])
+                message["headers"].append((self.header, value.encode("latin-1")))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id.reset(token)
+
+
+class ContextFilter(logging.Filter):
+    """
+    Runs in the caller, before the record is queued: stamps the request id
+    and samples INFO and lower records by message template. Rates come from
+    LOG_SAMPLE_RATES, e.g. {"User found.": 0.01}; warnings and errors are
+    always kept.
+    """
+
+    def __init__(self, sample_rates: dict[str, float]) -> None:
+        super().__init__()
+        self.sample_rates = sample_rates
+        self.sampled_out = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno <= logging.INFO and self.sample_rates:
+            rate = self.sample_rates.get(record.msg)
+            if rate is not None and random.random() >= rate:
+                self.sampled_out += 1
+                return False
+        current_request_id = request_id.get()
+        if current_request_id is not None:
+            record.request_id = current_request_id
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "line": record.lineno,
+            "request_id": getattr(record, "request_id", None),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry, default=str).decode()
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    Hands records to the listener thread without blocking the caller. When
+    the queue is full the record is dropped and counted; the count is
+    logged once the queue has room again.
+    """
+
+    def __init__(self, log_queue: queue.Queue) -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+        self.unreported = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Same process, so the record needs no pickling; formatting is left
+        # to the listener thread.
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            self.unreported += 1
+            return
+
+        if self.unreported:
+            dropped, self.unreported = self.unreported, 0
+            report = logging.LogRecord(
+                name="logging",
+                level=logging.WARNING,
+                pathname=__file__,
+                lineno=0,
+                msg="Dropped %d log records, log queue full.",
+                args=(dropped,),
+                exc_info=None,
+            )
+            try:
+                self.queue.put_nowait(report)
+            except queue.Full:
+                self.unreported += dropped
+
+    def metrics(self) -> dict:
+        return {
+            "queued": self.queue.qsize(),
+            "capacity": self.queue.maxsize,
+            "dropped": self.dropped,
+        }
+
+
+def create_file_handler() -> logging.Handler:
+    if LOG_ROTATION.lower() == "time":
+        return TimedRotatingFileHandler(
+            LOG_FILE,
+            when=LOG_ROTATE_WHEN,
+            backupCount=int(LOG_BACKUP_COUNT),
+            encoding="utf-8",
+        )
+    return RotatingFileHandler(
+        LOG_FILE,
+        maxBytes=int(LOG_MAX_BYTES),
+        backupCount=int(LOG_BACKUP_COUNT),
+        encoding="utf-8",
+    )
+
+
+def configure_logging() -> QueueListener:
+    if LOG_FORMAT.lower() == "json":
+        formatter = JsonFormatter(datefmt=DATE_FORMAT)
+    else:
+        formatter = logging.Formatter(
+            fmt=BASE_FORMAT, datefmt=DATE_FORMAT, defaults={"request_id": "-"}
+        )
+    output_handlers = [logging.StreamHandler(), create_file_handler()]
+    for handler in output_handlers:
+        handler.setFormatter(formatter)
+
+    queue_handler = DroppingQueueHandler(
+        log_queue=queue.Queue(maxsize=int(LOG_QUEUE_SIZE))
+    )
+    context_filter = ContextFilter(sample_rates=orjson.loads(LOG_SAMPLE_RATES))
+    queue_handler.addFilter(context_filter)
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.handlers = [queue_handler]
+    register_metrics(
+        name="logging",
+        collector=lambda: {
+            **queue_handler.metrics(),
+            "sampled_out": context_filter.sampled_out,
+        },
+    )
+
+    listener = QueueListener(
+        queue_handler.queue, *output_handlers, respect_handler_level=True
+    )
+    listener.start()
+    # Flush what is still queued when the process exits.
+    atexit.register(listener.stop)
+    return listener
+
+
+log_listener = configure_logging()
@@ -0,0 +1,11 @@
+from typing import Callable
+
+metric_collectors: dict[str, Callable[[], dict]] = {}
+
+
+def register_metrics(name: str, collector: Callable[[], dict]) -> None:
+    metric_collectors[name] = collector
+
+
+def collect_metrics() -> dict[str, dict]:
+    return {name: collector() for name, collector in metric_collectors.items()}
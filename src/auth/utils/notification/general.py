@@ -0,0 +1,196 @@
+from html import escape
+from string import Formatter
+from dataclasses import dataclass
+from typing import Callable
+from src.auth.utils.logging import logging
+from src.secret import NOTIFICATION_LOCALE
+
+# locale -> channel -> template name -> (subject, body). Bodies use
+# str.format fields; field values are escaped for the channel when rendered.
+# Email bodies are stored in the outbox until delivered, so they never carry
+# the PIN.
+TEMPLATES: dict[str, dict[str, dict[str, tuple[str | None, str]]]] = {
+    "en": {
+        "email": {
+            "otp": (
+                "OTP Email Verification.",
+                "Dear <b>{full_name}</b>,<br><br>"
+                "We received a request to verify email address. Please enter the following code to verify your account:<br><br>"
+                "Your verification code is <b>{otp}</b>. Please enter this code to complete your verification<br><br>"
+                "Please note, that this code will expire in <b>3 minutes</b>.<br>"
+                "Thank you,<br><br>"
+                "Best regards,<br>"
+                "<b>Support Team</b>",
+            ),
+            "reset_link": (
+                "Reset Password",
+                "Dear {email},<br><br>"
+                "We received a request to reset your password. Please click the link below to create a new password:<br><br>"
+                '<a href="{reset_link}">Reset Password</a><br><br>'
+                "Please note, this password reset link is only valid for <b>5 minutes</b>. If you did not request a password reset, please ignore this email.<br>"
+                "Thank you,<br><br>"
+                "Best regards,<br>"
+                "<b>Support Team</b>",
+            ),
+            "welcome": (
+                "Success Registered New Finance Tracker Account!",
+                "Dear {full_name},<br><br>"
+                "We are pleased to inform you that your new account has been successfully created.<br><br>"
+                "You can now log in with your phone number <strong>{phone_number}</strong> and the PIN you created.<br><br>"
+                "Thank you.<br><br>"
+                "Best regards,<br>"
+                "Support Team",
+            ),
+            "pin_changed": (
+                "Success Updated New Pin!",
+                "Dear {full_name},<br><br>"
+                "We are pleased to inform you that your new account has been successfully updated pin.<br><br>"
+                "You can now log in with your phone number <strong>{phone_number}</strong> and your new PIN.<br><br>"
+                "If you did not change your PIN, please reset it right away and contact our support team.<br><br>"
+                "Thank you.<br><br>"
+                "Best regards,<br>"
+                "<strong>Support Team</strong>",
+            ),
+        },
+        "whatsapp": {
+            "otp": (
+                None,
+                "Your verification code is *{otp}*. Please enter this code to complete your verification. "
+                "Kindly note that this code will expire in 3 minutes.",
+            ),
+            "reset_link": (
+                None,
+                "Dear *{full_name}*,\n\n"
+                "We received a request to reset your password. Please click the link below to create a new password:\n\n"
+                "{reset_link}\n\n"
+                "Please note, this password reset link is only valid for *5 minutes*. If you did not request a password reset, please ignore this message.\n\n"
+                "Thank you,\n\n"
+                "Best regards,\n"
+                "*Support Team*",
+            ),
+            "welcome": (
+                None,
+                "Dear *{full_name}*,\n\n"
+                "We are pleased to inform you that your phone number has been successfully verified. "
+                "You can now log in using the following credentials:\n\n"
+                "Phone Number: *{phone_number}*\n"
+                "PIN: *{pin}*\n\n"
+                "Please ensure that you keep your account information secure.\n\n"
+                "Best Regards,\n"
+                "*Support Team*",
+            ),
+            "pin_changed": (
+                None,
+                "Dear *{full_name}*,\n\n"
+                "We are pleased to inform you that your pin has been successfully changed. "
+                "You can now log in using the following credentials:\n\n"
+                "Phone Number: *{phone_number}*\n"
+                "PIN: *{pin}*\n\n"
+                "Please ensure that you keep your account information secure.\n\n"
+                "Best Regards,\n"
+                "*Support Team*",
+            ),
+            "pin_reset": (
+                None,
+                "Dear *{full_name}*,\n\n"
+                "We would like to inform you that your PIN has been successfully changed.\n\n"
+                "Please use the following details to log in to your account:\n\n"
+                "Phone Number: *{phone_number}*\n"
+                "New PIN: *{pin}*\n\n"
+                "For your security, please ensure you keep this information confidential.\n\n"
+                "Should you have any questions or require further assistance, feel free to contact our support team.\n\n"
+                "Best regards,\n"
+                "*Support Team*",
+            ),
+        },
+    },
+}
+
+ESCAPERS: dict[str, Callable[[str], str]] = {
+    "email": escape,
+    "whatsapp": str,
+}
+
+
+@dataclass(slots=True, frozen=True)
+class RenderedMessage:
+    subject: str | None
+    body: str
+
+
+class CompiledTemplate:
+    """
+    A template split once into its static fragments and field names, so a
+    render only escapes the values and joins them with the fragments.
+    """
+
+    __slots__ = ("subject", "fragments", "fields", "escaper")
+
+    def __init__(self, subject: str | None, body: str, channel: str) -> None:
+        fragments, fields = [], []
+        static = ""
+        for literal, field, _, _ in Formatter().parse(body):
+            static += literal
+            if field is None:
+                continue
+            if not field:
+                raise ValueError("Template fields must be named.")
+            fragments.append(static)
+            fields.append(field)
+            static = ""
+        fragments.append(static)
+
+        self.subject = subject
+        self.fragments = tuple(fragments)
+        self.fields = tuple(fields)
+        self.escaper = ESCAPERS[channel]
+
+    def render(self, values: dict) -> RenderedMessage:
+        fragments = self.fragments
+        escaper = self.escaper
+        parts = [fragments[0]]
+        for index, field in enumerate(self.fields, start=1):
+            parts.append(escaper(str(values[field])))
+            parts.append(fragments[index])
+        return RenderedMessage(subject=self.subject, body="".join(parts))
+
+
+compiled_templates: dict[tuple[str, str, str], CompiledTemplate] = {}
+
+
+def compile_templates() -> None:
+    for locale, channels in TEMPLATES.items():
+        for channel, templates in channels.items():
+            for name, (subject, body) in templates.items():
+                compiled_templates[(locale, channel, name)] = CompiledTemplate(
+                    subject=subject, body=body, channel=channel
+                )
+    logging.info("Compiled %s notification templates.", len(compiled_templates))
+
+
+def get_template(name: str, channel: str, locale: str) -> CompiledTemplate:
+    key = (locale, channel, name)
+    template = compiled_templates.get(key)
+    if template is not None:
+        return template
+
+    if not compiled_templates:
+        compile_templates()
+
+    template = compiled_templates.get(key) or compiled_templates.get(
+        (NOTIFICATION_LOCALE, channel, name)
+    )
+    if template is None:
+        raise KeyError(f"Unknown {channel} template {name}.")
+
+    # Remember the fallback so a missing locale is resolved once.
+    compiled_templates[key] = template
+    return template
+
+
+def render_message(
+    name: str, channel: str, locale: str | None = None, **values
+) -> RenderedMessage:
+    return get_template(
+        name=name, channel=channel, locale=locale or NOTIFICATION_LOCALE
+    ).render(values)
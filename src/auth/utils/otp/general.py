@@ -0,0 +1,98 @@
+import hmac
+import time
+import hashlib
+from uuid_extensions import uuid7
+from datetime import datetime
+from pytz import timezone
+from src.auth.utils.logging import logging
+from src.auth.utils.generator import random_number
+from src.secret import OTP_MODE, OTP_SECRET_KEY, OTP_STEP, OTP_TTL
+from src.auth.utils.ephemeral.general import save_otp_data, extract_data_otp
+from src.auth.utils.rate_limit.general import otp_verify_rate_limiter, retry_message
+from src.auth.routers.exceptions import (
+    EntityDoesNotExistError,
+    InvalidOperationError,
+)
+
+OTP_DIGITS = 6
+
+
+def hmac_mode() -> bool:
+    if OTP_MODE.lower() != "hmac":
+        return False
+    if not OTP_SECRET_KEY:
+        logging.warning("OTP_MODE is hmac but OTP_SECRET_KEY is empty, storing OTPs.")
+        return False
+    return True
+
+
+def derive_otp(user_uuid: uuid7, channel: str, destination: str, step: int) -> str:
+    """
+    HOTP style code (RFC 4226 truncation) over the user, the channel, the
+    destination and a time step. A changed email or phone number changes
+    the code, so a code sent to the previous destination stops working.
+    """
+    message = f"{user_uuid}:{channel}:{destination}:{step}".encode()
+    digest = hmac.new(OTP_SECRET_KEY.encode(), message, hashlib.sha256).digest()
+    offset = digest[-1] & 0x0F
+    code = int.from_bytes(digest[offset : offset + 4], "big") & 0x7FFFFFFF
+    return str(code % 10**OTP_DIGITS).zfill(OTP_DIGITS)
+
+
+def current_step() -> int:
+    return int(time.time() // int(OTP_STEP))
+
+
+async def issue_otp(user_uuid: uuid7, channel: str, destination: str) -> str | None:
+    """Return the code to send, or None when it could not be stored."""
+    if hmac_mode():
+        return derive_otp(
+            user_uuid=user_uuid,
+            channel=channel,
+            destination=destination,
+            step=current_step(),
+        )
+
+    otp = str(await random_number(OTP_DIGITS))
+    is_saved = await save_otp_data(user_uuid=user_uuid, otp_number=otp)
+    return otp if is_saved else None
+
+
+async def verify_otp(
+    user_uuid: uuid7, channel: str, destination: str, otp: str
+) -> None:
+    """
+    Raise when `otp` is not the valid code. In hmac mode a step is accepted
+    only while its start is less than OTP_TTL seconds ago, so no code
+    outlives OTP_TTL, with no lookup.
+    """
+    decision = await otp_verify_rate_limiter.hit(key=str(user_uuid))
+    if not decision.allowed:
+        logging.info("OTP verification throttled by %s.", decision.reason)
+        raise InvalidOperationError(detail=retry_message(decision=decision))
+
+    if hmac_mode():
+        now = time.time()
+        step = int(now // int(OTP_STEP))
+        while now - step * int(OTP_STEP) < int(OTP_TTL):
+            expected = derive_otp(
+                user_uuid=user_uuid,
+                channel=channel,
+                destination=destination,
+                step=step,
+            )
+            if hmac.compare_digest(expected, otp):
+                return
+            step -= 1
+        raise InvalidOperationError(detail="Invalid or expired OTP code.")
+
+    otp_data = await extract_data_otp(user_uuid=user_uuid)
+    if not otp_data:
+        logging.info("OTP data not found.")
+        raise EntityDoesNotExistError(detail="Data not found.")
+
+    if datetime.now(timezone("UTC")) > otp_data.blacklisted_at:
+        raise InvalidOperationError(detail="OTP already expired.")
+
+    if not otp_data.otp_number or not hmac.compare_digest(otp_data.otp_number, otp):
+        raise InvalidOperationError(detail="Invalid OTP code.")
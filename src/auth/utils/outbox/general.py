@@ -0,0 +1,233 @@
+import asyncio
+from datetime import timedelta
+from pydantic import EmailStr
+from sqlalchemy.engine.row import Row
+from sqlalchemy.sql import select, and_, or_, Insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.auth.utils.logging import logging
+from src.database.models import email_outbox
+from src.auth.utils.database.general import local_time
+from src.database.connection import database_connection
+from src.auth.utils.forgot_password.general import send_gmail
+from src.auth.utils.circuit_breaker.general import smtp_breaker
+from src.auth.routers.exceptions import EntityDoesNotMatchedError
+from src.secret import (
+    EMAIL_OUTBOX_CONCURRENCY,
+    EMAIL_OUTBOX_MAX_ATTEMPTS,
+    EMAIL_OUTBOX_POLL_INTERVAL,
+    EMAIL_OUTBOX_LEASE,
+)
+
+email_outbox_wakeup = asyncio.Event()
+
+
+def outbox_email_query(
+    email_receiver: EmailStr, email_subject: str, email_body: str
+) -> Insert:
+    return email_outbox.insert().values(
+        created_at=local_time(),
+        email_receiver=email_receiver,
+        email_subject=email_subject,
+        email_body=email_body,
+        status="pending",
+        attempts=0,
+        next_attempt_at=local_time(),
+    )
+
+
+async def enqueue_email(
+    session: AsyncSession, email_receiver: EmailStr, email_subject: str, email_body: str
+) -> None:
+    """
+    Add an email into the outbox inside the caller transaction. Call
+    notify_email_outbox after the commit so delivery starts right away.
+    """
+    await session.execute(
+        outbox_email_query(
+            email_receiver=email_receiver,
+            email_subject=email_subject,
+            email_body=email_body,
+        )
+    )
+
+
+async def queue_email(
+    email_receiver: EmailStr, email_subject: str, email_body: str
+) -> bool:
+    """Add an email into the outbox in its own transaction."""
+    try:
+        async with database_connection().connect() as session:
+            try:
+                await enqueue_email(
+                    session=session,
+                    email_receiver=email_receiver,
+                    email_subject=email_subject,
+                    email_body=email_body,
+                )
+                await session.commit()
+                return True
+            except Exception as E:
+                logging.error("Error while queue_email: %s", E)
+                await session.rollback()
+            finally:
+                await session.close()
+    except Exception as E:
+        logging.error("Error after queue_email: %s", E)
+    return False
+
+
+def notify_email_outbox() -> None:
+    email_outbox_wakeup.set()
+
+
+def retry_delay(attempts: int) -> timedelta:
+    return timedelta(seconds=min(30 * 2 ** (attempts - 1), 3600))
+
+
+async def claim_outbox_emails(limit: int) -> list[Row]:
+    """
+    Lease due emails to this worker. Rows locked by another worker are
+    skipped, and a lease that expired (worker died mid-send) is claimed again.
+    """
+    now = local_time()
+    due_emails = (
+        select(email_outbox.c.id)
+        .where(
+            or_(
+                and_(
+                    email_outbox.c.status == "pending",
+                    email_outbox.c.next_attempt_at <= now,
+                ),
+                and_(
+                    email_outbox.c.status == "sending",
+                    email_outbox.c.locked_until < now,
+                ),
+            )
+        )
+        .order_by(email_outbox.c.next_attempt_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    async with database_connection().connect() as session:
+        try:
+            result = await session.execute(
+                email_outbox.update()
+                .where(email_outbox.c.id.in_(due_emails.scalar_subquery()))
+                .values(
+                    updated_at=now,
+                    status="sending",
+                    attempts=email_outbox.c.attempts + 1,
+                    locked_until=now + timedelta(seconds=int(EMAIL_OUTBOX_LEASE)),
+                )
+                .returning(email_outbox)
+            )
+            emails = result.fetchall()
+            await session.commit()
+            return emails
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+
+async def finish_outbox_email(email: Row, error: Exception | None) -> None:
+    # A body holds OTP codes and reset links; it is dropped once it is no
+    # longer going to be sent.
+    if error is None:
+        values = {
+            "status": "sent",
+            "sent_at": local_time(),
+            "last_error": None,
+            "email_body": None,
+        }
+    elif isinstance(error, EntityDoesNotMatchedError) or email.attempts >= int(
+        EMAIL_OUTBOX_MAX_ATTEMPTS
+    ):
+        values = {"status": "failed", "last_error": str(error), "email_body": None}
+    else:
+        values = {
+            "status": "pending",
+            "next_attempt_at": local_time() + retry_delay(attempts=email.attempts),
+            "last_error": str(error),
+        }
+
+    async with database_connection().connect() as session:
+        try:
+            await session.execute(
+                email_outbox.update()
+                .where(email_outbox.c.id == email.id)
+                .values(updated_at=local_time(), locked_until=None, **values)
+            )
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+
+async def deliver_outbox_email(email: Row, semaphore: asyncio.Semaphore) -> None:
+    async with semaphore:
+        error = None
+        try:
+            await send_gmail(
+                email_receiver=email.email_receiver,
+                email_subject=email.email_subject,
+                email_body=email.email_body,
+            )
+        except Exception as E:
+            logging.error("Error during delivering outbox email %s: %s.", email.id, E)
+            error = E
+
+        try:
+            await finish_outbox_email(email=email, error=error)
+        except Exception as E:
+            # The lease expires and the email is claimed again later.
+            logging.error("Error during finishing outbox email %s: %s.", email.id, E)
+
+
+async def email_outbox_dispatcher() -> None:
+    """
+    Deliver outbox emails with at most EMAIL_OUTBOX_CONCURRENCY sends in
+    flight. Sleeps until an endpoint enqueues an email or the poll interval
+    passes, which also picks up retries and rows written by other workers.
+    """
+    concurrency = int(EMAIL_OUTBOX_CONCURRENCY)
+    semaphore = asyncio.Semaphore(concurrency)
+    deliveries: set[asyncio.Task] = set()
+
+    try:
+        while True:
+            email_outbox_wakeup.clear()
+            free_slots = concurrency - len(deliveries)
+            emails = []
+            # Leave emails pending while SMTP is down instead of burning attempts.
+            if free_slots > 0 and not smtp_breaker.is_open():
+                try:
+                    emails = await claim_outbox_emails(limit=free_slots)
+                except Exception as E:
+                    logging.error("Error during claim_outbox_emails: %s.", E)
+
+            for email in emails:
+                task = asyncio.create_task(
+                    deliver_outbox_email(email=email, semaphore=semaphore)
+                )
+                deliveries.add(task)
+                task.add_done_callback(deliveries.discard)
+
+            if emails and len(deliveries) < concurrency:
+                continue
+
+            waiters = [asyncio.create_task(email_outbox_wakeup.wait()), *deliveries]
+            try:
+                await asyncio.wait(
+                    waiters,
+                    timeout=int(EMAIL_OUTBOX_POLL_INTERVAL),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+            finally:
+                waiters[0].cancel()
+    finally:
+        if deliveries:
+            await asyncio.gather(*deliveries, return_exceptions=True)
@@ -0,0 +1,337 @@
+import abc
+import math
+import time
+from pytz import timezone
+from datetime import datetime, timedelta
+from dataclasses import dataclass
+from sqlalchemy.engine.row import Row
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.dialects.postgresql import insert, Insert
+from sqlalchemy import select, func, case, and_, or_, extract
+from src.auth.utils.logging import logging
+from src.database.models import rate_limits
+from src.database.connection import database_connection
+from src.auth.utils.metrics.general import register_metrics
+from src.secret import (
+    RATE_LIMIT_BACKEND,
+    RATE_LIMIT_MAX_KEYS,
+    REDIS_URL,
+    OTP_COOLDOWN,
+    OTP_DAILY_LIMIT,
+    OTP_DAILY_WINDOW,
+    OTP_TTL,
+    OTP_VERIFY_ATTEMPTS,
+    OTP_VERIFY_DAILY_LIMIT,
+    RESET_PIN_COOLDOWN,
+    RESET_LINK_DAILY_LIMIT,
+)
+
+
+@dataclass(slots=True, frozen=True)
+class RateLimitDecision:
+    allowed: bool
+    reason: str | None = None
+    retry_after: float = 0
+
+
+class RateLimiter(abc.ABC):
+    """
+    A token bucket (burst of `capacity`, one token back every `refill`
+    seconds) combined with at most `limit` hits per `window` seconds,
+    counted from the first hit of the window. A hit consumes from both
+    only when both allow it.
+    """
+
+    def __init__(
+        self, name: str, capacity: int, refill: float, limit: int, window: float
+    ) -> None:
+        self.name = name
+        self.capacity = capacity
+        self.refill = refill
+        self.limit = limit
+        self.window = window
+        self.allowed = 0
+        self.rejected: dict[str, int] = {"cooldown": 0, "daily": 0}
+
+    @abc.abstractmethod
+    async def acquire(self, key: str) -> RateLimitDecision: ...
+
+    async def hit(self, key: str) -> RateLimitDecision:
+        decision = await self.acquire(key=f"{self.name}:{key}")
+        if decision.allowed:
+            self.allowed += 1
+        else:
+            self.rejected[decision.reason] += 1
+        return decision
+
+    async def close(self) -> None:
+        pass
+
+    def metrics(self) -> dict:
+        return {"allowed": self.allowed, "rejected": dict(self.rejected)}
+
+
+class MemoryRateLimiter(RateLimiter):
+    """
+    Per-process state. Each worker enforces its own limits, so use the redis
+    backend when the app runs with more than one worker. Idle buckets are
+    pruned every `prune_interval` seconds, or sooner when `max_keys` is hit.
+    """
+
+    prune_interval = 60
+
+    def __init__(self, max_keys: int = 100000, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.max_keys = max_keys
+        # key -> [tokens, updated_at, hits, window_ends_at]
+        self.states: dict[str, list[float]] = {}
+        self.pruned_at = time.monotonic()
+
+    def prune(self, now: float) -> None:
+        horizon = self.capacity * self.refill
+        self.pruned_at = now
+        self.states = {
+            key: state
+            for key, state in self.states.items()
+            if now - state[1] < horizon or now < state[3]
+        }
+
+    async def acquire(self, key: str) -> RateLimitDecision:
+        # No await in between, so the check and the update are atomic.
+        now = time.monotonic()
+        if now - self.pruned_at >= self.prune_interval:
+            self.prune(now=now)
+        state = self.states.get(key)
+        if state is None:
+            if len(self.states) >= self.max_keys:
+                self.prune(now=now)
+            state = [self.capacity, now, 0, now + self.window]
+            self.states[key] = state
+
+        tokens = min(self.capacity, state[0] + (now - state[1]) / self.refill)
+        if tokens < 1:
+            return RateLimitDecision(
+                allowed=False, reason="cooldown", retry_after=(1 - tokens) * self.refill
+            )
+
+        if now >= state[3]:
+            state[2], state[3] = 0, now + self.window
+        if state[2] >= self.limit:
+            return RateLimitDecision(
+                allowed=False, reason="daily", retry_after=state[3] - now
+            )
+
+        state[0], state[1] = tokens - 1, now
+        state[2] += 1
+        return RateLimitDecision(allowed=True)
+
+    def metrics(self) -> dict:
+        return {**super().metrics(), "keys": len(self.states)}
+
+
+class RedisRateLimiter(RateLimiter):
+    """Shared state for every worker, checked and updated in one script call."""
+
+    script = """
+    local now = tonumber(ARGV[1])
+    local capacity = tonumber(ARGV[2])
+    local refill = tonumber(ARGV[3])
+    local limit = tonumber(ARGV[4])
+    local window = tonumber(ARGV[5])
+
+    local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+    local tokens = tonumber(bucket[1]) or capacity
+    local updated_at = tonumber(bucket[2]) or now
+    tokens = math.min(capacity, tokens + (now - updated_at) / refill)
+    if tokens < 1 then
+        return {0, 'cooldown', math.ceil((1 - tokens) * refill)}
+    end
+
+    local hits = tonumber(redis.call('GET', KEYS[2]) or '0')
+    if hits >= limit then
+        return {0, 'daily', redis.call('PTTL', KEYS[2])}
+    end
+
+    redis.call('HSET', KEYS[1], 'tokens', tostring(tokens - 1), 'updated_at', now)
+    redis.call('PEXPIRE', KEYS[1], math.ceil(capacity * refill))
+    if redis.call('INCR', KEYS[2]) == 1 then
+        redis.call('PEXPIRE', KEYS[2], window)
+    end
+    return {1, '', 0}
+    """
+
+    def __init__(self, url: str, **kwargs) -> None:
+        super().__init__(**kwargs)
+        import redis.asyncio as redis
+
+        self.client = redis.from_url(url)
+        self.acquire_script = self.client.register_script(self.script)
+
+    async def acquire(self, key: str) -> RateLimitDecision:
+        allowed, reason, retry_after_ms = await self.acquire_script(
+            keys=[f"rate:{key}:bucket", f"rate:{key}:window"],
+            args=[
+                int(time.time() * 1000),
+                self.capacity,
+                int(self.refill * 1000),
+                self.limit,
+                int(self.window * 1000),
+            ],
+        )
+        if allowed:
+            return RateLimitDecision(allowed=True)
+        return RateLimitDecision(
+            allowed=False,
+            reason=reason.decode() if isinstance(reason, bytes) else reason,
+            retry_after=max(retry_after_ms, 0) / 1000,
+        )
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+
+class PostgresRateLimiter(RateLimiter):
+    """
+    Shared state in the rate_limits table. An allowed hit is decided and
+    recorded by one conditional upsert; concurrent hits on the same key
+    queue on the row inside that statement, no explicit lock is taken.
+    """
+
+    def refilled_tokens(self) -> ColumnElement:
+        elapsed = extract("epoch", func.now() - rate_limits.c.updated_at)
+        return func.least(self.capacity, rate_limits.c.tokens + elapsed / self.refill)
+
+    def hit_query(self, key: str) -> Insert:
+        window = timedelta(seconds=self.window)
+        refilled = self.refilled_tokens()
+        window_expired = rate_limits.c.window_ends_at <= func.now()
+        return (
+            insert(rate_limits)
+            .values(
+                key=key,
+                tokens=self.capacity - 1,
+                updated_at=func.now(),
+                hits=1,
+                window_ends_at=func.now() + window,
+            )
+            .on_conflict_do_update(
+                index_elements=["key"],
+                set_={
+                    "tokens": refilled - 1,
+                    "updated_at": func.now(),
+                    "hits": case((window_expired, 1), else_=rate_limits.c.hits + 1),
+                    "window_ends_at": case(
+                        (window_expired, func.now() + window),
+                        else_=rate_limits.c.window_ends_at,
+                    ),
+                },
+                where=and_(
+                    refilled >= 1,
+                    or_(window_expired, rate_limits.c.hits < self.limit),
+                ),
+            )
+            .returning(rate_limits.c.id)
+        )
+
+    async def attempt(self, key: str) -> tuple[bool, Row | None]:
+        async with database_connection().connect() as session:
+            try:
+                result = await session.execute(self.hit_query(key=key))
+                if result.fetchone():
+                    await session.commit()
+                    return True, None
+
+                # Rejected, the upsert changed nothing; read why.
+                result = await session.execute(
+                    select(
+                        self.refilled_tokens().label("tokens"),
+                        extract(
+                            "epoch", rate_limits.c.window_ends_at - func.now()
+                        ).label("window_left"),
+                    ).where(rate_limits.c.key == key)
+                )
+                state = result.fetchone()
+                await session.commit()
+                return False, state
+            except Exception:
+                await session.rollback()
+                raise
+            finally:
+                await session.close()
+
+    async def acquire(self, key: str) -> RateLimitDecision:
+        allowed, state = await self.attempt(key=key)
+        if state is None and not allowed:
+            # The reaper removed the row between the two statements, so the
+            # bucket is full again; the next upsert inserts a fresh row.
+            allowed, state = await self.attempt(key=key)
+        if allowed:
+            return RateLimitDecision(allowed=True)
+        if state is None:
+            return RateLimitDecision(allowed=False, reason="cooldown", retry_after=0)
+
+        if state.tokens < 1:
+            return RateLimitDecision(
+                allowed=False,
+                reason="cooldown",
+                retry_after=(1 - state.tokens) * self.refill,
+            )
+        return RateLimitDecision(
+            allowed=False, reason="daily", retry_after=max(float(state.window_left), 0)
+        )
+
+
+def create_rate_limiter(name: str, **kwargs) -> RateLimiter:
+    if RATE_LIMIT_BACKEND.lower() == "redis":
+        logging.info("Rate limiter %s uses redis.", name)
+        return RedisRateLimiter(name=name, url=REDIS_URL, **kwargs)
+    if RATE_LIMIT_BACKEND.lower() == "postgres":
+        logging.info("Rate limiter %s uses postgres.", name)
+        return PostgresRateLimiter(name=name, **kwargs)
+    return MemoryRateLimiter(name=name, max_keys=int(RATE_LIMIT_MAX_KEYS), **kwargs)
+
+
+# One bucket per user shared by the email and phone number channels.
+otp_rate_limiter = create_rate_limiter(
+    name="otp",
+    capacity=1,
+    refill=float(OTP_COOLDOWN),
+    limit=int(OTP_DAILY_LIMIT),
+    window=float(OTP_DAILY_WINDOW),
+)
+# Every verification attempt takes a token, so guessing a code gets
+# OTP_VERIFY_ATTEMPTS tries per code lifetime at most.
+otp_verify_rate_limiter = create_rate_limiter(
+    name="otp-verify",
+    capacity=int(OTP_VERIFY_ATTEMPTS),
+    refill=float(OTP_TTL),
+    limit=int(OTP_VERIFY_DAILY_LIMIT),
+    window=86400,
+)
+reset_link_rate_limiter = create_rate_limiter(
+    name="reset-link",
+    capacity=1,
+    refill=float(RESET_PIN_COOLDOWN),
+    limit=int(RESET_LINK_DAILY_LIMIT),
+    window=86400,
+)
+rate_limiters = (otp_rate_limiter, otp_verify_rate_limiter, reset_link_rate_limiter)
+register_metrics(
+    name="rate_limiter",
+    collector=lambda: {limiter.name: limiter.metrics() for limiter in rate_limiters},
+)
+
+
+async def close_rate_limiter() -> None:
+    for limiter in rate_limiters:
+        await limiter.close()
+
+
+def retry_message(decision: RateLimitDecision) -> str:
+    if decision.reason == "cooldown":
+        return f"Should wait in {math.ceil(decision.retry_after)} seconds."
+
+    retry_at = datetime.now(timezone("Asia/Jakarta")) + timedelta(
+        seconds=decision.retry_after
+    )
+    return f"Maximum API hit reached. You can try again after {retry_at.strftime('%Y-%m-%d %H:%M:%S')}."
@@ -0,0 +1,199 @@
+import time
+import asyncio
+from datetime import datetime, timedelta
+from sqlalchemy import select, func, and_, Delete
+from sqlalchemy.sql.schema import Table, Column
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.ext.asyncio import AsyncConnection
+from src.auth.utils.logging import logging
+from src.auth.utils.database.general import local_time
+from src.auth.utils.metrics.general import register_metrics
+from src.auth.utils.rate_limit.general import rate_limiters
+from src.database.connection import database_connection
+from src.database.models import (
+    send_otps,
+    reset_pins,
+    user_sessions,
+    rate_limits,
+    email_outbox,
+)
+from src.secret import (
+    REAPER_INTERVAL,
+    REAPER_BATCH_SIZE,
+    REAPER_BATCH_PAUSE,
+    REAPER_OTP_AUDIT_RETENTION,
+    REAPER_EMAIL_OUTBOX_RETENTION,
+)
+
+# pg advisory lock key, "finreapr" in ascii.
+REAPER_LOCK_ID = 0x66696E7265617072
+
+reaper_metrics: dict = {
+    "runs": 0,
+    "skipped": 0,
+    "last_run_at": None,
+    "last_duration_ms": None,
+    "rows_purged": {},
+    "lag_seconds": {},
+}
+register_metrics(name="reaper", collector=lambda: reaper_metrics)
+
+
+def bucket_refill_horizon() -> float:
+    """Seconds for the slowest limiter bucket to refill from empty."""
+    return max(limiter.capacity * limiter.refill for limiter in rate_limiters)
+
+
+def reap_rules(
+    now: datetime,
+) -> list[tuple[Table, Column, datetime, ColumnElement | None]]:
+    """
+    Table, expiry column, cutoff and an optional extra condition; matching
+    rows with expiry before cutoff go.
+    """
+    return [
+        (
+            send_otps,
+            send_otps.c.created_at,
+            now - timedelta(days=int(REAPER_OTP_AUDIT_RETENTION)),
+            None,
+        ),
+        (reset_pins, reset_pins.c.blacklisted_at, now, None),
+        # Revoked sessions are kept until they expire, as any other.
+        (user_sessions, user_sessions.c.expires_at, now, None),
+        # Pending emails stay however old they are.
+        (
+            email_outbox,
+            email_outbox.c.updated_at,
+            now - timedelta(days=int(REAPER_EMAIL_OUTBOX_RETENTION)),
+            email_outbox.c.status.in_(["sent", "failed"]),
+        ),
+        # A bucket whose window ended longer ago than the slowest limiter
+        # takes to refill is full again, the same as having no row.
+        (
+            rate_limits,
+            rate_limits.c.window_ends_at,
+            now - timedelta(seconds=bucket_refill_horizon()),
+            None,
+        ),
+    ]
+
+
+def expired_condition(
+    column: Column, cutoff: datetime, condition: ColumnElement | None
+) -> ColumnElement:
+    expired = column < cutoff
+    return expired if condition is None else and_(expired, condition)
+
+
+def purge_batch_query(
+    table: Table,
+    column: Column,
+    cutoff: datetime,
+    limit: int,
+    condition: ColumnElement | None = None,
+) -> Delete:
+    (primary_key,) = table.primary_key.columns
+    expired = (
+        select(primary_key)
+        .where(expired_condition(column=column, cutoff=cutoff, condition=condition))
+        .order_by(column)
+        .limit(limit)
+    )
+    return table.delete().where(primary_key.in_(expired.scalar_subquery()))
+
+
+async def purge_table(
+    session: AsyncConnection,
+    table: Table,
+    column: Column,
+    cutoff: datetime,
+    condition: ColumnElement | None = None,
+) -> int:
+    """Delete in short transactions, pausing between batches to spare the db."""
+    batch_size = int(REAPER_BATCH_SIZE)
+    purged = 0
+    while True:
+        result = await session.execute(
+            purge_batch_query(
+                table=table,
+                column=column,
+                cutoff=cutoff,
+                limit=batch_size,
+                condition=condition,
+            )
+        )
+        await session.commit()
+        purged += result.rowcount
+        if result.rowcount < batch_size:
+            break
+        await asyncio.sleep(float(REAPER_BATCH_PAUSE))
+
+    result = await session.execute(
+        select(func.min(column)).where(
+            expired_condition(column=column, cutoff=cutoff, condition=condition)
+        )
+    )
+    oldest = result.scalar()
+    await session.commit()
+    reaper_metrics["lag_seconds"][table.name] = (
+        round((cutoff - oldest).total_seconds(), 2) if oldest else 0
+    )
+    return purged
+
+
+async def reap_expired_rows() -> dict[str, int] | None:
+    """
+    Purge expired rows once. The pass holds a session advisory lock, so
+    when several workers run the reaper only one of them does the work.
+    """
+    started = time.perf_counter()
+    async with database_connection().connect() as session:
+        try:
+            result = await session.execute(
+                select(func.pg_try_advisory_lock(REAPER_LOCK_ID))
+            )
+            locked = result.scalar()
+            await session.commit()
+            if not locked:
+                reaper_metrics["skipped"] += 1
+                return None
+
+            try:
+                purged = {}
+                for table, column, cutoff, condition in reap_rules(now=local_time()):
+                    purged[table.name] = await purge_table(
+                        session=session,
+                        table=table,
+                        column=column,
+                        cutoff=cutoff,
+                        condition=condition,
+                    )
+                    rows_purged = reaper_metrics["rows_purged"]
+                    rows_purged[table.name] = (
+                        rows_purged.get(table.name, 0) + purged[table.name]
+                    )
+            finally:
+                await session.rollback()
+                await session.execute(select(func.pg_advisory_unlock(REAPER_LOCK_ID)))
+                await session.commit()
+        finally:
+            await session.close()
+
+    reaper_metrics["runs"] += 1
+    reaper_metrics["last_run_at"] = local_time().isoformat()
+    reaper_metrics["last_duration_ms"] = round(
+        (time.perf_counter() - started) * 1000, 2
+    )
+    logging.info("Reaper purged %s.", purged)
+    return purged
+
+
+async def expired_rows_reaper() -> None:
+    while True:
+        try:
+            await reap_expired_rows()
+        except Exception as E:
+            logging.error("Error during reap_expired_rows: %s.", E)
+
+        await asyncio.sleep(int(REAPER_INTERVAL))
@@ -11,6 +11,17 @@ class MoneySpendSchema(BaseModel):
     budget: int
 
 
+class CategoryBudget(BaseModel):
+    category: str
+    budget: int
+
+
+class BulkMoneySpendSchema(BaseModel):
+    month: int = Field(default=local_time().month, ge=1, le=12)
+    year: int = Field(default=local_time().year, ge=1000, le=9999)
+    categories: list[CategoryBudget] = Field(min_length=1, max_length=200)
+
+
 class UpdateCategorySchema(BaseModel):
     month: int = Field(default=local_time().month, ge=1, le=12)
     year: int = Field(default=local_time().year, ge=1000, le=9999)
@@ -18,6 +29,29 @@ class UpdateCategorySchema(BaseModel):
     changed_category_into: str
 
 
+class CopyMonthlySchema(BaseModel):
+    source_month: int = Field(ge=1, le=12)
+    source_year: int = Field(ge=1000, le=9999)
+    target_month: int = Field(ge=1, le=12)
+    target_year: int = Field(ge=1000, le=9999)
+    budget_percentage: int = Field(default=100, ge=0, le=1000)
+    budget_overrides: dict[str, int] = Field(default_factory=dict)
+
+
+class AutoCopySchema(BaseModel):
+    enabled: bool
+    budget_percentage: int = Field(default=100, ge=0, le=1000)
+
+
+class RenameCategory(BaseModel):
+    month: int = Field(default=local_time().month, ge=1, le=12)
+    year: int = Field(default=local_time().year, ge=1000, le=9999)
+    end_month: int | None = Field(default=None, ge=1, le=12)
+    end_year: int | None = Field(default=None, ge=1000, le=9999)
+    category: str
+    changed_category_into: str
+
+
 class UpdateCategorySpending(BaseModel):
     spend_day: int = Field(default=local_time().day, ge=1, le=31)
     changed_spend_day: int = Field(default=local_time().day, ge=1, le=31)
@@ -39,6 +73,17 @@ class DeleteCategorySchema(BaseModel):
     category: str
 
 
+class DeleteCategoryCascade(BaseModel):
+    month: int = Field(default=local_time().month, ge=1, le=12)
+    year: int = Field(default=local_time().year, ge=1000, le=9999)
+    end_month: int | None = Field(default=None, ge=1, le=12)
+    end_year: int | None = Field(default=None, ge=1000, le=9999)
+    category: str
+    # Blank names are rejected rather than read as "no reassign", so a
+    # mistyped target never deletes the spending.
+    reassign_to: str | None = Field(default=None, min_length=1, pattern=r"\S")
+
+
 class CreateSpend(BaseModel):
     spend_day: int = Field(default=local_time().day, ge=1, le=31)
     spend_month: int = Field(default=local_time().month, ge=1, le=12)
@@ -0,0 +1,207 @@
+import asyncio
+from datetime import datetime
+from uuid_extensions import uuid7
+from sqlalchemy import select, case, literal, null, exists, DateTime
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.dialects.postgresql import insert, Insert
+from src.auth.utils.logging import logging
+from src.secret import SCHEMA_COPY_CHUNK_SIZE
+from src.auth.utils.cache.general import month_response_cache
+from src.auth.utils.autocomplete.general import category_autocomplete
+from src.auth.utils.database.general import bump_versions_query, local_time
+from src.database.connection import database_connection
+from src.database.models import money_spend_schemas, schema_auto_copies
+
+
+def previous_period(month: int, year: int) -> tuple[int, int]:
+    if month == 1:
+        return 12, year - 1
+    return month - 1, year
+
+
+def next_month_start(time: datetime) -> datetime:
+    month, year = (
+        (1, time.year + 1) if time.month == 12 else (time.month + 1, time.year)
+    )
+    return time.replace(
+        year=year, month=month, day=1, hour=0, minute=0, second=0, microsecond=0
+    )
+
+
+def copy_schema_query(
+    source_month: int,
+    source_year: int,
+    target_month: int,
+    target_year: int,
+    budget: ColumnElement,
+    *filters: ColumnElement,
+) -> Insert:
+    """
+    Build a single INSERT ... SELECT that clones source month categories into the
+    target month. Categories that already exist in the target month are skipped.
+    """
+
+    rows = select(
+        literal(local_time(), DateTime(timezone=True)),
+        null(),
+        money_spend_schemas.c.user_uuid,
+        literal(target_month),
+        literal(target_year),
+        money_spend_schemas.c.category,
+        budget,
+    ).where(
+        money_spend_schemas.c.month == source_month,
+        money_spend_schemas.c.year == source_year,
+        *filters,
+    )
+
+    return (
+        insert(money_spend_schemas)
+        .from_select(
+            [
+                "created_at",
+                "updated_at",
+                "user_uuid",
+                "month",
+                "year",
+                "category",
+                "budget",
+            ],
+            rows,
+        )
+        .on_conflict_do_nothing(
+            index_elements=["user_uuid", "year", "month", "category"]
+        )
+        .returning(money_spend_schemas.c.user_uuid, money_spend_schemas.c.category)
+    )
+
+
+def copy_user_schema_query(
+    user_uuid: uuid7,
+    source_month: int,
+    source_year: int,
+    target_month: int,
+    target_year: int,
+    budget_percentage: int = 100,
+    budget_overrides: dict[str, int] | None = None,
+) -> Insert:
+    budget = money_spend_schemas.c.budget * budget_percentage // 100
+    if budget_overrides:
+        budget = case(
+            budget_overrides, value=money_spend_schemas.c.category, else_=budget
+        )
+
+    return copy_schema_query(
+        source_month,
+        source_year,
+        target_month,
+        target_year,
+        budget,
+        money_spend_schemas.c.user_uuid == user_uuid,
+    )
+
+
+async def copy_schema_for_auto_copy_users(
+    target_month: int, target_year: int, chunk_size: int = int(SCHEMA_COPY_CHUNK_SIZE)
+) -> int:
+    """
+    Copy previous month schema into the target month for every opted-in user
+    that has no category in the target month yet. Users are processed in chunks
+    by id, one transaction per chunk.
+    """
+
+    source_month, source_year = previous_period(month=target_month, year=target_year)
+    target_schema = money_spend_schemas.alias("target_schema")
+    target_is_empty = ~exists().where(
+        target_schema.c.user_uuid == schema_auto_copies.c.user_uuid,
+        target_schema.c.month == target_month,
+        target_schema.c.year == target_year,
+    )
+    copied = 0
+    last_id = 0
+
+    while True:
+        async with database_connection().connect() as session:
+            try:
+                result = await session.execute(
+                    select(schema_auto_copies.c.id)
+                    .where(schema_auto_copies.c.id > last_id)
+                    .order_by(schema_auto_copies.c.id)
+                    .limit(chunk_size)
+                )
+                chunk = result.scalars().all()
+                if not chunk:
+                    break
+
+                query = copy_schema_query(
+                    source_month,
+                    source_year,
+                    target_month,
+                    target_year,
+                    money_spend_schemas.c.budget
+                    * schema_auto_copies.c.budget_percentage
+                    // 100,
+                    money_spend_schemas.c.user_uuid == schema_auto_copies.c.user_uuid,
+                    schema_auto_copies.c.id > last_id,
+                    schema_auto_copies.c.id <= chunk[-1],
+                    target_is_empty,
+                )
+                result = await session.execute(query)
+                rows = result.fetchall()
+                if rows:
+                    await session.execute(
+                        bump_versions_query(
+                            keys=[
+                                (row.user_uuid, target_month, target_year)
+                                for row in rows
+                            ]
+                        )
+                    )
+                copied += len(rows)
+                await session.commit()
+                for row in rows:
+                    month_response_cache.invalidate(
+                        user_uuid=row.user_uuid, year=target_year, month=target_month
+                    )
+                    category_autocomplete.add_category(
+                        user_uuid=row.user_uuid, category=row.category
+                    )
+                last_id = chunk[-1]
+            except Exception as E:
+                logging.error("Error during copy_schema_for_auto_copy_users: %s.", E)
+                await session.rollback()
+                raise
+            finally:
+                await session.close()
+
+    logging.info(
+        "Copied %s categories from %s/%s into %s/%s.",
+        copied,
+        source_month,
+        source_year,
+        target_month,
+        target_year,
+    )
+    return copied
+
+
+async def schema_copy_scheduler() -> None:
+    """
+    Copy schemas for opted-in users on startup (to catch up a missed rollover)
+    and then at the beginning of every month. Copying is idempotent, so running
+    it in several workers only skips rows that already exist.
+    """
+
+    while True:
+        now = local_time()
+        try:
+            await copy_schema_for_auto_copy_users(
+                target_month=now.month, target_year=now.year
+            )
+        except Exception as E:
+            logging.error("Error after schema_copy_scheduler: %s.", E)
+            await asyncio.sleep(300)
+            continue
+
+        rollover = next_month_start(time=local_time())
+        await asyncio.sleep((rollover - local_time()).total_seconds())
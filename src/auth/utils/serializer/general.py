@@ -0,0 +1,27 @@
+import orjson
+from uuid import UUID
+from decimal import Decimal
+from pydantic import BaseModel
+
+
+def encode_default(value):
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    raise TypeError(f"Type {type(value).__name__} is not JSON serializable.")
+
+
+def render_json(content) -> bytes:
+    # Same wire format as the pydantic response_model path: UTC as "Z",
+    # Decimal as a string.
+    return orjson.dumps(content, default=encode_default, option=orjson.OPT_UTC_Z)
+
+
+def render_response(success: bool, message: str, data) -> bytes:
+    """
+    Encode a ResponseDefault shaped body straight to bytes. Row dataclasses,
+    datetimes and UUIDs are handled natively by orjson, without building
+    intermediate dicts or validating through response_model.
+    """
+    return render_json({"success": success, "message": message, "data": data})
@@ -0,0 +1,182 @@
+import time
+import asyncio
+import aiosmtplib
+from collections import deque
+from email.message import EmailMessage
+from src.auth.utils.logging import logging
+from src.auth.utils.metrics.general import register_metrics
+from src.secret import (
+    GOOGLE_DEFAULT_EMAIL,
+    GOOGLE_APP_PASSWORD,
+    GOOGLE_SMTP_SERVER,
+    GOOGLE_SMTP_PORT,
+    SMTP_POOL_SIZE,
+    SMTP_IDLE_TIMEOUT,
+    SMTP_TIMEOUT,
+)
+
+
+class SMTPConnectionPool:
+    """
+    Authenticated SMTP connections kept open between messages. At most `size`
+    connections exist at once; a connection idle longer than `idle_timeout`
+    is replaced before use because servers drop quiet sessions.
+    """
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int | str,
+        username: str | None = None,
+        password: str | None = None,
+        size: int = 4,
+        idle_timeout: float = 60,
+        timeout: float = 30,
+        use_tls: bool | None = None,
+    ) -> None:
+        self.hostname = hostname
+        self.port = port
+        self.username = username
+        self.password = password
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.use_tls = use_tls
+        self.idle: deque[tuple[aiosmtplib.SMTP, float]] = deque()
+        self.slots = asyncio.Semaphore(size)
+        self.latencies: deque[float] = deque(maxlen=1024)
+        self.sends = 0
+        self.failures = 0
+        self.connections_opened = 0
+        self.reconnects = 0
+
+    async def open_connection(self) -> aiosmtplib.SMTP:
+        port = int(self.port)
+        use_tls = port == 465 if self.use_tls is None else self.use_tls
+        client = aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=port,
+            username=self.username,
+            password=self.password,
+            use_tls=use_tls,
+            start_tls=False if self.use_tls is False else None,
+            timeout=self.timeout,
+        )
+        await client.connect()
+        self.connections_opened += 1
+        return client
+
+    async def close_connection(self, client: aiosmtplib.SMTP) -> None:
+        try:
+            if client.is_connected:
+                await client.quit()
+        except Exception:
+            client.close()
+
+    async def acquire(self) -> aiosmtplib.SMTP:
+        await self.slots.acquire()
+        try:
+            while self.idle:
+                client, last_used = self.idle.pop()
+                if (
+                    client.is_connected
+                    and time.monotonic() - last_used < self.idle_timeout
+                ):
+                    return client
+
+                self.reconnects += 1
+                await self.close_connection(client=client)
+            return await self.open_connection()
+        except BaseException:
+            self.slots.release()
+            raise
+
+    async def release(self, client: aiosmtplib.SMTP, reusable: bool = True) -> None:
+        try:
+            if reusable and client.is_connected:
+                self.idle.append((client, time.monotonic()))
+            else:
+                await self.close_connection(client=client)
+        finally:
+            self.slots.release()
+
+    async def send_message(self, message: EmailMessage) -> None:
+        started = time.perf_counter()
+        try:
+            for attempt in range(2):
+                client = await self.acquire()
+                try:
+                    await client.send_message(message)
+                except aiosmtplib.SMTPServerDisconnected:
+                    await self.release(client=client, reusable=False)
+                    if attempt:
+                        raise
+                    # The server closed a pooled session, retry on a fresh one.
+                    self.reconnects += 1
+                    continue
+                except (
+                    aiosmtplib.SMTPResponseException,
+                    aiosmtplib.SMTPRecipientsRefused,
+                ):
+                    # A refused message leaves the session usable once reset.
+                    try:
+                        await client.rset()
+                    except Exception:
+                        await self.release(client=client, reusable=False)
+                    else:
+                        await self.release(client=client)
+                    raise
+                except BaseException:
+                    await self.release(client=client, reusable=False)
+                    raise
+
+                await self.release(client=client)
+                break
+        except BaseException:
+            self.failures += 1
+            raise
+
+        self.sends += 1
+        self.latencies.append(time.perf_counter() - started)
+
+    async def close(self) -> None:
+        while self.idle:
+            client, _ = self.idle.pop()
+            await self.close_connection(client=client)
+
+    def metrics(self) -> dict:
+        latencies = sorted(self.latencies)
+        latency = {}
+        if latencies:
+            latency = {
+                "avg_ms": round(sum(latencies) / len(latencies) * 1000, 2),
+                "p50_ms": round(latencies[len(latencies) // 2] * 1000, 2),
+                "p95_ms": round(latencies[int(len(latencies) * 0.95)] * 1000, 2),
+                "max_ms": round(latencies[-1] * 1000, 2),
+            }
+
+        return {
+            "sends": self.sends,
+            "failures": self.failures,
+            "idle_connections": len(self.idle),
+            "connections_opened": self.connections_opened,
+            "reconnects": self.reconnects,
+            "latency": latency,
+        }
+
+
+smtp_pool = SMTPConnectionPool(
+    hostname=GOOGLE_SMTP_SERVER,
+    port=GOOGLE_SMTP_PORT,
+    username=GOOGLE_DEFAULT_EMAIL,
+    password=GOOGLE_APP_PASSWORD,
+    size=int(SMTP_POOL_SIZE),
+    idle_timeout=float(SMTP_IDLE_TIMEOUT),
+    timeout=float(SMTP_TIMEOUT),
+)
+register_metrics(name="smtp", collector=smtp_pool.metrics)
+
+
+async def close_smtp_pool() -> None:
+    logging.info("Closing SMTP connections.")
+    await smtp_pool.close()
@@ -1,6 +1,11 @@
+import time
+import asyncio
 from src.auth.utils.logging import logging
 from authlib.integrations.starlette_client import OAuth
-from src.secret import GOOGLE_CLIENT_ID, GOOGLE_CLIENT_SECRET
+from src.secret import GOOGLE_CLIENT_ID, GOOGLE_CLIENT_SECRET, OIDC_METADATA_TTL
+from src.auth.utils.http_client.general import http_clients, get_http_client
+
+oauth_registry: OAuth | None = None
 
 
 async def google_oauth_configuration(
@@ -10,6 +15,16 @@ async def google_oauth_configuration(
     redirect_url: str = "http://localhost:8000/api/v1/google/auth",
     prompt: str = "select_account",
 ) -> OAuth:
+    """
+    Return the process-wide OAuth registry. The client is registered once and
+    keeps its discovery document and JWKS in `server_metadata`, which
+    oidc_metadata_refresher renews in the background.
+    """
+    global oauth_registry
+
+    if oauth_registry is not None:
+        return oauth_registry
+
     try:
         oauth = OAuth()
         oauth.register(
@@ -21,9 +36,46 @@ async def google_oauth_configuration(
                 "scope": scope,
                 "redirect_url": redirect_url,
                 "prompt": prompt,
+                "transport": http_clients.shared_transport(name="google"),
             },
         )
+        oauth_registry = oauth
         return oauth
     except Exception as E:
-        logging.error(f"Error after google_oauth_configuration: {E}")
+        logging.error("Error after google_oauth_configuration: %s", E)
     return None
+
+
+async def refresh_oauth_metadata(name: str = "google") -> None:
+    oauth = await google_oauth_configuration(name=name)
+    client = oauth.create_client(name)
+    http_client = get_http_client(name=name)
+
+    response = await http_client.get(client._server_metadata_url)
+    response.raise_for_status()
+    metadata = response.json()
+
+    response = await http_client.get(metadata["jwks_uri"])
+    response.raise_for_status()
+
+    # Swap in a complete document at once, requests in flight keep the old one.
+    client.server_metadata = {
+        **client.server_metadata,
+        **metadata,
+        "jwks": response.json(),
+        "_loaded_at": time.time(),
+    }
+    logging.info("OIDC metadata of %s refreshed.", name)
+
+
+async def oidc_metadata_refresher(name: str = "google") -> None:
+    while True:
+        try:
+            await refresh_oauth_metadata(name=name)
+        except Exception as E:
+            # authlib still loads the metadata on demand if nothing is cached.
+            logging.error("Error during refresh_oauth_metadata: %s.", E)
+            await asyncio.sleep(60)
+            continue
+
+        await asyncio.sleep(int(OIDC_METADATA_TTL))
@@ -0,0 +1,22 @@
+import httpx
+from src.secret import LOCAL_WHATSAPP_API
+from src.auth.routers.exceptions import ServiceError
+from src.auth.utils.request_format import SendOTPPayload
+from src.auth.utils.circuit_breaker.general import whatsapp_breaker
+from src.auth.utils.http_client.general import get_http_client
+
+
+async def post_whatsapp_message(payload: SendOTPPayload) -> httpx.Response:
+    response = await get_http_client(name="whatsapp").post(
+        LOCAL_WHATSAPP_API, json=dict(payload)
+    )
+    if response.status_code != 200:
+        raise ServiceError(
+            detail="Failed to send OTP via WhatsApp.", name="Whatsapp API"
+        )
+    return response
+
+
+async def send_whatsapp_message(payload: SendOTPPayload) -> httpx.Response:
+    """post a message through the WhatsApp circuit breaker."""
+    return await whatsapp_breaker.call(post_whatsapp_message, payload=payload)
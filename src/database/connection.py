@@ -30,9 +30,10 @@ def database_connection(
         return engine
     except (OperationalError, DBAPIError, InterfaceError) as SQLError:
         logging.error(
-            f"Error from database server: {SQLError}.\n Please make sure your database server is turned on."
+            "Error from database server: %s.\n Please make sure your database server is turned on.",
+            SQLError,
         )
     except Exception as E:
-        logging.error(f"Error connecting to PostgreSQL: {E}")
+        logging.error("Error connecting to PostgreSQL: %s", E)
 
     return None
@@ -0,0 +1,92 @@
+from sqlalchemy import text, select, func
+from sqlalchemy.ext.asyncio import AsyncConnection
+from src.auth.utils.logging import logging
+
+# pg advisory lock key, "finmigra" in ascii.
+MIGRATION_LOCK_ID = 0x66696E6D69677261
+
+
+async def index_exists(connection: AsyncConnection, name: str) -> bool:
+    result = await connection.execute(select(func.to_regclass(name)))
+    return result.scalar() is not None
+
+
+async def dedupe_money_spend_schemas(connection: AsyncConnection) -> None:
+    """
+    Keep the latest written row of each (user, year, month, category) so the
+    unique index can be built; spending refers to categories by name, so
+    nothing points at the removed rows. Listings of the touched months get a
+    new version, which drops cached responses and stale ETags.
+    """
+    if await index_exists(
+        connection=connection, name="uq_money_spend_schemas_user_period_category"
+    ):
+        return
+
+    result = await connection.execute(
+        text(
+            """
+            WITH removed AS (
+                DELETE FROM money_spend_schemas AS duplicate
+                USING money_spend_schemas AS kept
+                WHERE duplicate.user_uuid = kept.user_uuid
+                    AND duplicate.year = kept.year
+                    AND duplicate.month = kept.month
+                    AND duplicate.category = kept.category
+                    AND (COALESCE(duplicate.updated_at, duplicate.created_at), duplicate.id)
+                        < (COALESCE(kept.updated_at, kept.created_at), kept.id)
+                RETURNING duplicate.user_uuid, duplicate.year, duplicate.month
+            )
+            INSERT INTO month_versions (updated_at, user_uuid, month, year, version)
+            SELECT DISTINCT now(), user_uuid, month, year, 1 FROM removed
+            ON CONFLICT (user_uuid, year, month) DO UPDATE
+            SET updated_at = EXCLUDED.updated_at, version = month_versions.version + 1
+            """
+        )
+    )
+    logging.info("Deduplicated money_spend_schemas in %s months.", result.rowcount)
+
+
+async def scrub_email_outbox_bodies(connection: AsyncConnection) -> None:
+    """Finished emails keep no body, as finish_outbox_email now does."""
+    await connection.execute(
+        text("ALTER TABLE email_outbox ALTER COLUMN email_body DROP NOT NULL")
+    )
+    await connection.execute(
+        text(
+            """
+            UPDATE email_outbox SET email_body = NULL
+            WHERE status IN ('sent', 'failed') AND email_body IS NOT NULL
+            """
+        )
+    )
+
+
+async def drop_money_spends_trigram_indexes(connection: AsyncConnection) -> None:
+    """The per-user composite trigram indexes replace the table-wide ones."""
+    for name in ("ix_money_spends_description_trgm", "ix_money_spends_category_trgm"):
+        await connection.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
+
+async def drop_legacy_token_tables(connection: AsyncConnection) -> None:
+    """Sessions replaced per-login token rows; nothing reads or reaps them."""
+    for name in ("blacklist_tokens", "user_tokens"):
+        await connection.execute(text(f"DROP TABLE IF EXISTS {name}"))
+
+
+MIGRATIONS = [
+    dedupe_money_spend_schemas,
+    scrub_email_outbox_bodies,
+    drop_money_spends_trigram_indexes,
+    drop_legacy_token_tables,
+]
+
+
+async def run_migrations(connection: AsyncConnection) -> None:
+    """
+    Data fixes that must land before create_indexes. Each one is idempotent;
+    the transaction lock keeps workers starting together from racing.
+    """
+    await connection.execute(select(func.pg_advisory_xact_lock(MIGRATION_LOCK_ID)))
+    for migration in MIGRATIONS:
+        await migration(connection=connection)
@@ -1,14 +1,19 @@
 from sqlalchemy.dialects.postgresql import UUID
 from src.database.connection import database_connection
+from src.database.migrations import run_migrations
 from sqlalchemy import (
+    text,
+    Index,
     MetaData,
     Table,
     Column,
     Integer,
     String,
+    Text,
     DateTime,
     BigInteger,
     Boolean,
+    Float,
 )
 
 meta = MetaData()
@@ -42,6 +47,30 @@ money_spends = Table(
     Column("category", String(255), nullable=False),
     Column("description", String(255), nullable=False),
     Column("amount", BigInteger, nullable=False),
+    Index(
+        "ix_money_spends_user_spend_date",
+        "user_uuid",
+        "spend_year",
+        "spend_month",
+        "spend_day",
+        "id",
+    ),
+    # Search always filters on one user, so user_uuid leads the trigram
+    # indexes (btree_gin) and a keyword only scans that user's postings.
+    Index(
+        "ix_money_spends_user_description_trgm",
+        "user_uuid",
+        "description",
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    ),
+    Index(
+        "ix_money_spends_user_category_trgm",
+        "user_uuid",
+        "category",
+        postgresql_using="gin",
+        postgresql_ops={"category": "gin_trgm_ops"},
+    ),
 )
 
 money_spend_schemas = Table(
@@ -55,26 +84,51 @@ money_spend_schemas = Table(
     Column("year", Integer, nullable=False),
     Column("category", String(255), nullable=False),
     Column("budget", BigInteger, nullable=False),
+    Index("ix_money_spend_schemas_user_category", "user_uuid", "category"),
+    Index(
+        "uq_money_spend_schemas_user_period_category",
+        "user_uuid",
+        "year",
+        "month",
+        "category",
+        unique=True,
+    ),
 )
 
-blacklist_tokens = Table(
-    "blacklist_tokens",
+schema_auto_copies = Table(
+    "schema_auto_copies",
     meta,
     Column("id", Integer, primary_key=True, autoincrement=True),
-    Column("blacklisted_at", DateTime(timezone=True), nullable=False),
-    Column("user_uuid", UUID(as_uuid=True), nullable=False),
-    Column("access_token", String(255), nullable=False, unique=True),
-    Column("refresh_token", String(255), nullable=False, unique=True),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    Column("updated_at", DateTime(timezone=True), nullable=True, default=None),
+    Column("user_uuid", UUID(as_uuid=True), nullable=False, unique=True),
+    Column("budget_percentage", Integer, nullable=False, default=100),
 )
 
-user_tokens = Table(
-    "user_tokens",
+month_versions = Table(
+    "month_versions",
     meta,
     Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("updated_at", DateTime(timezone=True), nullable=False),
+    Column("user_uuid", UUID(as_uuid=True), nullable=False),
+    Column("month", Integer, nullable=False),
+    Column("year", Integer, nullable=False),
+    Column("version", BigInteger, nullable=False, default=1),
+    Index("uq_month_versions_user_period", "user_uuid", "year", "month", unique=True),
+)
+
+user_sessions = Table(
+    "user_sessions",
+    meta,
+    Column("session_id", UUID(as_uuid=True), primary_key=True),
     Column("created_at", DateTime(timezone=True), nullable=False),
+    Column("updated_at", DateTime(timezone=True), nullable=False),
     Column("user_uuid", UUID(as_uuid=True), nullable=False),
-    Column("access_token", String(255), nullable=False, unique=True),
-    Column("refresh_token", String(255), nullable=False, unique=True),
+    Column("refresh_jti", String(36), nullable=False),
+    Column("expires_at", DateTime(timezone=True), nullable=False),
+    Column("revoked_at", DateTime(timezone=True), nullable=True, default=None),
+    Index("ix_user_sessions_user_uuid", "user_uuid"),
+    Index("ix_user_sessions_expires_at", "expires_at"),
 )
 
 reset_pins = Table(
@@ -86,6 +140,7 @@ reset_pins = Table(
     Column("email", String(255), nullable=True, unique=False, default=None),
     Column("save_to_hit_at", DateTime(timezone=True), nullable=True, default=None),
     Column("blacklisted_at", DateTime(timezone=True), nullable=True, default=None),
+    Index("ix_reset_pins_blacklisted_at", "blacklisted_at"),
 )
 
 
@@ -102,10 +157,54 @@ send_otps = Table(
     Column("save_to_hit_at", DateTime(timezone=True), nullable=True, default=None),
     Column("blacklisted_at", DateTime(timezone=True), nullable=True, default=None),
     Column("hit_tomorrow_at", DateTime(timezone=True), nullable=True, default=None),
+    Index("ix_send_otps_created_at", "created_at"),
+)
+
+
+rate_limits = Table(
+    "rate_limits",
+    meta,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("key", String(255), nullable=False),
+    Column("tokens", Float, nullable=False),
+    Column("updated_at", DateTime(timezone=True), nullable=False),
+    Column("hits", Integer, nullable=False, default=0),
+    Column("window_ends_at", DateTime(timezone=True), nullable=False),
+    Index("uq_rate_limits_key", "key", unique=True),
+    Index("ix_rate_limits_window_ends_at", "window_ends_at"),
 )
 
+email_outbox = Table(
+    "email_outbox",
+    meta,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    Column("updated_at", DateTime(timezone=True), nullable=True, default=None),
+    Column("email_receiver", String(255), nullable=False),
+    Column("email_subject", String(255), nullable=False),
+    Column("email_body", Text, nullable=True),
+    Column("status", String(16), nullable=False, default="pending"),
+    Column("attempts", Integer, nullable=False, default=0),
+    Column("next_attempt_at", DateTime(timezone=True), nullable=False),
+    Column("locked_until", DateTime(timezone=True), nullable=True, default=None),
+    Column("sent_at", DateTime(timezone=True), nullable=True, default=None),
+    Column("last_error", Text, nullable=True, default=None),
+    Index("ix_email_outbox_status_next_attempt", "status", "next_attempt_at"),
+    Index("ix_email_outbox_status_updated_at", "status", "updated_at"),
+)
+
+
+def create_indexes(connection) -> None:
+    for table in meta.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=connection, checkfirst=True)
+
 
 async def async_main():
     engine = database_connection()
     async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS btree_gin"))
         await conn.run_sync(meta.create_all)
+        await run_migrations(connection=conn)
+        await conn.run_sync(create_indexes)
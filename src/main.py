@@ -1,10 +1,24 @@
 from fastapi import FastAPI, status
-from src.auth.routers import health_check
+from src.auth.routers import health_check, metrics
 from src.database.models import async_main
 from src.secret import MIDDLEWARE_SECRET_KEY
 from fastapi.middleware.cors import CORSMiddleware
 from src.database.connection import database_connection
+from src.auth.utils.background.general import (
+    start_background_task,
+    stop_background_tasks,
+)
 from src.auth.utils.general import create_exception_handler
+from src.auth.utils.logging import RequestIdMiddleware
+from src.auth.utils.schema_copy.general import schema_copy_scheduler
+from src.auth.utils.outbox.general import email_outbox_dispatcher
+from src.auth.utils.smtp.general import close_smtp_pool
+from src.auth.utils.notification.general import compile_templates
+from src.auth.utils.rate_limit.general import close_rate_limiter
+from src.auth.utils.ephemeral.general import close_ephemeral_store
+from src.auth.utils.reaper.general import expired_rows_reaper
+from src.auth.utils.sso.general import oidc_metadata_refresher
+from src.auth.utils.http_client.general import open_http_clients, close_http_clients
 from starlette.middleware.sessions import SessionMiddleware
 from fastapi.openapi.models import OAuthFlowPassword, OAuthFlows
 from src.auth.routers.google_sso import sso_authentication, sso_login
@@ -25,6 +39,7 @@ from src.auth.routers.exceptions import (
     EntityDoesNotMatchedError,
     MandatoryInputError,
     EntityAlreadyFilledError,
+    ServiceUnavailableError,
 )
 from src.auth.routers.users_general import (
     get_user,
@@ -38,12 +53,20 @@ from src.auth.routers.monthly_schemas import (
     list_schema,
     delete_category_schema,
     update_category_schema,
+    autocomplete_category,
+    copy_schema,
+    auto_copy_schema,
+    bulk_create_schema,
+    bulk_update_budget,
+    rename_category,
+    delete_category_cascade,
 )
 from src.auth.routers.monthly_spends import (
     create_spend,
     list_spend,
     update_monthly_spend,
     delete_monthly_spend,
+    search_spend,
 )
 from src.auth.routers.users_register import (
     user_create_pin,
@@ -75,10 +98,27 @@ app.openapi_scheme = {
 @app.on_event("startup")
 async def startup():
     await async_main()
+    open_http_clients()
+    compile_templates()
+    start_background_task(
+        name="schema-copy-scheduler", coroutine=schema_copy_scheduler()
+    )
+    start_background_task(
+        name="email-outbox-dispatcher", coroutine=email_outbox_dispatcher()
+    )
+    start_background_task(
+        name="oidc-metadata-refresher", coroutine=oidc_metadata_refresher()
+    )
+    start_background_task(name="expired-rows-reaper", coroutine=expired_rows_reaper())
 
 
 @app.on_event("shutdown")
 async def shutdown():
+    await stop_background_tasks()
+    await close_smtp_pool()
+    await close_http_clients()
+    await close_rate_limiter()
+    await close_ephemeral_store()
     await database_connection().dispose()
 
 
@@ -90,17 +130,27 @@ app.add_middleware(
     allow_headers=["*"],
 )
 app.add_middleware(SessionMiddleware, secret_key=MIDDLEWARE_SECRET_KEY)
+app.add_middleware(RequestIdMiddleware)
 
 # Add api route endpoints here
 app.include_router(health_check.router)
+app.include_router(metrics.router)
 app.include_router(create_schema.router)
 app.include_router(update_category_schema.router)
 app.include_router(delete_category_schema.router)
 app.include_router(list_schema.router)
+app.include_router(autocomplete_category.router)
+app.include_router(copy_schema.router)
+app.include_router(auto_copy_schema.router)
+app.include_router(bulk_create_schema.router)
+app.include_router(bulk_update_budget.router)
+app.include_router(rename_category.router)
+app.include_router(delete_category_cascade.router)
 app.include_router(create_spend.router)
 app.include_router(list_spend.router)
 app.include_router(update_monthly_spend.router)
 app.include_router(delete_monthly_spend.router)
+app.include_router(search_spend.router)
 app.include_router(access_token.router)
 app.include_router(refresh_token.router)
 app.include_router(user_logout.router)
@@ -210,6 +260,14 @@ app.add_exception_handler(
     ),
 )
 
+app.add_exception_handler(
+    exc_class_or_status_code=ServiceUnavailableError,
+    handler=create_exception_handler(
+        status.HTTP_503_SERVICE_UNAVAILABLE,
+        "Service temporarily unavailable.",
+    ),
+)
+
 app.add_exception_handler(
     exc_class_or_status_code=DatabaseError,
     handler=create_exception_handler(
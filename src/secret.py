@@ -22,3 +22,60 @@ GOOGLE_DEFAULT_EMAIL = os.getenv("GOOGLE_DEFAULT_EMAIL")
 GOOGLE_SMTP_SERVER = os.getenv("GOOGLE_SMTP_SERVER")
 GOOGLE_SMTP_PORT = os.getenv("GOOGLE_SMTP_PORT")
 LOCAL_WHATSAPP_API = os.getenv("LOCAL_WHATSAPP_API")
+CATEGORY_INDEX_MAX_USERS = os.getenv("CATEGORY_INDEX_MAX_USERS", "1000")
+SCHEMA_COPY_CHUNK_SIZE = os.getenv("SCHEMA_COPY_CHUNK_SIZE", "500")
+CATEGORY_CASCADE_BATCH_SIZE = os.getenv("CATEGORY_CASCADE_BATCH_SIZE", "1000")
+CLOSED_MONTH_MAX_AGE = os.getenv("CLOSED_MONTH_MAX_AGE", "86400")
+RESPONSE_CACHE_MAX_BYTES = os.getenv("RESPONSE_CACHE_MAX_BYTES", "33554432")
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+EMAIL_OUTBOX_CONCURRENCY = os.getenv("EMAIL_OUTBOX_CONCURRENCY", "4")
+EMAIL_OUTBOX_MAX_ATTEMPTS = os.getenv("EMAIL_OUTBOX_MAX_ATTEMPTS", "5")
+EMAIL_OUTBOX_POLL_INTERVAL = os.getenv("EMAIL_OUTBOX_POLL_INTERVAL", "5")
+EMAIL_OUTBOX_LEASE = os.getenv("EMAIL_OUTBOX_LEASE", "120")
+SMTP_POOL_SIZE = os.getenv("SMTP_POOL_SIZE", "4")
+SMTP_IDLE_TIMEOUT = os.getenv("SMTP_IDLE_TIMEOUT", "60")
+SMTP_TIMEOUT = os.getenv("SMTP_TIMEOUT", "30")
+HTTP_CLIENT_MAX_CONNECTIONS = os.getenv("HTTP_CLIENT_MAX_CONNECTIONS", "20")
+HTTP_CLIENT_MAX_KEEPALIVE = os.getenv("HTTP_CLIENT_MAX_KEEPALIVE", "10")
+HTTP_CLIENT_KEEPALIVE_EXPIRY = os.getenv("HTTP_CLIENT_KEEPALIVE_EXPIRY", "30")
+HTTP_CLIENT_TIMEOUT = os.getenv("HTTP_CLIENT_TIMEOUT", "10")
+HTTP_CLIENT_HTTP2 = os.getenv("HTTP_CLIENT_HTTP2", "false")
+OIDC_METADATA_TTL = os.getenv("OIDC_METADATA_TTL", "3600")
+SMTP_BREAKER_FAILURES = os.getenv("SMTP_BREAKER_FAILURES", "5")
+SMTP_BREAKER_RECOVERY = os.getenv("SMTP_BREAKER_RECOVERY", "30")
+SMTP_SEND_TIMEOUT = os.getenv("SMTP_SEND_TIMEOUT", "15")
+WHATSAPP_BREAKER_FAILURES = os.getenv("WHATSAPP_BREAKER_FAILURES", "5")
+WHATSAPP_BREAKER_RECOVERY = os.getenv("WHATSAPP_BREAKER_RECOVERY", "30")
+WHATSAPP_TIMEOUT = os.getenv("WHATSAPP_TIMEOUT", "5")
+NOTIFICATION_LOCALE = os.getenv("NOTIFICATION_LOCALE", "en")
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory")
+RATE_LIMIT_MAX_KEYS = os.getenv("RATE_LIMIT_MAX_KEYS", "100000")
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+OTP_COOLDOWN = os.getenv("OTP_COOLDOWN", "60")
+OTP_DAILY_LIMIT = os.getenv("OTP_DAILY_LIMIT", "4")
+OTP_DAILY_WINDOW = os.getenv("OTP_DAILY_WINDOW", "86400")
+EPHEMERAL_STORE_BACKEND = os.getenv("EPHEMERAL_STORE_BACKEND", "memory")
+EPHEMERAL_STORE_MAX_KEYS = os.getenv("EPHEMERAL_STORE_MAX_KEYS", "100000")
+OTP_TTL = os.getenv("OTP_TTL", "180")
+RESET_PIN_TTL = os.getenv("RESET_PIN_TTL", "300")
+RESET_PIN_COOLDOWN = os.getenv("RESET_PIN_COOLDOWN", "60")
+REAPER_INTERVAL = os.getenv("REAPER_INTERVAL", "300")
+REAPER_BATCH_SIZE = os.getenv("REAPER_BATCH_SIZE", "1000")
+REAPER_BATCH_PAUSE = os.getenv("REAPER_BATCH_PAUSE", "0.1")
+REAPER_OTP_AUDIT_RETENTION = os.getenv("REAPER_OTP_AUDIT_RETENTION", "7")
+REAPER_EMAIL_OUTBOX_RETENTION = os.getenv("REAPER_EMAIL_OUTBOX_RETENTION", "7")
+OTP_MODE = os.getenv("OTP_MODE", "stored")
+OTP_SECRET_KEY = os.getenv("OTP_SECRET_KEY")
+OTP_STEP = os.getenv("OTP_STEP", "60")
+OTP_VERIFY_ATTEMPTS = os.getenv("OTP_VERIFY_ATTEMPTS", "5")
+OTP_VERIFY_DAILY_LIMIT = os.getenv("OTP_VERIFY_DAILY_LIMIT", "20")
+RESET_PIN_SECRET_KEY = os.getenv("RESET_PIN_SECRET_KEY")
+RESET_LINK_DAILY_LIMIT = os.getenv("RESET_LINK_DAILY_LIMIT", "10")
+LOG_FILE = os.getenv("LOG_FILE", "log_result.txt")
+LOG_QUEUE_SIZE = os.getenv("LOG_QUEUE_SIZE", "10000")
+LOG_ROTATION = os.getenv("LOG_ROTATION", "size")
+LOG_MAX_BYTES = os.getenv("LOG_MAX_BYTES", "10485760")
+LOG_ROTATE_WHEN = os.getenv("LOG_ROTATE_WHEN", "midnight")
+LOG_BACKUP_COUNT = os.getenv("LOG_BACKUP_COUNT", "5")
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text")
+LOG_SAMPLE_RATES = os.getenv("LOG_SAMPLE_RATES", "{}")
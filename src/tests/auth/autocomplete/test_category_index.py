@@ -0,0 +1,39 @@
+from src.auth.utils.autocomplete.general import CategoryIndex
+
+
+def test_suggest_matches_prefix_case_insensitive() -> None:
+    """Should return every category starting with the prefix, ignoring case."""
+    index = CategoryIndex({"Food": 3, "fuel": 1, "Gym": 2, "FOOTBALL": 1})
+
+    assert index.suggest("fo") == ["Food", "FOOTBALL"]
+    assert index.suggest("F") == ["Food", "FOOTBALL", "fuel"]
+    assert index.suggest("x") == []
+
+
+def test_suggest_respects_limit() -> None:
+    """Should stop after `limit` suggestions."""
+    index = CategoryIndex({f"Bill {number}": 1 for number in range(20)})
+
+    assert len(index.suggest("bill", limit=5)) == 5
+
+
+def test_empty_prefix_returns_first_categories() -> None:
+    """Should suggest categories in sorted order for an empty prefix."""
+    index = CategoryIndex({"b": 1, "a": 1, "c": 1})
+
+    assert index.suggest("", limit=2) == ["a", "b"]
+
+
+def test_add_and_remove_keep_counts() -> None:
+    """Should keep a category until its last spend is removed."""
+    index = CategoryIndex({"Food": 1})
+    index.add("Food")
+    index.add("Rent")
+    assert index.suggest("") == ["Food", "Rent"]
+
+    index.remove("Food")
+    assert index.suggest("f") == ["Food"]
+
+    index.remove("Food")
+    index.remove("Unknown")
+    assert index.suggest("") == ["Rent"]
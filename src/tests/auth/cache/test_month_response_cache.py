@@ -0,0 +1,56 @@
+from uuid_extensions import uuid7
+from src.auth.utils.cache.general import MonthResponseCache
+
+
+def test_get_misses_on_version_change() -> None:
+    """Should serve an entry only for the version it was built from."""
+    cache = MonthResponseCache(max_bytes=1024)
+    user_uuid = uuid7()
+    cache.set(user_uuid, 2024, 5, "list-spending", version=1, body=b"[1]")
+
+    assert cache.get(user_uuid, 2024, 5, "list-spending", version=1) == b"[1]"
+    assert cache.get(user_uuid, 2024, 5, "list-spending", version=2) is None
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_invalidate_drops_every_month_endpoint() -> None:
+    """Should drop the month listings and give their bytes back."""
+    cache = MonthResponseCache(max_bytes=1024)
+    user_uuid = uuid7()
+    cache.set(user_uuid, 2024, 5, "list-spending", version=1, body=b"[1]")
+    cache.set(user_uuid, 2024, 5, "list-category", version=1, body=b"[2]")
+    cache.set(user_uuid, 2024, 6, "list-spending", version=1, body=b"[3]")
+
+    cache.invalidate(user_uuid=user_uuid, year=2024, month=5)
+
+    assert cache.get(user_uuid, 2024, 5, "list-spending", version=1) is None
+    assert cache.get(user_uuid, 2024, 5, "list-category", version=1) is None
+    assert cache.get(user_uuid, 2024, 6, "list-spending", version=1) == b"[3]"
+    assert cache.size == 3
+
+
+def test_set_evicts_least_recently_used() -> None:
+    """Should evict the oldest entries once the byte budget is exceeded."""
+    cache = MonthResponseCache(max_bytes=80)
+    user_uuid = uuid7()
+    for month in range(1, 9):
+        cache.set(user_uuid, 2024, month, "list-spending", version=1, body=b"x" * 10)
+    cache.get(user_uuid, 2024, 1, "list-spending", version=1)
+
+    cache.set(user_uuid, 2024, 9, "list-spending", version=1, body=b"x" * 10)
+
+    assert cache.size == 80
+    assert cache.evictions == 1
+    assert cache.get(user_uuid, 2024, 1, "list-spending", version=1) is not None
+    assert cache.get(user_uuid, 2024, 2, "list-spending", version=1) is None
+
+
+def test_set_skips_oversized_body() -> None:
+    """Should not cache a body larger than an eighth of the budget."""
+    cache = MonthResponseCache(max_bytes=80)
+    user_uuid = uuid7()
+    cache.set(user_uuid, 2024, 5, "list-spending", version=1, body=b"x" * 11)
+
+    assert cache.entries == {}
+    assert cache.size == 0
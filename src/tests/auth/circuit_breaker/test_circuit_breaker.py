@@ -0,0 +1,107 @@
+import pytest
+from src.auth.utils.circuit_breaker import general
+from src.tests.auth.fake_clock import FakeClock
+from src.auth.utils.circuit_breaker.general import CircuitBreaker
+from src.auth.routers.exceptions import ServiceUnavailableError
+
+
+async def succeed() -> str:
+    return "sent"
+
+
+async def fail() -> None:
+    raise ConnectionError("channel down")
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(general, "time", clock)
+    return clock
+
+
+async def open_breaker(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.failure_threshold):
+        with pytest.raises(ConnectionError):
+            await breaker.call(fail)
+
+
+@pytest.mark.asyncio
+async def test_opens_after_consecutive_failures(clock: FakeClock) -> None:
+    """Should reject calls at once after `failure_threshold` failures."""
+    breaker = CircuitBreaker(name="test", failure_threshold=3, recovery_timeout=30)
+    await open_breaker(breaker)
+
+    assert breaker.state == "open"
+    with pytest.raises(ServiceUnavailableError):
+        await breaker.call(succeed)
+    assert breaker.total_rejected == 1
+
+
+@pytest.mark.asyncio
+async def test_success_resets_failure_count(clock: FakeClock) -> None:
+    """Should only count consecutive failures."""
+    breaker = CircuitBreaker(name="test", failure_threshold=2)
+    with pytest.raises(ConnectionError):
+        await breaker.call(fail)
+    await breaker.call(succeed)
+    with pytest.raises(ConnectionError):
+        await breaker.call(fail)
+
+    assert breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_half_open_lets_one_probe_through(clock: FakeClock) -> None:
+    """Should allow a single probe after the recovery timeout."""
+    breaker = CircuitBreaker(name="test", failure_threshold=1, recovery_timeout=30)
+    await open_breaker(breaker)
+    clock.advance(30)
+
+    breaker.before_call()
+    assert breaker.state == "half_open"
+    assert breaker.is_open()
+    with pytest.raises(ServiceUnavailableError):
+        breaker.before_call()
+
+
+@pytest.mark.asyncio
+async def test_successful_probe_closes_circuit(clock: FakeClock) -> None:
+    """Should close the circuit when the probe succeeds."""
+    breaker = CircuitBreaker(name="test", failure_threshold=1, recovery_timeout=30)
+    await open_breaker(breaker)
+    clock.advance(30)
+
+    assert await breaker.call(succeed) == "sent"
+    assert breaker.state == "closed"
+    assert not breaker.is_open()
+
+
+@pytest.mark.asyncio
+async def test_failed_probe_opens_circuit_again(clock: FakeClock) -> None:
+    """Should open the circuit for another recovery timeout when the probe fails."""
+    breaker = CircuitBreaker(name="test", failure_threshold=3, recovery_timeout=30)
+    await open_breaker(breaker)
+    clock.advance(30)
+
+    with pytest.raises(ConnectionError):
+        await breaker.call(fail)
+
+    assert breaker.state == "open"
+    assert breaker.retry_after() == 30
+    clock.advance(29)
+    with pytest.raises(ServiceUnavailableError):
+        await breaker.call(succeed)
+
+
+@pytest.mark.asyncio
+async def test_excluded_exception_does_not_count(clock: FakeClock) -> None:
+    """Should treat an excluded exception as a working channel."""
+    breaker = CircuitBreaker(
+        name="test", failure_threshold=1, excluded_exceptions=(ConnectionError,)
+    )
+    with pytest.raises(ConnectionError):
+        await breaker.call(fail)
+
+    assert breaker.state == "closed"
+    assert breaker.failures == 0
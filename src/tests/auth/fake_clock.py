@@ -0,0 +1,17 @@
+class FakeClock:
+    """
+    Stand-in for the `time` module of the code under test, so a test moves
+    time forward with `advance` instead of sleeping.
+    """
+
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
@@ -0,0 +1,51 @@
+from starlette.requests import Request
+from uuid_extensions import uuid7
+from sqlalchemy.dialects import postgresql
+from src.auth.utils.database.general import bump_versions_query
+from src.auth.utils.http_cache.general import etag_matches, month_etag
+
+
+def request_with(if_none_match: str | None) -> Request:
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "headers": headers})
+
+
+def test_month_etag_changes_with_version() -> None:
+    """Should give a stable quoted etag that changes with the month version."""
+    user_uuid = uuid7()
+    etag = month_etag(user_uuid=user_uuid, month=5, year=2024, version=1)
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == month_etag(user_uuid=user_uuid, month=5, year=2024, version=1)
+    assert etag != month_etag(user_uuid=user_uuid, month=5, year=2024, version=2)
+    assert etag != month_etag(user_uuid=user_uuid, month=6, year=2024, version=1)
+    assert etag != month_etag(user_uuid=uuid7(), month=5, year=2024, version=1)
+
+
+def test_etag_matches_weak_list_and_wildcard() -> None:
+    """Should compare If-None-Match weakly against every listed etag."""
+    etag = '"abc"'
+
+    assert etag_matches(request=request_with('"abc"'), etag=etag)
+    assert etag_matches(request=request_with('W/"abc"'), etag=etag)
+    assert etag_matches(request=request_with('"old", W/"abc"'), etag=etag)
+    assert etag_matches(request=request_with("*"), etag=etag)
+    assert not etag_matches(request=request_with('"old"'), etag=etag)
+    assert not etag_matches(request=request_with(""), etag=etag)
+    assert not etag_matches(request=request_with(None), etag=etag)
+
+
+def test_bump_versions_query_upserts_each_month_once() -> None:
+    """Should insert version 1 or increment it, once per distinct month."""
+    user_uuid = uuid7()
+    result = bump_versions_query(
+        keys=[(user_uuid, 5, 2024), (user_uuid, 5, 2024), (user_uuid, 6, 2024)]
+    ).compile(dialect=postgresql.dialect())
+    sql = " ".join(str(result).split())
+
+    assert sql.count("), (") == 1
+    assert "ON CONFLICT (user_uuid, year, month) DO UPDATE SET" in sql
+    assert "version = (month_versions.version +" in sql
+    assert {result.params["version_m0"], result.params["version_m1"]} == {1}
@@ -0,0 +1,83 @@
+import httpx
+import pytest
+from src.auth.utils.http_client.general import HttpClientRegistry
+
+
+class MockRegistry(HttpClientRegistry):
+    """Registry whose transports answer locally and count what they served."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.opened = 0
+        self.served: list[int] = []
+
+    def open(self, name: str) -> httpx.AsyncClient:
+        self.opened += 1
+        generation = self.opened
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.served.append(generation)
+            return httpx.Response(200, json={"generation": generation})
+
+        transport = httpx.MockTransport(handler)
+        client = httpx.AsyncClient(transport=transport)
+        self.transports[name] = transport
+        self.clients[name] = client
+        return client
+
+
+@pytest.mark.asyncio
+async def test_get_reuses_client_per_upstream() -> None:
+    """Should keep one client per upstream until it is closed."""
+    registry = MockRegistry()
+
+    client = registry.get(name="google")
+    assert registry.get(name="google") is client
+    assert registry.get(name="whatsapp") is not client
+    assert registry.opened == 2
+
+    await registry.close()
+    assert registry.clients == {}
+    assert client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_get_reopens_closed_client() -> None:
+    """Should open a new client when the shared one was closed."""
+    registry = MockRegistry()
+    client = registry.get(name="google")
+    await client.aclose()
+
+    assert registry.get(name="google") is not client
+    assert registry.opened == 2
+
+
+@pytest.mark.asyncio
+async def test_shared_transport_survives_per_call_clients() -> None:
+    """Should ignore the close of a per-call client and keep the pool open."""
+    registry = MockRegistry()
+
+    for _ in range(3):
+        async with httpx.AsyncClient(
+            transport=registry.shared_transport(name="google")
+        ) as client:
+            response = await client.get("https://accounts.google.com/")
+            assert response.json() == {"generation": 1}
+
+    assert registry.opened == 1
+    assert not registry.get(name="google").is_closed
+
+
+@pytest.mark.asyncio
+async def test_shared_transport_follows_registry_reopen() -> None:
+    """Should route a long lived holder to the transport opened after a close."""
+    registry = MockRegistry()
+    client = httpx.AsyncClient(transport=registry.shared_transport(name="google"))
+
+    await client.get("https://accounts.google.com/")
+    await registry.close()
+    await client.get("https://accounts.google.com/")
+
+    assert registry.served == [1, 2]
+    await client.aclose()
+    await registry.close()
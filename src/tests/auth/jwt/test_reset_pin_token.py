@@ -0,0 +1,64 @@
+import pytest
+from uuid_extensions import uuid7
+from src.auth.utils.jwt import general
+from src.auth.routers.exceptions import InvalidTokenError
+from src.auth.utils.jwt.general import (
+    create_reset_pin_token,
+    decode_reset_pin_token,
+    verify_reset_pin_nonce,
+)
+
+
+@pytest.mark.asyncio
+async def test_token_round_trip() -> None:
+    """Should decode a fresh token and accept it for the same hashed pin."""
+    user_uuid = uuid7()
+    token = await create_reset_pin_token(user_uuid=user_uuid, hashed_pin="hash-1")
+
+    claims = await decode_reset_pin_token(token=token)
+
+    assert claims["sub"] == str(user_uuid)
+    assert claims["use"] == "reset-pin"
+    await verify_reset_pin_nonce(claims=claims, hashed_pin="hash-1")
+
+
+@pytest.mark.asyncio
+async def test_token_is_rejected_after_pin_change() -> None:
+    """Should reject a token once the pin it was issued for has changed."""
+    token = await create_reset_pin_token(user_uuid=uuid7(), hashed_pin="hash-1")
+    claims = await decode_reset_pin_token(token=token)
+
+    with pytest.raises(InvalidTokenError) as error:
+        await verify_reset_pin_nonce(claims=claims, hashed_pin="hash-2")
+    assert error.value.detail == "Reset pin link already used."
+
+    with pytest.raises(InvalidTokenError):
+        await verify_reset_pin_nonce(claims=claims, hashed_pin=None)
+
+
+@pytest.mark.asyncio
+async def test_expired_token_is_rejected(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Should reject a token past RESET_PIN_TTL."""
+    monkeypatch.setattr(general, "RESET_PIN_TTL", "-10")
+    token = await create_reset_pin_token(user_uuid=uuid7(), hashed_pin="hash-1")
+
+    with pytest.raises(InvalidTokenError) as error:
+        await decode_reset_pin_token(token=token)
+    assert error.value.detail == "Reset pin link is invalid or expired."
+
+
+@pytest.mark.asyncio
+async def test_access_token_is_not_a_reset_token() -> None:
+    """Should reject tokens signed with another key or without the reset use."""
+    access_token = await general.create_access_token(
+        data={"sub": str(uuid7())}, access_token_expires=general.timedelta(minutes=5)
+    )
+    tampered = general.jwt.encode(
+        claims={"sub": str(uuid7()), "use": "access"},
+        key=general.reset_pin_key(),
+        algorithm="HS256",
+    )
+
+    for token in (access_token, tampered, "not-a-token"):
+        with pytest.raises(InvalidTokenError):
+            await decode_reset_pin_token(token=token)
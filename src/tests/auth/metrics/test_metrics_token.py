@@ -0,0 +1,31 @@
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+from src.auth.routers import metrics
+from src.auth.routers.metrics import verify_metrics_token
+from src.auth.routers.exceptions import AuthenticationFailed, EntityDoesNotExistError
+
+
+def bearer(token: str) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+@pytest.mark.asyncio
+async def test_metrics_are_disabled_without_token(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Should hide the endpoint while METRICS_TOKEN is not set."""
+    monkeypatch.setattr(metrics, "METRICS_TOKEN", None)
+
+    with pytest.raises(EntityDoesNotExistError):
+        await verify_metrics_token(credentials=bearer("anything"))
+
+
+@pytest.mark.asyncio
+async def test_metrics_require_matching_token(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Should only accept the configured bearer token."""
+    monkeypatch.setattr(metrics, "METRICS_TOKEN", "metrics-secret")
+
+    for credentials in (None, bearer("wrong")):
+        with pytest.raises(AuthenticationFailed):
+            await verify_metrics_token(credentials=credentials)
+    await verify_metrics_token(credentials=bearer("metrics-secret"))
@@ -0,0 +1,66 @@
+import pytest
+from uuid_extensions import uuid7
+from sqlalchemy import Engine, create_engine
+from src.database.models import money_spends, money_spend_schemas
+from src.auth.utils.database.general import local_time
+
+
+@pytest.fixture
+def schema_database() -> Engine:
+    """
+    In-memory SQLite copy of money_spend_schemas and money_spends, enough
+    to run the plain SELECT builders of the category endpoints against real
+    rows.
+    """
+    engine = create_engine("sqlite://")
+    money_spend_schemas.create(bind=engine)
+    money_spends.create(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+def add_schemas(
+    engine: Engine, user_uuid: uuid7, rows: list[tuple[int, int, str]]
+) -> None:
+    with engine.begin() as connection:
+        connection.execute(
+            money_spend_schemas.insert(),
+            [
+                {
+                    "created_at": local_time(),
+                    "user_uuid": user_uuid,
+                    "month": month,
+                    "year": year,
+                    "category": category,
+                    "budget": 0,
+                }
+                for month, year, category in rows
+            ],
+        )
+
+
+def add_spends(
+    engine: Engine, user_uuid: uuid7, rows: list[tuple[int, int, str]]
+) -> None:
+    with engine.begin() as connection:
+        connection.execute(
+            money_spends.insert(),
+            [
+                {
+                    "created_at": local_time(),
+                    "user_uuid": user_uuid,
+                    "spend_day": 1,
+                    "spend_month": month,
+                    "spend_year": year,
+                    "category": category,
+                    "description": "",
+                    "amount": 0,
+                }
+                for month, year, category in rows
+            ],
+        )
+
+
+def fetch_all(engine: Engine, query) -> list:
+    with engine.connect() as connection:
+        return connection.execute(query).fetchall()
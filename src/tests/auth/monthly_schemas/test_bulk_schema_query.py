@@ -0,0 +1,63 @@
+import pytest
+from pydantic import ValidationError
+from uuid_extensions import uuid7
+from sqlalchemy.dialects import postgresql
+from src.auth.utils.request_format import BulkMoneySpendSchema
+from src.auth.utils.database.general import month_schemas_query
+
+
+def compiled(query) -> tuple[str, dict]:
+    result = query.compile(dialect=postgresql.dialect())
+    return " ".join(str(result).split()), result.params
+
+
+def test_month_schemas_query_inserts_every_category_at_once() -> None:
+    """Should write one row per category in a single multi-row insert."""
+    user_uuid = uuid7()
+    sql, params = compiled(
+        month_schemas_query(
+            user_uuid=user_uuid,
+            month=5,
+            year=2024,
+            categories={"Food": 100, "Rent": 200, "Fuel": 50},
+        )
+    )
+
+    assert sql.startswith("INSERT INTO money_spend_schemas")
+    assert sql.count("), (") == 2
+    assert "ON CONFLICT" not in sql
+    assert [params[f"category_m{row}"] for row in range(3)] == ["Food", "Rent", "Fuel"]
+    assert [params[f"budget_m{row}"] for row in range(3)] == [100, 200, 50]
+    assert {params[f"user_uuid_m{row}"] for row in range(3)} == {user_uuid}
+    assert {params[f"updated_at_m{row}"] for row in range(3)} == {None}
+
+
+def test_month_schemas_query_upserts_budget() -> None:
+    """Should let bulk update replace the budget of saved categories."""
+    query = month_schemas_query(
+        user_uuid=uuid7(), month=5, year=2024, categories={"Food": 100}
+    )
+    query = query.on_conflict_do_update(
+        index_elements=["user_uuid", "year", "month", "category"],
+        set_={"budget": query.excluded.budget},
+    )
+    sql, _ = compiled(query)
+
+    assert (
+        "ON CONFLICT (user_uuid, year, month, category) "
+        "DO UPDATE SET budget = excluded.budget"
+    ) in sql
+
+
+@pytest.mark.parametrize("size", [0, 201])
+def test_bulk_request_size_is_bounded(size: int) -> None:
+    """Should accept between 1 and 200 categories per request."""
+    with pytest.raises(ValidationError):
+        BulkMoneySpendSchema(
+            month=5,
+            year=2024,
+            categories=[
+                {"category": f"Category {number}", "budget": number}
+                for number in range(size)
+            ],
+        )
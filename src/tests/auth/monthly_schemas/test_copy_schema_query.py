@@ -0,0 +1,77 @@
+import pytest
+from datetime import datetime
+from uuid_extensions import uuid7
+from sqlalchemy.dialects import postgresql
+from src.auth.utils.schema_copy.general import (
+    copy_user_schema_query,
+    next_month_start,
+    previous_period,
+)
+
+
+def compiled(query) -> tuple[str, dict]:
+    result = query.compile(dialect=postgresql.dialect())
+    return " ".join(str(result).split()), result.params
+
+
+@pytest.mark.parametrize(
+    "month, year, expected",
+    [(1, 2024, (12, 2023)), (2, 2024, (1, 2024)), (12, 2024, (11, 2024))],
+)
+def test_previous_period(month: int, year: int, expected: tuple[int, int]) -> None:
+    """Should step back one month, across the year boundary."""
+    assert previous_period(month=month, year=year) == expected
+
+
+@pytest.mark.parametrize(
+    "time, expected",
+    [
+        (datetime(2024, 1, 31, 23, 59, 59, 999), datetime(2024, 2, 1)),
+        (datetime(2024, 12, 15, 8, 30), datetime(2025, 1, 1)),
+    ],
+)
+def test_next_month_start(time: datetime, expected: datetime) -> None:
+    """Should return midnight of the first day of the next month."""
+    assert next_month_start(time=time) == expected
+
+
+def test_copy_query_is_one_insert_select() -> None:
+    """Should copy one user's source month in a single statement."""
+    user_uuid = uuid7()
+    sql, params = compiled(
+        copy_user_schema_query(
+            user_uuid=user_uuid,
+            source_month=12,
+            source_year=2023,
+            target_month=1,
+            target_year=2024,
+        )
+    )
+
+    assert sql.startswith("INSERT INTO money_spend_schemas")
+    assert "SELECT" in sql and "VALUES" not in sql
+    assert "ON CONFLICT (user_uuid, year, month, category) DO NOTHING" in sql
+    assert (
+        "RETURNING money_spend_schemas.user_uuid, money_spend_schemas.category" in sql
+    )
+    assert "CASE" not in sql
+    assert {12, 2023, 1, 2024, user_uuid} <= set(params.values())
+
+
+def test_copy_query_scales_and_overrides_budget() -> None:
+    """Should scale budgets by the percentage unless a category is overridden."""
+    sql, params = compiled(
+        copy_user_schema_query(
+            user_uuid=uuid7(),
+            source_month=1,
+            source_year=2024,
+            target_month=2,
+            target_year=2024,
+            budget_percentage=110,
+            budget_overrides={"Food": 500},
+        )
+    )
+
+    assert "CASE money_spend_schemas.category WHEN" in sql
+    assert "ELSE (money_spend_schemas.budget *" in sql
+    assert {"Food", 500, 110, 100} <= set(params.values())
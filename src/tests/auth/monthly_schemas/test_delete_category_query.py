@@ -0,0 +1,84 @@
+import pytest
+from pydantic import ValidationError
+from uuid_extensions import uuid7
+from sqlalchemy import Engine
+from sqlalchemy.dialects import postgresql
+from src.database.models import money_spends, money_spend_schemas
+from src.auth.utils.request_format import DeleteCategoryCascade
+from src.auth.utils.database.general import between_period
+from src.auth.routers.monthly_schemas.delete_category_cascade import (
+    reassign_schemas_query,
+    spend_batch_query,
+)
+from src.tests.auth.monthly_schemas.schema_database import (
+    add_spends,
+    fetch_all,
+    schema_database,  # noqa: F401
+)
+
+
+def spend_period(month: int, year: int, end_month: int, end_year: int):
+    return between_period(
+        year_column=money_spends.c.spend_year,
+        month_column=money_spends.c.spend_month,
+        month=month,
+        year=year,
+        end_month=end_month,
+        end_year=end_year,
+    )
+
+
+def test_spend_batch_is_bounded_to_category_and_period(
+    schema_database: Engine,
+) -> None:
+    """Should pick at most `batch_size` spends of the category inside the period."""
+    user_uuid = uuid7()
+    add_spends(
+        schema_database,
+        user_uuid,
+        [(1, 2024, "Food")] * 3 + [(2, 2024, "Food"), (1, 2024, "Rent")],
+    )
+    add_spends(schema_database, uuid7(), [(1, 2024, "Food")])
+    period = spend_period(month=1, year=2024, end_month=1, end_year=2024)
+
+    batch = fetch_all(
+        schema_database,
+        spend_batch_query(
+            user_uuid=user_uuid, category="Food", spend_period=period, batch_size=2
+        ),
+    )
+    everything = fetch_all(
+        schema_database,
+        spend_batch_query(
+            user_uuid=user_uuid, category="Food", spend_period=period, batch_size=10
+        ),
+    )
+
+    assert len(batch) == 2
+    assert len(everything) == 3
+
+
+def test_reassign_query_creates_missing_target_categories() -> None:
+    """Should copy matched months into the target name with zero budget, once."""
+    result = reassign_schemas_query(
+        schema_filter=money_spend_schemas.c.category == "Food", reassign_to="Meals"
+    ).compile(dialect=postgresql.dialect())
+    sql = " ".join(str(result).split())
+
+    assert sql.startswith("INSERT INTO money_spend_schemas")
+    assert "FROM money_spend_schemas WHERE money_spend_schemas.category =" in sql
+    assert "ON CONFLICT (user_uuid, year, month, category) DO NOTHING" in sql
+    assert "RETURNING money_spend_schemas.month, money_spend_schemas.year" in sql
+    assert {"Food", "Meals", 0} <= set(result.params.values())
+
+
+@pytest.mark.parametrize("reassign_to", ["", "   "])
+def test_blank_reassign_target_is_rejected(reassign_to: str) -> None:
+    """Should not read a blank target as a request to delete the spends."""
+    with pytest.raises(ValidationError):
+        DeleteCategoryCascade(category="Food", reassign_to=reassign_to)
+
+
+def test_reassign_target_is_optional() -> None:
+    """Should delete the spends when no target is given."""
+    assert DeleteCategoryCascade(category="Food").reassign_to is None
@@ -0,0 +1,103 @@
+from uuid_extensions import uuid7
+from sqlalchemy import Engine, select
+from src.database.models import money_spend_schemas
+from src.auth.utils.database.general import between_period
+from src.auth.routers.monthly_schemas.rename_category import rename_conflict_query
+from src.tests.auth.monthly_schemas.schema_database import (
+    add_schemas,
+    fetch_all,
+    schema_database,  # noqa: F401
+)
+
+
+def schema_period(month: int, year: int, end_month: int, end_year: int):
+    return between_period(
+        year_column=money_spend_schemas.c.year,
+        month_column=money_spend_schemas.c.month,
+        month=month,
+        year=year,
+        end_month=end_month,
+        end_year=end_year,
+    )
+
+
+def test_between_period_spans_year_boundary(schema_database: Engine) -> None:
+    """Should include both ends of the period and cross into the next year."""
+    user_uuid = uuid7()
+    add_schemas(
+        schema_database,
+        user_uuid,
+        [(11, 2023, "Food"), (12, 2023, "Food"), (1, 2024, "Food"), (2, 2024, "Food")],
+    )
+
+    rows = fetch_all(
+        schema_database,
+        select(money_spend_schemas.c.month, money_spend_schemas.c.year)
+        .where(schema_period(month=12, year=2023, end_month=1, end_year=2024))
+        .order_by(money_spend_schemas.c.year, money_spend_schemas.c.month),
+    )
+
+    assert rows == [(12, 2023), (1, 2024)]
+
+
+def test_conflict_only_in_months_holding_both_names(schema_database: Engine) -> None:
+    """Should ignore months where only the new name exists."""
+    user_uuid = uuid7()
+    add_schemas(
+        schema_database,
+        user_uuid,
+        [(1, 2024, "Food"), (2, 2024, "Meals"), (3, 2024, "Food")],
+    )
+
+    conflicts = fetch_all(
+        schema_database,
+        rename_conflict_query(
+            user_uuid=user_uuid,
+            category="Food",
+            changed_category_into="Meals",
+            schema_period=schema_period(month=1, year=2024, end_month=3, end_year=2024),
+        ),
+    )
+
+    assert conflicts == []
+
+
+def test_conflict_when_a_month_holds_both_names(schema_database: Engine) -> None:
+    """Should report a month where the rename would duplicate a category."""
+    user_uuid = uuid7()
+    add_schemas(
+        schema_database,
+        user_uuid,
+        [(1, 2024, "Food"), (2, 2024, "Food"), (2, 2024, "Meals")],
+    )
+
+    conflicts = fetch_all(
+        schema_database,
+        rename_conflict_query(
+            user_uuid=user_uuid,
+            category="Food",
+            changed_category_into="Meals",
+            schema_period=schema_period(month=1, year=2024, end_month=3, end_year=2024),
+        ),
+    )
+
+    assert len(conflicts) == 1
+
+
+def test_conflict_ignores_other_users_and_periods(schema_database: Engine) -> None:
+    """Should only look at the caller's months inside the period."""
+    user_uuid = uuid7()
+    add_schemas(schema_database, user_uuid, [(5, 2024, "Food"), (5, 2024, "Meals")])
+    add_schemas(schema_database, uuid7(), [(1, 2024, "Food"), (1, 2024, "Meals")])
+
+    conflicts = fetch_all(
+        schema_database,
+        rename_conflict_query(
+            user_uuid=user_uuid,
+            category="Food",
+            changed_category_into="Meals",
+            schema_period=schema_period(month=1, year=2024, end_month=3, end_year=2024),
+        ),
+    )
+
+    assert conflicts == []
@@ -0,0 +1,36 @@
+import pytest
+from src.auth.routers.exceptions import InvalidOperationError
+from src.auth.routers.monthly_spends.search_spend import (
+    decode_cursor,
+    encode_cursor,
+    escape_like,
+)
+
+
+def test_cursor_round_trip() -> None:
+    """Should decode the position a cursor was encoded from."""
+    cursor = encode_cursor(year=2024, month=12, day=31, id=987654321)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor=cursor) == (2024, 12, 31, 987654321)
+
+
+@pytest.mark.parametrize("id", [1, 12, 123, 1234])
+def test_cursor_round_trip_without_padding(id: int) -> None:
+    """Should restore the base64 padding stripped on encode."""
+    cursor = encode_cursor(year=2024, month=1, day=2, id=id)
+
+    assert decode_cursor(cursor=cursor) == (2024, 1, 2, id)
+
+
+@pytest.mark.parametrize("cursor", ["", "not a cursor", "MjAyNDox", "YTpiOmM6ZA"])
+def test_invalid_cursor_is_rejected(cursor: str) -> None:
+    """Should raise InvalidOperationError for a cursor it did not encode."""
+    with pytest.raises(InvalidOperationError):
+        decode_cursor(cursor=cursor)
+
+
+def test_escape_like_escapes_wildcards() -> None:
+    """Should match LIKE wildcards and the escape character literally."""
+    assert escape_like("50%_off\\") == "50\\%\\_off\\\\"
+    assert escape_like("makan siang") == "makan siang"
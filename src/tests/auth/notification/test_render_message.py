@@ -0,0 +1,60 @@
+import pytest
+from src.auth.utils.notification.general import render_message
+
+
+def test_email_values_are_html_escaped() -> None:
+    """Should escape field values, not the template markup, for email."""
+    message = render_message(
+        name="otp",
+        channel="email",
+        full_name="<script>Tom & Jerry</script>",
+        otp="123456",
+    )
+
+    assert message.subject == "OTP Email Verification."
+    assert "Dear <b>&lt;script&gt;Tom &amp; Jerry&lt;/script&gt;</b>" in message.body
+    assert "<b>123456</b>" in message.body
+
+
+def test_whatsapp_values_are_kept_as_is() -> None:
+    """Should render whatsapp values without escaping."""
+    message = render_message(
+        name="welcome",
+        channel="whatsapp",
+        full_name="Tom & Jerry",
+        phone_number="+628123",
+        pin="123456",
+    )
+
+    assert message.subject is None
+    assert "Dear *Tom & Jerry*" in message.body
+    assert "PIN: *123456*" in message.body
+
+
+def test_email_templates_do_not_need_pin() -> None:
+    """Should render the stored email templates without the PIN."""
+    message = render_message(
+        name="pin_changed", channel="email", full_name="Tom", phone_number="+628123"
+    )
+
+    assert "+628123" in message.body
+
+
+def test_unknown_locale_falls_back_to_default() -> None:
+    """Should use the default locale when the requested one has no templates."""
+    default = render_message(name="otp", channel="whatsapp", otp="123456")
+    fallback = render_message(name="otp", channel="whatsapp", locale="xx", otp="123456")
+
+    assert fallback == default
+
+
+def test_unknown_template_raises() -> None:
+    """Should raise KeyError for a template that does not exist."""
+    with pytest.raises(KeyError):
+        render_message(name="missing", channel="email")
+
+
+def test_missing_value_raises() -> None:
+    """Should raise KeyError when a template field is not given."""
+    with pytest.raises(KeyError):
+        render_message(name="otp", channel="email", full_name="Tom")
@@ -0,0 +1,100 @@
+import pytest
+from uuid_extensions import uuid7
+from src.auth.utils.otp import general
+from src.tests.auth.fake_clock import FakeClock
+from src.auth.utils.rate_limit.general import MemoryRateLimiter
+from src.auth.routers.exceptions import InvalidOperationError
+from src.auth.utils.otp.general import derive_otp, issue_otp, verify_otp
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock(now=6000.0)
+    monkeypatch.setattr(general, "time", clock)
+    monkeypatch.setattr(general, "OTP_MODE", "hmac")
+    monkeypatch.setattr(general, "OTP_SECRET_KEY", "otp-secret")
+    monkeypatch.setattr(general, "OTP_STEP", "60")
+    monkeypatch.setattr(general, "OTP_TTL", "180")
+    monkeypatch.setattr(
+        general,
+        "otp_verify_rate_limiter",
+        MemoryRateLimiter(
+            name="otp-verify", capacity=5, refill=180, limit=20, window=86400
+        ),
+    )
+    return clock
+
+
+def test_derive_otp_is_bound_to_destination_and_step(clock: FakeClock) -> None:
+    """Should derive a six digit code that changes with destination and step."""
+    user_uuid = uuid7()
+    otp = derive_otp(user_uuid, "email", "user@example.com", 100)
+
+    assert len(otp) == 6 and otp.isdigit()
+    assert otp == derive_otp(user_uuid, "email", "user@example.com", 100)
+    assert otp != derive_otp(user_uuid, "email", "other@example.com", 100)
+    assert otp != derive_otp(user_uuid, "email", "user@example.com", 101)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("elapsed", [0, 119, 179])
+async def test_code_is_valid_within_ttl(clock: FakeClock, elapsed: int) -> None:
+    """Should accept a code until OTP_TTL seconds after its step started."""
+    user_uuid = uuid7()
+    otp = await issue_otp(user_uuid, "email", "user@example.com")
+
+    clock.advance(elapsed)
+    await verify_otp(user_uuid, "email", "user@example.com", otp)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("elapsed", [180, 181, 239])
+async def test_code_expires_after_ttl(clock: FakeClock, elapsed: int) -> None:
+    """Should reject a code once OTP_TTL seconds passed since its step started."""
+    user_uuid = uuid7()
+    otp = await issue_otp(user_uuid, "email", "user@example.com")
+
+    clock.advance(elapsed)
+    with pytest.raises(InvalidOperationError):
+        await verify_otp(user_uuid, "email", "user@example.com", otp)
+
+
+@pytest.mark.asyncio
+async def test_code_issued_mid_step_never_outlives_ttl(clock: FakeClock) -> None:
+    """Should count the window from the step start, not from the issue time."""
+    user_uuid = uuid7()
+    clock.advance(30)
+    otp = await issue_otp(user_uuid, "email", "user@example.com")
+
+    clock.advance(149)
+    await verify_otp(user_uuid, "email", "user@example.com", otp)
+
+    clock.advance(1)
+    with pytest.raises(InvalidOperationError):
+        await verify_otp(user_uuid, "email", "user@example.com", otp)
+
+
+@pytest.mark.asyncio
+async def test_code_for_other_destination_is_rejected(clock: FakeClock) -> None:
+    """Should reject a code sent to a previous destination."""
+    user_uuid = uuid7()
+    otp = await issue_otp(user_uuid, "email", "old@example.com")
+
+    with pytest.raises(InvalidOperationError):
+        await verify_otp(user_uuid, "email", "new@example.com", otp)
+
+
+@pytest.mark.asyncio
+async def test_failed_attempts_are_limited(clock: FakeClock) -> None:
+    """Should refuse to check even the right code after too many attempts."""
+    user_uuid = uuid7()
+    otp = await issue_otp(user_uuid, "email", "user@example.com")
+    wrong = str((int(otp) + 1) % 10**6).zfill(6)
+
+    for _ in range(5):
+        with pytest.raises(InvalidOperationError, match="Invalid or expired"):
+            await verify_otp(user_uuid, "email", "user@example.com", wrong)
+
+    with pytest.raises(InvalidOperationError) as error:
+        await verify_otp(user_uuid, "email", "user@example.com", otp)
+    assert error.value.detail.startswith("Should wait")
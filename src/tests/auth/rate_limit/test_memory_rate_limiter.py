@@ -0,0 +1,92 @@
+import pytest
+from src.auth.utils.rate_limit import general
+from src.tests.auth.fake_clock import FakeClock
+from src.auth.utils.rate_limit.general import MemoryRateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(general, "time", clock)
+    return clock
+
+
+def rate_limiter(**kwargs) -> MemoryRateLimiter:
+    settings = {
+        "name": "test",
+        "capacity": 2,
+        "refill": 60,
+        "limit": 4,
+        "window": 86400,
+    }
+    return MemoryRateLimiter(**{**settings, **kwargs})
+
+
+@pytest.mark.asyncio
+async def test_bucket_allows_burst_then_cooldown(clock: FakeClock) -> None:
+    """Should allow `capacity` hits at once and then ask to wait a refill."""
+    limiter = rate_limiter()
+
+    assert (await limiter.hit(key="user")).allowed
+    assert (await limiter.hit(key="user")).allowed
+    decision = await limiter.hit(key="user")
+
+    assert not decision.allowed
+    assert decision.reason == "cooldown"
+    assert decision.retry_after == 60
+    assert limiter.rejected["cooldown"] == 1
+
+
+@pytest.mark.asyncio
+async def test_bucket_refills_over_time(clock: FakeClock) -> None:
+    """Should give one token back every `refill` seconds."""
+    limiter = rate_limiter()
+    await limiter.hit(key="user")
+    await limiter.hit(key="user")
+
+    clock.advance(30)
+    decision = await limiter.hit(key="user")
+    assert not decision.allowed
+    assert decision.retry_after == 30
+
+    clock.advance(30)
+    assert (await limiter.hit(key="user")).allowed
+
+
+@pytest.mark.asyncio
+async def test_keys_are_limited_separately(clock: FakeClock) -> None:
+    """Should keep one bucket per key."""
+    limiter = rate_limiter(capacity=1)
+
+    assert (await limiter.hit(key="first")).allowed
+    assert (await limiter.hit(key="second")).allowed
+    assert not (await limiter.hit(key="first")).allowed
+
+
+@pytest.mark.asyncio
+async def test_daily_cap_until_window_ends(clock: FakeClock) -> None:
+    """Should reject after `limit` hits until the window of the first hit ends."""
+    limiter = rate_limiter()
+    for _ in range(4):
+        assert (await limiter.hit(key="user")).allowed
+        clock.advance(60)
+
+    decision = await limiter.hit(key="user")
+    assert not decision.allowed
+    assert decision.reason == "daily"
+    assert decision.retry_after == 86400 - 4 * 60
+
+    clock.advance(decision.retry_after)
+    assert (await limiter.hit(key="user")).allowed
+
+
+@pytest.mark.asyncio
+async def test_prune_drops_idle_keys(clock: FakeClock) -> None:
+    """Should forget keys whose bucket is full and window has ended."""
+    limiter = rate_limiter(window=60)
+    await limiter.hit(key="idle")
+
+    clock.advance(limiter.capacity * limiter.refill)
+    await limiter.hit(key="active")
+
+    assert list(limiter.states) == ["test:active"]
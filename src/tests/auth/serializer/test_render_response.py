@@ -0,0 +1,30 @@
+import pytest
+from decimal import Decimal
+from pydantic import TypeAdapter
+from uuid_extensions import uuid7
+from datetime import date, datetime, timedelta, timezone
+from src.auth.schema.response import ResponseDefault
+from src.auth.utils.serializer.general import render_response
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        datetime(2024, 1, 2, 3, 4, 5, 123000, tzinfo=timezone.utc),
+        datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=7))),
+        datetime(2024, 1, 2, 3, 4, 5),
+        date(2024, 1, 2),
+        uuid7(),
+        Decimal("12.50"),
+        "Makan siang é",
+    ],
+)
+def test_matches_response_model_output(value) -> None:
+    """Should write the same bytes as the response_model path it replaced."""
+    data = [{"value": value}]
+    expected = TypeAdapter(ResponseDefault).dump_json(
+        ResponseDefault(success=True, message="ok", data=data)
+    )
+
+    assert render_response(success=True, message="ok", data=data) == expected
@@ -0,0 +1,101 @@
+import asyncio
+import pytest
+from email.message import EmailMessage
+from src.auth.utils.smtp.general import SMTPConnectionPool
+from src.tests.auth.smtp.fake_smtp_server import FakeSMTPServer
+
+
+def email_message(receiver: str) -> EmailMessage:
+    message = EmailMessage()
+    message["From"] = "support@example.com"
+    message["To"] = receiver
+    message["Subject"] = "OTP Email Verification."
+    message.set_content("Your verification code is 123456.")
+    return message
+
+
+def smtp_pool(server: FakeSMTPServer, **kwargs) -> SMTPConnectionPool:
+    return SMTPConnectionPool(
+        hostname="127.0.0.1",
+        port=server.port,
+        username="support@example.com",
+        password="app-password",
+        use_tls=False,
+        timeout=5,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_send_message_reuses_authenticated_connection() -> None:
+    """Should login once and send every message over the same connection."""
+    server = await FakeSMTPServer().start()
+    pool = smtp_pool(server=server, size=1)
+    try:
+        for number in range(5):
+            await pool.send_message(message=email_message(f"user{number}@example.com"))
+
+        assert len(server.messages) == 5
+        assert server.connections == 1
+        assert server.logins == 1
+        assert pool.metrics()["sends"] == 5
+        assert pool.metrics()["latency"]["max_ms"] >= 0
+    finally:
+        await pool.close()
+        await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_send_message_bounded_by_pool_size() -> None:
+    """Should never open more connections than the pool size."""
+    server = await FakeSMTPServer().start()
+    pool = smtp_pool(server=server, size=3)
+    try:
+        await asyncio.gather(
+            *[
+                pool.send_message(message=email_message(f"user{number}@example.com"))
+                for number in range(30)
+            ]
+        )
+
+        assert len(server.messages) == 30
+        assert server.connections <= 3
+    finally:
+        await pool.close()
+        await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_send_message_reconnects_after_idle_timeout() -> None:
+    """Should replace a connection that stayed idle longer than idle timeout."""
+    server = await FakeSMTPServer().start()
+    pool = smtp_pool(server=server, size=1, idle_timeout=0.05)
+    try:
+        await pool.send_message(message=email_message("user@example.com"))
+        await asyncio.sleep(0.1)
+        await pool.send_message(message=email_message("user@example.com"))
+
+        assert server.connections == 2
+        assert pool.metrics()["reconnects"] == 1
+    finally:
+        await pool.close()
+        await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_send_message_retries_when_server_dropped_connection() -> None:
+    """Should resend on a fresh connection when the pooled one was closed."""
+    server = await FakeSMTPServer().start()
+    pool = smtp_pool(server=server, size=1)
+    try:
+        await pool.send_message(message=email_message("user@example.com"))
+        server.drop_connections()
+        await asyncio.sleep(0.05)
+        await pool.send_message(message=email_message("user@example.com"))
+
+        assert len(server.messages) == 2
+        assert server.connections == 2
+        assert pool.metrics()["failures"] == 0
+    finally:
+        await pool.close()
+        await server.stop()